@@ -0,0 +1,295 @@
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Every setting with its default, resolved and validated once.
+    Hot code reads these attributes (or copies them onto itself) instead of calling settings.get.
+    """
+
+    # simulation.py
+    max_simulations: int = 1
+    actions_per_day: int = 5
+    days_per_year: int = 30
+    years: int = 50
+    grid_size: int = 100
+
+    # resources
+    wood: str = "wood"
+    stone: str = "stone"
+    food: str = "food"
+
+    # Structure details
+    barn_size: int = 3
+    barn_char: str = "B"
+    mine_size: int = 3
+    mine_char: str = "M"
+    home_size: int = 2
+    home_char: str = "H"
+    farm_size: int = 5
+    farm_char: str = "F"
+    tree_size: int = 1
+    tree_char: str = "*"
+    empty_size: int = 1
+    empty_char: str = " "
+
+    # Construction Details
+    barn_construction_char: str = "b"
+    barn_req_wood: int = 60
+    barn_req_stone: int = 30
+    barn_max_construction_work_count: int = 3
+    barn_max_construction_worker_count: int = 3
+    barn_finished_completion_level: int = 5
+
+    mine_construction_char: str = "m"
+    mine_req_wood: int = 40
+    mine_req_stone: int = 40
+    mine_max_construction_work_count: int = 5
+    mine_max_construction_worker_count: int = 3
+    mine_finished_completion_level: int = 5
+
+    home_construction_char: str = "h"
+    home_req_wood: int = 20
+    home_req_stone: int = 10
+    home_max_construction_work_count: int = 2
+    home_max_construction_worker_count: int = 2
+    home_finished_completion_level: int = 3
+
+    farm_construction_char: str = "f"
+    farm_req_wood: int = 30
+    farm_req_stone: int = 0
+    farm_max_construction_work_count: int = 2
+    farm_max_construction_worker_count: int = 3
+    farm_finished_completion_level: int = 3
+
+    tree_growth_chance: float = 0.01
+
+    # storing
+    barn_food_store: int = 500
+    barn_stone_store: int = 100
+    barn_wood_store: int = 200
+    home_food_store: int = 36
+    backpack_food_store: int = 100
+    backpack_stone_store: int = 50
+    backpack_wood_store: int = 50
+
+    # working
+    farm_yield_var_loc: float = 0.0
+    farm_yield_var_scale: float = 4.0
+    farm_min_yield: float = 25.0
+    farm_max_yield: float = 50.0
+    farm_max_worker_count: int = 3
+    farm_max_work_count: int = 3
+
+    mine_yield_func_loc: float = 3.0
+    mine_yield_func_scale: float = 1.0
+    mine_yield_var_loc: float = 3.0
+    mine_yield_var_scale: float = 0.9
+    mine_max_worker_count: int = 6
+    mine_max_work_count: int = 4
+
+    tree_yield_func_loc: float = 3.0
+    tree_yield_func_scale: float = 1.0
+    tree_yield_var_loc: float = 3.0
+    tree_yield_var_scale: float = 0.9
+    tree_max_worker_count: int = 1
+    tree_max_work_count: int = 2
+
+    # obstacle ratings (0-10) where 0 is impassible
+    home_construction_obstacle_rating: int = 10
+    home_obstacle_rating: int = 0
+    barn_construction_obstacle_rating: int = 10
+    barn_obstacle_rating: int = 0
+    farm_construction_obstacle_rating: int = 3
+    farm_obstacle_rating: int = 5
+    mine_construction_obstacle_rating: int = 0
+    mine_obstacle_rating: int = 0
+    empty_obstacle_rating: int = 1
+    tree_obstacle_rating: int = 10
+
+    # grid_generator.py
+    tree_density: float = 0.4
+    ca_iterations: int = 40
+    town_clearance_radius: int = 15
+    building_buffer: int = 1
+
+    num_house_min: int = 3
+    num_house_max: int = 8
+    num_farm_min: int = 1
+    num_farm_max: int = 3
+    num_barn_min: int = 1
+    num_barn_max: int = 2
+    num_mines_min: int = 1
+    num_mines_max: int = 2
+
+    home_completion_prob: float = 0.8
+    farm_completion_prob: float = 0.8
+    barn_completion_prob: float = 0.8
+    mine_completion_prob: float = 0.8
+
+    # Person values
+    person_health_cap: int = 100
+    person_hunger_cap: int = 100
+    hunger_pref_min: int = 50
+    hunger_pref_max: int = 100
+    hunger_damage_threshold: int = 20
+    hunger_regen_threshold: int = 50
+    person_epsilon: float = 0.05
+    person_age_max: int = 80
+    home_eat_satiate: int = 15
+    barn_eat_satiate: int = 10
+    adult_age: int = 18
+    infertile_age: int = 50
+    initial_spawn_age_min: int = 20
+    initial_spawn_age_max: int = 30
+
+    # disaster values
+    disaster_chance: float = 0.5
+    sick_health_decr: int = -30
+    craving_hunger_decr: int = -30
+
+    # plotter values
+    fig_size: int = 8
+    plot_dir: str = "plots"
+    results_dir: str = "results"
+    grid_plot_max_size: int = 1000
+
+    # misc
+    near: int = 5
+    mean_temp_f: float = 70.0
+    visibility: int = 15
+    vision_engine: str = "shadowcasting"
+    vision_cache_size: int = 10000
+    speed: int = 10
+    memory_expire: int = 50
+
+    # logger.py, log_level is left out to let the mode pick it
+    log_level: str = ""
+    log_module_levels: Dict[str, str] = field(default_factory=dict)
+    log_format: str = "text"
+    log_batch_size: int = 1000
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, Any]) -> "Config":
+        """Build from a settings file's values, missing or empty (None) values get their default."""
+        types = {f.name: f.type for f in fields(cls)}
+        unknown = sorted(set(values) - set(types))
+        if unknown:
+            raise ValueError(f"Unknown settings: {', '.join(unknown)}")
+
+        resolved: Dict[str, Any] = {}
+        for name, value in values.items():
+            if value is None:
+                continue
+            if types[name] is float and type(value) is int:
+                value = float(value)
+            resolved[name] = value
+        return cls(**resolved)
+
+    def __post_init__(self) -> None:
+        problems: List[str] = []
+        for f in fields(self):
+            value = getattr(self, f.name)
+            expected = dict if f.type == Dict[str, str] else f.type
+            if type(value) is not expected:
+                problems.append(f"{f.name} should be of type {expected.__name__}, got {value!r}")
+        if problems:
+            raise ValueError("Invalid settings: " + "; ".join(problems))
+
+        def check(condition: bool, problem: str) -> None:
+            if not condition:
+                problems.append(problem)
+
+        for name in (
+            "max_simulations",
+            "actions_per_day",
+            "days_per_year",
+            "years",
+            "grid_size",
+            "visibility",
+            "speed",
+            "memory_expire",
+            "log_batch_size",
+            "fig_size",
+            "grid_plot_max_size",
+        ):
+            check(getattr(self, name) > 0, f"{name} should be positive")
+        for kind in ("barn", "mine", "home", "farm", "tree", "empty"):
+            check(getattr(self, f"{kind}_size") > 0, f"{kind}_size should be positive")
+        for kind in ("barn", "mine", "home", "farm"):
+            for name in (
+                f"{kind}_max_construction_work_count",
+                f"{kind}_max_construction_worker_count",
+                f"{kind}_finished_completion_level",
+            ):
+                check(getattr(self, name) > 0, f"{name} should be positive")
+            for name in (f"{kind}_req_wood", f"{kind}_req_stone"):
+                check(getattr(self, name) >= 0, f"{name} can't be negative")
+            check(0 <= getattr(self, f"{kind}_completion_prob") <= 1, f"{kind}_completion_prob should be in [0, 1]")
+        for kind in ("farm", "mine", "tree"):
+            for name in (f"{kind}_max_worker_count", f"{kind}_max_work_count"):
+                check(getattr(self, name) > 0, f"{name} should be positive")
+        for kind in ("home", "barn", "farm", "mine"):
+            for name in (f"{kind}_obstacle_rating", f"{kind}_construction_obstacle_rating"):
+                check(0 <= getattr(self, name) <= 10, f"{name} should be in [0, 10]")
+        for name in ("empty_obstacle_rating", "tree_obstacle_rating"):
+            check(0 <= getattr(self, name) <= 10, f"{name} should be in [0, 10]")
+        for name in ("tree_growth_chance", "tree_density", "person_epsilon", "disaster_chance"):
+            check(0 <= getattr(self, name) <= 1, f"{name} should be in [0, 1]")
+        for name in (
+            "ca_iterations",
+            "town_clearance_radius",
+            "building_buffer",
+            "near",
+            "vision_cache_size",
+            "barn_food_store",
+            "barn_stone_store",
+            "barn_wood_store",
+            "home_food_store",
+            "backpack_food_store",
+            "backpack_stone_store",
+            "backpack_wood_store",
+        ):
+            check(getattr(self, name) >= 0, f"{name} can't be negative")
+        for low, high in (
+            ("num_house_min", "num_house_max"),
+            ("num_farm_min", "num_farm_max"),
+            ("num_barn_min", "num_barn_max"),
+            ("num_mines_min", "num_mines_max"),
+            ("hunger_pref_min", "hunger_pref_max"),
+            ("initial_spawn_age_min", "initial_spawn_age_max"),
+            ("farm_min_yield", "farm_max_yield"),
+        ):
+            check(getattr(self, low) <= getattr(self, high), f"{low} can't be more than {high}")
+
+        chars = [self.get_char(kind) for kind in self._char_kinds]
+        for kind, char in zip(self._char_kinds, chars):
+            check(len(char) == 1, f"{kind}_char should be a single character, got {char!r}")
+        check(len(set(chars)) == len(chars), f"every structure needs its own char, got {chars}")
+
+        check(self.vision_engine in ("shadowcasting", "legacy"), "vision_engine should be shadowcasting or legacy")
+        check(self.log_format in ("text", "jsonl"), "log_format should be text or jsonl")
+        log_levels = ("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL")
+        for name, level in {"log_level": self.log_level or "INFO", **self.log_module_levels}.items():
+            check(level.upper() in log_levels, f"unknown log level {level!r} for {name}")
+
+        if problems:
+            raise ValueError("Invalid settings: " + "; ".join(problems))
+
+    _char_kinds = (
+        "barn",
+        "mine",
+        "home",
+        "farm",
+        "tree",
+        "empty",
+        "barn_construction",
+        "mine_construction",
+        "home_construction",
+        "farm_construction",
+    )
+
+    def get_char(self, kind: str) -> str:
+        return getattr(self, f"{kind}_char")
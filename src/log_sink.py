@@ -0,0 +1,107 @@
+import atexit
+import json
+import queue
+import threading
+import traceback
+from typing import IO, Any, ClassVar, Dict, List, Tuple
+
+_flush = object()
+_stop = object()
+
+
+class BatchedSink:
+    """
+    Loguru sink that hands records to a background thread, which writes them to path in batches as JSON lines.
+    Logging never waits on the disk, the thread writes every batch_size records and when flushed or stopped.
+
+    Every call site gets a numeric event code the first time it logs, described once by a line like
+        {"event": 3, "module": "src.simulation.grid.grid", "function": "grow_trees", "line": 412}
+    and every record after that is a short array
+        [event, unix time, level number, message] (with the traceback as a fifth item for exceptions)
+    """
+
+    _open: ClassVar[List["BatchedSink"]] = []
+
+    def __init__(self, path: str, batch_size: int = 1000) -> None:
+        self._path: str = path
+        self._batch_size: int = batch_size
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._events: Dict[Tuple[str, str, int], int] = {}  # (module, function, line) -> event code
+        self._thread: threading.Thread = threading.Thread(target=self._run, name="log-sink", daemon=True)
+        self._thread.start()
+        BatchedSink._open.append(self)
+
+    def __call__(self, message: Any) -> None:
+        record = message.record
+        self._queue.put(
+            (
+                record["name"],
+                record["function"],
+                record["line"],
+                record["time"].timestamp(),
+                record["level"].no,
+                record["message"],
+                record["exception"],
+            )
+        )
+
+    def flush(self) -> None:
+        """Ask the thread to write what it has, without waiting for it."""
+        self._queue.put(_flush)
+
+    def stop(self) -> None:
+        """Write everything that was logged and close the file."""
+        if self in BatchedSink._open:
+            BatchedSink._open.remove(self)
+        if self._thread.is_alive():
+            self._queue.put(_stop)
+            self._thread.join()
+
+    @classmethod
+    def flush_all(cls) -> None:
+        for sink in cls._open:
+            sink.flush()
+
+    @classmethod
+    def stop_all(cls) -> None:
+        for sink in list(cls._open):
+            sink.stop()
+
+    def _run(self) -> None:
+        with open(self._path, "a", encoding="utf-8") as file:
+            batch: List[tuple] = []
+            while True:
+                item = self._queue.get()
+                if item is _flush or item is _stop:
+                    self._write(file, batch)
+                    batch = []
+                    file.flush()
+                    if item is _stop:
+                        return
+                    continue
+                batch.append(item)
+                if len(batch) >= self._batch_size:
+                    self._write(file, batch)
+                    batch = []
+
+    def _write(self, file: IO[str], batch: List[tuple]) -> None:
+        lines: List[str] = []
+        for module, function, line, time, level, message, exception in batch:
+            event = self._events.get((module, function, line))
+            if event is None:
+                event = len(self._events)
+                self._events[(module, function, line)] = event
+                lines.append(
+                    json.dumps(
+                        {"event": event, "module": module, "function": function, "line": line}, separators=(",", ":")
+                    )
+                )
+            record = [event, round(time, 3), level, message]
+            if exception is not None:
+                record.append("".join(traceback.format_exception(exception.type, exception.value, exception.traceback)))
+            lines.append(json.dumps(record, separators=(",", ":"), default=str))
+        if lines:
+            file.write("\n".join(lines) + "\n")
+
+
+atexit.register(BatchedSink.stop_all)
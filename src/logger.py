@@ -1,23 +1,133 @@
 import os
 import sys
+from typing import Any, Dict, Optional
 
-from loguru import logger
+from loguru import logger as _logger
+
+from src.config import Config
+from src.log_sink import BatchedSink
+from src.settings import settings
+
+_levels: Dict[str, int] = {
+    "TRACE": 5,
+    "DEBUG": 10,
+    "INFO": 20,
+    "SUCCESS": 25,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+}
+
+
+class Logger:
+    """
+    Drops records below the level of the module they come from before loguru sees them.
+    Pass the values of a message's {} fields as arguments instead of using an f-string,
+    and the message is only built when the record is kept:
+
+        logger.debug("Moved to {}", location)
+
+    Levels no module wants are replaced by a method that does nothing,
+    so in production a debug call costs the call itself.
+    Anything else (add, remove, opt, ...) goes straight to loguru.
+    """
+
+    def __init__(self) -> None:
+        self._level: int = _levels["TRACE"]
+        self._module_levels: Dict[str, int] = {}  # module name prefix -> lowest level kept
+        self._resolved_levels: Dict[str, int] = {}  # module name -> lowest level kept
+        self.configure("TRACE")
+
+    def configure(self, level: str, module_levels: Optional[Dict[str, str]] = None) -> None:
+        """Keep records at level and above, module_levels overrides it for modules and packages by name."""
+        self._level = _levels[level.upper()]
+        self._module_levels = {module: _levels[value.upper()] for module, value in (module_levels or {}).items()}
+        self._resolved_levels = {}
+
+        lowest = min([self._level, *self._module_levels.values()])
+        for name in ("trace", "debug", "info", "success", "warning", "error", "critical", "exception"):
+            self.__dict__.pop(name, None)
+            if _levels.get(name.upper(), _levels["ERROR"]) < lowest:
+                setattr(self, name, self._discard)
+
+    def get_level(self, module: str) -> int:
+        """The lowest level kept for the module, from its longest matching prefix in the module levels."""
+        level = self._resolved_levels.get(module)
+        if level is None:
+            level = self._level
+            longest = -1
+            for prefix, prefix_level in self._module_levels.items():
+                matches = module == prefix or module.startswith(prefix + ".")
+                if matches and len(prefix) > longest:
+                    level, longest = prefix_level, len(prefix)
+            self._resolved_levels[module] = level
+        return level
+
+    def trace(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log("TRACE", message, args, kwargs)
+
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log("DEBUG", message, args, kwargs)
+
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log("INFO", message, args, kwargs)
+
+    def success(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log("SUCCESS", message, args, kwargs)
+
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log("WARNING", message, args, kwargs)
+
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log("ERROR", message, args, kwargs)
+
+    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log("CRITICAL", message, args, kwargs)
+
+    def exception(self, message: str, *args: Any, **kwargs: Any) -> None:
+        if _levels["ERROR"] >= self.get_level(sys._getframe(1).f_globals.get("__name__", "")):
+            _logger.opt(depth=1, exception=True).error(message, *args, **kwargs)
+
+    def flush(self) -> None:
+        """Have the batched sinks write out what they are holding, without waiting for them."""
+        BatchedSink.flush_all()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(_logger, name)
+
+    def _log(self, level: str, message: str, args: Any, kwargs: Any) -> None:
+        # two frames up is the caller of debug, info, ...
+        if _levels[level] < self.get_level(sys._getframe(2).f_globals.get("__name__", "")):
+            return
+        _logger.opt(depth=2).log(level, message, *args, **kwargs)
+
+    @staticmethod
+    def _discard(message: str, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+logger: Logger = Logger()
 
 
 def setup_logger(mode: str = "dev") -> None:
-    # Create a logs directory if it doesn't exist
-    log_dir: str = "../logs"
+    # Create a logs directory at the root of the repository if it doesn't exist
+    log_dir: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
     os.makedirs(log_dir, exist_ok=True)
 
     # Define log file path
     log_file_path: str = os.path.join(log_dir, "app.log")
 
-    # Remove the default logger
+    # Remove the default logger, and any batched sinks from an earlier setup once they have written everything
     logger.remove()
+    BatchedSink.stop_all()
 
     # Set log level based on mode for console logging
     console_log_level: str = "INFO"  # Log everything except DEBUG to the console
-    file_log_level: str = "DEBUG"  # Log everything to the file (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    # Log everything to the file in dev, production leaves DEBUG out so debug calls cost nothing
+    config: Config = settings.get_config()
+    file_log_level: str = (config.log_level or ("DEBUG" if mode == "dev" else "INFO")).upper()
+    module_log_levels: Dict[str, str] = config.log_module_levels
+    logger.configure(file_log_level, module_log_levels)
 
     # Configure the logger to log to the console (everything except DEBUG)
     logger.add(
@@ -27,13 +137,22 @@ def setup_logger(mode: str = "dev") -> None:
     )
 
     # Configure the logger to log to the file (everything, including DEBUG)
-    logger.add(
-        log_file_path,
-        rotation="5 MB",  # Rotate log file after it reaches 5 MB
-        retention="0 days",  # Delete rotated files immediately after rotation
-        level=file_log_level,  # Log everything to the file
-        format="{time:YYYY-MM-DD at HH:mm:ss} | {level} | {message}",
-    )
+    lowest_log_level = min([file_log_level, *module_log_levels.values()], key=lambda level: _levels[level.upper()])
+    if config.log_format == "jsonl":
+        # written by a background thread in batches, see BatchedSink for the format
+        logger.add(
+            BatchedSink(os.path.join(log_dir, "app.jsonl"), config.log_batch_size),
+            level=lowest_log_level.upper(),
+            format="{message}",
+        )
+    else:
+        logger.add(
+            log_file_path,
+            rotation="5 MB",  # Rotate log file after it reaches 5 MB
+            retention="0 days",  # Delete rotated files immediately after rotation
+            level=lowest_log_level.upper(),
+            format="{time:YYYY-MM-DD at HH:mm:ss} | {level} | {message}",
+        )
 
     # Configure the logger to log ERROR and above to a separate error log file
     logger.add(
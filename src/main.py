@@ -1,38 +1,99 @@
+import argparse
+import os
+import random
 import time
+from typing import List, Optional
+
+import numpy as np
+
 from src.logger import logger, setup_logger
-from src.settings import environment, settings
+from src.settings import settings, settings_dir
+from src.simulation.runner import run_simulations
 from src.simulation.simulation import Simulation
-from src.simulation.visualization.visualizer import Visualizer
+from src.simulation.visualization.results import SimulationResults
+
+
+def get_arguments() -> argparse.Namespace:
+    """Get the environment (e.g., dev, prod) and run mode from command-line arguments."""
+    parser = argparse.ArgumentParser(description="Run the simulation program.")
+    parser.add_argument("--settings", type=str, default="dev", help="Specify the environment (default: dev)")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Only save the results, without loading the plotting libraries (plot them later with src/plot.py)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="How many simulations run at once when there are several (default: one per core, 1 runs them in turn)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Seed of the first simulation, the next ones count up (default: random)"
+    )
+    return parser.parse_args()
 
 
 def main() -> None:
-    setup_logger(environment)
+    arguments = get_arguments()
+    settings.load(arguments.settings)
+    setup_logger(arguments.settings)
     logger.info("Starting the simulation program.")
 
     # Access settings via the globally initialized object
-    max_simulations = settings.get("max_simulations", 1)
+    max_simulations = settings.get_config().max_simulations
+    results_dir = os.path.join(os.path.dirname(settings_dir), settings.get_config().results_dir)
+    first_seed = arguments.seed if arguments.seed is not None else random.SystemRandom().randrange(2**32)
+    seeds = [(first_seed + i) % 2**32 for i in range(max_simulations)]
+    logger.info("Simulations are seeded from {}.", first_seed)
+
+    if max_simulations > 1 and arguments.workers != 1:
+        run_in_parallel(seeds, arguments.workers, results_dir)
+        return
 
     for i in range(max_simulations):
-        logger.info(f"Running simulation {i + 1}")
+        logger.info("Running simulation {}", i + 1)
 
         # Start timing the simulation
         start_time = time.time()
 
         try:
+            random.seed(seeds[i])
+            np.random.seed(seeds[i])
             simulation: Simulation = Simulation()
-            visualizer: Visualizer = simulation.run()
-            visualizer.display_town_slide_show()
-            visualizer.display_simulation_stats()
+            results: SimulationResults = simulation.run()
+            results.save(os.path.join(results_dir, f"simulation_{i + 1}"))
+
+            if not arguments.headless:
+                from src.simulation.visualization.visualizer import Visualizer
+
+                # like the results, every simulation's town snapshots go to a folder of their own
+                plot_dir = os.path.join(settings.get_config().plot_dir, f"simulation_{i + 1}")
+                visualizer: Visualizer = Visualizer(results, plot_dir)
+                visualizer.display_town_slide_show()
+                visualizer.display_simulation_stats()
 
         except Exception as e:
             # Log the exception if something goes wrong
-            logger.error(f"An error occurred during simulation {i + 1}: {e}")
+            logger.error("An error occurred during simulation {}: {}", i + 1, e)
             raise
         finally:
             # End timing the simulation and log the duration
             end_time = time.time()
             simulation_duration = end_time - start_time
-            logger.info(f"Simulation {i + 1} completed in {simulation_duration:.2f} seconds")
+            logger.info("Simulation {} completed in {:.2f} seconds", i + 1, simulation_duration)
+
+
+def run_in_parallel(seeds: List[int], workers: Optional[int], results_dir: str) -> None:
+    """Run a simulation per seed in worker processes, saving their results and a record of each to runs.jsonl."""
+    os.makedirs(results_dir, exist_ok=True)
+    failed = 0
+    with open(os.path.join(results_dir, "runs.jsonl"), "w", encoding="utf-8") as file:
+        for record in run_simulations(settings.get_config(), seeds, workers, results_dir):
+            file.write(record.to_json() + "\n")
+            file.flush()
+            failed += record.is_failed()
+    logger.info("{} of {} simulations completed, plot their results with src/plot.py.", len(seeds) - failed, len(seeds))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,45 @@
+import argparse
+import os
+
+from src.logger import logger, setup_logger
+from src.settings import settings
+from src.simulation.visualization.results import SimulationResults
+from src.simulation.visualization.visualizer import Visualizer
+
+
+def get_arguments() -> argparse.Namespace:
+    """Get the results to plot and how from command-line arguments."""
+    parser = argparse.ArgumentParser(description="Plot the saved results of a simulation.")
+    parser.add_argument("results", type=str, help="The folder a simulation saved its results to")
+    parser.add_argument("--settings", type=str, default="dev", help="Specify the environment (default: dev)")
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Where to write the town snapshots (default: plot_dir/<results folder name>)",
+    )
+    parser.add_argument(
+        "--no-show", action="store_true", help="Only write the town snapshots, without opening any windows"
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    arguments = get_arguments()
+    settings.load(arguments.settings)
+    setup_logger(arguments.settings)
+
+    logger.info("Plotting the results in {}.", arguments.results)
+    output = arguments.output
+    if output is None:
+        output = os.path.join(settings.get_config().plot_dir, os.path.basename(os.path.normpath(arguments.results)))
+    visualizer: Visualizer = Visualizer(SimulationResults.load(arguments.results), output)
+    if arguments.no_show:
+        visualizer.save_town_snapshots()
+    else:
+        visualizer.display_town_slide_show()
+        visualizer.display_simulation_stats()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,47 +1,61 @@
-import argparse
 import os
 import yaml
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
+from src.config import Config
 
-class Settings:
-    def __init__(self, e: str):
-        """Initialize Settings and load environment-specific configurations."""
-        self._settings: Dict[str, Any] = self._load_settings(e)
+# the settings folder at the root of the repository, wherever the program is started from
+settings_dir: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "settings")
+
+
+def load_config(environment: str = "dev") -> Config:
+    """Load and validate the settings in settings/{environment}_settings.yaml."""
+    settings_file = os.path.join(settings_dir, f"{environment}_settings.yaml")
+    if not os.path.isfile(settings_file):
+        raise FileNotFoundError(f"Settings file {settings_file} not found.")
+
+    # Load the YAML file into a dictionary
+    with open(settings_file, "r") as file:
+        s: Dict[str, Any] = yaml.safe_load(file) or {}
 
-    @staticmethod
-    def _load_settings(e: str) -> Dict[str, Any]:
-        """Load settings from the environment-specific yaml file"""
-        settings_file = f"../settings/{e}_settings.yaml"
-        if not os.path.isfile(settings_file):
-            raise FileNotFoundError(f"Settings file {settings_file} not found.")
+    return Config.from_dict(s)
 
-        # Load the YAML file into a dictionary
-        with open(settings_file, "r") as file:
-            s = yaml.safe_load(file)
 
-        return s
+class Settings:
+    """
+    The settings the simulation is running with.
+    Nothing is read at import, the active config is set with use or load,
+    and the first read loads the dev settings file if neither was called.
+    """
+
+    def __init__(self, environment: str = "dev") -> None:
+        self._environment: str = environment
+        self._config: Optional[Config] = None
+
+    def load(self, environment: str) -> None:
+        """Activate the settings in the environment's settings file (e.g., dev, prod)."""
+        self._config = load_config(environment)
+        self._environment = environment
+
+    def use(self, config: Config) -> None:
+        """Activate config, everything created after this reads its settings from it."""
+        self._config = config
+
+    def get_environment(self) -> str:
+        return self._environment
+
+    def get_config(self) -> Config:
+        """Every setting resolved and validated, for code that reads settings often."""
+        if self._config is None:
+            self.load(self._environment)
+        return self._config
 
     def get(self, key: str, default=None):
         """Get a configuration value by key."""
-        value = self._settings.get(key)
+        value = getattr(self.get_config(), key, None)
         if value is None:
             return default
         return value
 
 
-# Helper function to get environment from command line args
-def get_environment() -> str:
-    """Get the environment from command-line arguments (e.g., dev, prod)."""
-    parser = argparse.ArgumentParser(description="Run the simulation program.")
-    parser.add_argument("--settings", type=str, default="dev", help="Specify the environment (default: dev)")
-    args = parser.parse_args()
-    return args.settings
-
-
-# Get the environment and load settings
-environment = get_environment()
-settings = Settings(environment)  # This will initialize the global `settings` object
-
-# Example of accessing a setting
-print(settings.get("max_simulations"))  # Should print: 1 (based on your example YAML)
+settings = Settings()  # This is the global `settings` object
@@ -0,0 +1,84 @@
+from typing import Dict, List
+
+import numpy as np
+
+from src.config import Config
+from src.logger import logger
+
+
+class CellCodec:
+    """
+    Maps the configurable grid characters to small integer codes so the grid
+    can be stored as a uint8 matrix and queried with vectorized operations.
+    """
+
+    EMPTY: int = 0
+    TREE: int = 1
+    HOME: int = 2
+    HOME_CONSTRUCTION: int = 3
+    BARN: int = 4
+    BARN_CONSTRUCTION: int = 5
+    FARM: int = 6
+    FARM_CONSTRUCTION: int = 7
+    MINE: int = 8
+    MINE_CONSTRUCTION: int = 9
+
+    UNKNOWN: int = 10
+
+    # indexed by code, set from the active settings by configure
+    _chars: List[str] = []
+    _char_to_code: Dict[str, int] = {}
+
+    @classmethod
+    def configure(cls, config: Config) -> None:
+        """Use the characters of config, called before a grid is encoded."""
+        cls._chars = [
+            config.empty_char,
+            config.tree_char,
+            config.home_char,
+            config.home_construction_char,
+            config.barn_char,
+            config.barn_construction_char,
+            config.farm_char,
+            config.farm_construction_char,
+            config.mine_char,
+            config.mine_construction_char,
+        ]
+        cls._char_to_code = {char: code for code, char in enumerate(cls._chars)}
+
+    @classmethod
+    def encode(cls, char: str) -> int:
+        """Return the code for a grid character, or UNKNOWN if it is not configured."""
+        return cls._char_to_code.get(char, cls.UNKNOWN)
+
+    @classmethod
+    def decode(cls, code: int) -> str:
+        return cls._chars[code]
+
+    @classmethod
+    def get_chars(cls) -> List[str]:
+        """The character of every code, indexed by code."""
+        return list(cls._chars)
+
+    @classmethod
+    def encode_grid(cls, grid: List[List[str]]) -> np.ndarray:
+        logger.debug("Encoding grid of size {}x{}.", len(grid), len(grid[0]) if grid else 0)
+        return np.array([[cls._char_to_code[char] for char in row] for row in grid], dtype=np.uint8)
+
+    @classmethod
+    def decode_grid(cls, cells: np.ndarray) -> List[List[str]]:
+        logger.debug("Decoding grid of shape {}.", cells.shape)
+        return [[cls._chars[code] for code in row] for row in cells.tolist()]
+
+    @classmethod
+    def get_lookup_table(cls, values: Dict[str, float], default: float = 0, dtype=np.int64) -> np.ndarray:
+        """
+        Build a table indexed by code from a char keyed mapping, so `table[cells]`
+        maps a whole grid in one operation.
+        """
+        table = np.full(len(cls._chars), default, dtype=dtype)
+        for char, value in values.items():
+            code = cls.encode(char)
+            if code != cls.UNKNOWN:
+                table[code] = value
+        return table
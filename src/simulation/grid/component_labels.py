@@ -0,0 +1,136 @@
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+
+from src.logger import logger
+
+
+class ComponentLabels:
+    """
+    Connected components of the walkable cells, 8-connected like the movers' A* with diagonal movement.
+    Every walkable cell gets a label > 0, cells that are not walkable get 0.
+    Two walkable cells are reachable from each other exactly when their labels match.
+    """
+
+    def __init__(self, walkable: np.ndarray) -> None:
+        logger.debug("Labelling walkable components of a {} grid.", walkable.shape)
+        self._height, self._width = walkable.shape
+        self._labels: np.ndarray = self._label(walkable)
+        self._next_label: int = int(self._labels.max(initial=0)) + 1
+        self._cells: Dict[int, np.ndarray] = {}
+        logger.debug("Found {} walkable components.", self._next_label - 1)
+
+    def get_label(self, x: int, y: int) -> int:
+        return self._labels.item(y, x)
+
+    def get_cells(self, label: int) -> np.ndarray:
+        """Flat indices (y * width + x) of every cell with the label."""
+        cells = self._cells.get(label)
+        if cells is None:
+            cells = np.flatnonzero(self._labels == label)
+            self._cells[label] = cells
+        return cells
+
+    def set_walkable(self, x: int, y: int, walkable: bool) -> None:
+        """Update the labels for one cell turning walkable or not, only relabelling a component that may have split."""
+        if (self._labels.item(y, x) > 0) == walkable:
+            return
+        neighbors = self._get_walkable_neighbors(x, y)
+
+        if walkable:
+            # joins every component around it, the lowest label is kept
+            labels = sorted({self._labels.item(ny, nx) for nx, ny in neighbors})
+            if not labels:
+                labels = [self._next_label]
+                self._next_label += 1
+            self._labels[y, x] = labels[0]
+            for label in labels[1:]:
+                self._labels[self._labels == label] = labels[0]
+                self._cells.pop(label, None)
+            self._cells.pop(labels[0], None)
+            logger.debug("Cell ({}, {}) is walkable, joined labels {}.", x, y, labels)
+            return
+
+        label = self._labels.item(y, x)
+        self._labels[y, x] = 0
+        self._cells.pop(label, None)
+        # any path through the cell can go around it instead when its walkable neighbors touch each other
+        if self._are_connected(neighbors):
+            return
+        logger.debug("Cell ({}, {}) is not walkable, relabelling component {}.", x, y, label)
+        ys, xs = np.nonzero(self._labels == label)
+        window = (slice(ys.min(), ys.max() + 1), slice(xs.min(), xs.max() + 1))
+        component = self._labels[window] == label
+        parts = self._label(component)
+        # the first part keeps the label, the others get new ones
+        self._labels[window][component] = np.where(
+            parts[component] == 1, label, parts[component] + self._next_label - 2
+        )
+        self._next_label += int(parts.max()) - 1
+
+    def _get_walkable_neighbors(self, x: int, y: int) -> List[Tuple[int, int]]:
+        return [
+            (nx, ny)
+            for ny in (y - 1, y, y + 1)
+            for nx in (x - 1, x, x + 1)
+            if (nx, ny) != (x, y) and 0 <= nx < self._width and 0 <= ny < self._height and self._labels.item(ny, nx) > 0
+        ]
+
+    @staticmethod
+    def _are_connected(cells: List[Tuple[int, int]]) -> bool:
+        """True if the cells, all around one cell, are 8-connected to each other without going through it."""
+        if not cells:
+            return True
+        reached: Set[Tuple[int, int]] = {cells[0]}
+        stack = [cells[0]]
+        while stack:
+            x, y = stack.pop()
+            for other in cells:
+                if other not in reached and abs(other[0] - x) <= 1 and abs(other[1] - y) <= 1:
+                    reached.add(other)
+                    stack.append(other)
+        return len(reached) == len(cells)
+
+    @staticmethod
+    def _label(walkable: np.ndarray) -> np.ndarray:
+        """
+        Label the components with a union-find over every pair of neighboring walkable cells, run on whole arrays.
+        Components are numbered in the order of their first cell, row by row.
+        """
+        height, width = walkable.shape
+        walkable = walkable.astype(bool)
+        index = np.arange(height * width).reshape(height, width)
+
+        # pairs of walkable neighbors, looking right, down, down right and down left covers every 8-connected pair
+        pairs_a, pairs_b = [], []
+        for a, b in (
+            ((slice(None), slice(None, -1)), (slice(None), slice(1, None))),
+            ((slice(None, -1), slice(None)), (slice(1, None), slice(None))),
+            ((slice(None, -1), slice(None, -1)), (slice(1, None), slice(1, None))),
+            ((slice(None, -1), slice(1, None)), (slice(1, None), slice(None, -1))),
+        ):
+            both = walkable[a] & walkable[b]
+            pairs_a.append(index[a][both])
+            pairs_b.append(index[b][both])
+        a = np.concatenate(pairs_a)
+        b = np.concatenate(pairs_b)
+
+        # hook the higher root of every pair onto the lower one and shortcut, until every pair shares a root
+        parent = np.arange(height * width)
+        while True:
+            root_a, root_b = parent[a], parent[b]
+            differ = root_a != root_b
+            if not differ.any():
+                break
+            np.minimum.at(parent, np.maximum(root_a, root_b)[differ], np.minimum(root_a, root_b)[differ])
+            while True:
+                grandparent = parent[parent]
+                if np.array_equal(grandparent, parent):
+                    break
+                parent = grandparent
+
+        # every root is the lowest index of its component, so sorting the roots numbers them by first cell
+        labels = np.zeros(height * width, dtype=np.int32)
+        cells = walkable.ravel()
+        labels[cells] = np.unique(parent[cells], return_inverse=True)[1] + 1
+        return labels.reshape(height, width)
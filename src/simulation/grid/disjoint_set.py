@@ -5,22 +5,22 @@ from src.logger import logger
 
 class DisjointSet:
     def __init__(self, size: int) -> None:
-        logger.debug(f"Initializing DisjointSet with size {size}.")
+        logger.debug("Initializing DisjointSet with size {}.", size)
         self.parent: List[int] = list(range(size))
         self.rank: List[int] = [0] * size  # Rank is used for balancing
-        logger.debug(f"Parent list initialized: {self.parent}")
-        logger.debug(f"Rank list initialized: {self.rank}")
+        logger.debug("Parent list initialized: {}", self.parent)
+        logger.debug("Rank list initialized: {}", self.rank)
 
     def find(self, x: int) -> int:
-        logger.debug(f"Find operation for element {x}.")
+        logger.debug("Find operation for element {}.", x)
         if self.parent[x] != x:
-            logger.debug(f"Element {x} is not a root. Performing path compression.")
+            logger.debug("Element {} is not a root. Performing path compression.", x)
             self.parent[x] = self.find(self.parent[x])  # Path compression
-        logger.debug(f"Root of element {x} is {self.parent[x]}.")
+        logger.debug("Root of element {} is {}.", x, self.parent[x])
         return self.parent[x]
 
     def union(self, x: int, y: int) -> None:
-        logger.debug(f"Union operation for elements {x} and {y}.")
+        logger.debug("Union operation for elements {} and {}.", x, y)
         rootX = self.find(x)
         rootY = self.find(y)
 
@@ -28,15 +28,19 @@ class DisjointSet:
             # Union by rank: Attach the smaller tree under the larger tree
             if self.rank[rootX] > self.rank[rootY]:
                 self.parent[rootY] = rootX
-                logger.debug(f"Attaching tree with root {rootY} under tree with root {rootX}.")
+                logger.debug("Attaching tree with root {} under tree with root {}.", rootY, rootX)
             elif self.rank[rootX] < self.rank[rootY]:
                 self.parent[rootX] = rootY
-                logger.debug(f"Attaching tree with root {rootX} under tree with root {rootY}.")
+                logger.debug("Attaching tree with root {} under tree with root {}.", rootX, rootY)
             else:
                 self.parent[rootY] = rootX
                 self.rank[rootX] += 1
                 logger.debug(
-                    f"Attaching tree with root {rootY} under tree with root {rootX} and increasing rank of root {rootX} to {self.rank[rootX]}."
+                    "Attaching tree with root {} under tree with root {} and increasing rank of root {} to {}.",
+                    rootY,
+                    rootX,
+                    rootX,
+                    self.rank[rootX],
                 )
         else:
-            logger.debug(f"Elements {x} and {y} are already in the same set. No union performed.")
+            logger.debug("Elements {} and {} are already in the same set. No union performed.", x, y)
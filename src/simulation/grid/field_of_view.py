@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.logger import logger
+from src.settings import settings
+from src.simulation.grid.cell_codec import CellCodec
+from src.simulation.grid.location import Location
+
+if TYPE_CHECKING:
+    from src.simulation.grid.grid import Grid
+
+
+class FieldOfView:
+    """
+    Recursive shadowcasting on the cell code matrix.
+    Barns, homes and mines are seen but hide what is behind them, everything else can be seen through.
+    """
+
+    _opaque_codes: Tuple[int, ...] = (CellCodec.BARN, CellCodec.HOME, CellCodec.MINE)
+
+    # (xx, xy, yx, yy) transforms that map the first octant onto all eight
+    _octants: List[Tuple[int, int, int, int]] = [
+        (1, 0, 0, 1),
+        (0, 1, 1, 0),
+        (0, -1, 1, 0),
+        (-1, 0, 0, 1),
+        (-1, 0, 0, -1),
+        (0, -1, -1, 0),
+        (0, 1, -1, 0),
+        (1, 0, 0, -1),
+    ]
+
+    def __init__(self, grid: Grid, cache_size: Optional[int] = None) -> None:
+        self._grid = grid
+        if cache_size is None:
+            cache_size = settings.get_config().vision_cache_size
+        # (x, y, radius, version of the area in view) -> visible cells, least recently used first
+        self._cache: OrderedDict[Tuple[int, int, int, int], Tuple[np.ndarray, np.ndarray, np.ndarray]] = OrderedDict()
+        self._cache_size: int = cache_size
+        self._cache_counts: Dict[str, int] = {"hits": 0, "misses": 0}
+
+    def compute(self, origin: Location, radius: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Cells visible from origin within radius steps (8-connected), not counting origin itself.
+        Returns the x coordinates, y coordinates and cell codes of the visible cells.
+        The result is cached until a cell within radius of origin changes, treat it as read only.
+        """
+        size = 2 * radius + 1
+        version = self._grid.get_region_version(Location(origin.x - radius, origin.y - radius), size, size)
+        key = (origin.x, origin.y, radius, version)
+        visible = self._cache.get(key)
+        if visible is not None:
+            self._cache_counts["hits"] += 1
+            self._cache.move_to_end(key)
+            return visible
+
+        self._cache_counts["misses"] += 1
+        visible = self._compute(origin, radius)
+        self._cache[key] = visible
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return visible
+
+    def get_cache_counts(self) -> Dict[str, int]:
+        return self._cache_counts
+
+    def flush(self) -> None:
+        """Reset the hit and miss counters."""
+        for count in self._cache_counts:
+            self._cache_counts[count] = 0
+
+    def _compute(self, origin: Location, radius: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        logger.debug("Computing field of view from {} with radius {}.", origin, radius)
+        size = 2 * radius + 1
+
+        # local window centered on origin, cells outside the grid are marked UNKNOWN
+        window = np.full((size, size), CellCodec.UNKNOWN, dtype=np.uint8)
+        left, top = origin.x - radius, origin.y - radius
+        region = self._grid.get_region(Location(left, top), size, size)
+        region_left, region_top = max(-left, 0), max(-top, 0)
+        window[region_top : region_top + region.shape[0], region_left : region_left + region.shape[1]] = region
+
+        opaque: List[List[bool]] = np.isin(window, self._opaque_codes).tolist()
+        visible: List[List[bool]] = [[False] * size for _ in range(size)]
+        for xx, xy, yx, yy in self._octants:
+            self._cast_light(opaque, visible, radius, 1, 1.0, 0.0, xx, xy, yx, yy)
+
+        visible_mask = np.array(visible) & (window != CellCodec.UNKNOWN)
+        visible_mask[radius, radius] = False
+        ys, xs = np.nonzero(visible_mask)
+        codes = window[ys, xs]
+        logger.debug("{} cells visible from {}.", len(codes), origin)
+        return xs + left, ys + top, codes
+
+    def _cast_light(
+        self,
+        opaque: List[List[bool]],
+        visible: List[List[bool]],
+        radius: int,
+        row: int,
+        start: float,
+        end: float,
+        xx: int,
+        xy: int,
+        yx: int,
+        yy: int,
+    ) -> None:
+        if start < end:
+            return
+        new_start = start
+        for distance in range(row, radius + 1):
+            dx, dy = -distance - 1, -distance
+            blocked = False
+            while dx <= 0:
+                dx += 1
+                # slopes of the cell's left and right edges as seen from the origin
+                left_slope, right_slope = (dx - 0.5) / (dy + 0.5), (dx + 0.5) / (dy - 0.5)
+                if start < right_slope:
+                    continue
+                if end > left_slope:
+                    break
+
+                x, y = radius + dx * xx + dy * xy, radius + dx * yx + dy * yy
+                visible[y][x] = True
+
+                if blocked:
+                    if opaque[y][x]:
+                        new_start = right_slope
+                        continue
+                    blocked = False
+                    start = new_start
+                elif opaque[y][x] and distance < radius:
+                    # scan the part of the next rows that this cell does not hide
+                    blocked = True
+                    self._cast_light(opaque, visible, radius, distance + 1, start, left_slope, xx, xy, yx, yy)
+                    new_start = right_slope
+            if blocked:
+                break
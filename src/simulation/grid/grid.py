@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import heapq
 import random
-from copy import deepcopy
-from typing import TYPE_CHECKING, Dict, List, Type
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Type
+
+import numpy as np
+from pathfinding.core.grid import Grid as PathFindingGrid
 
 from src.logger import logger
 from src.settings import settings
+from src.simulation.grid.cell_codec import CellCodec
+from src.simulation.grid.component_labels import ComponentLabels
+from src.simulation.grid.field_of_view import FieldOfView
 from src.simulation.grid.grid_disaster_generator import GridDisasterGenerator
 from src.simulation.grid.grid_generator import GridGenerator
 from src.simulation.grid.location import Location
@@ -13,8 +19,11 @@ from src.simulation.grid.structure.structure import Structure
 from src.simulation.grid.structure.structure_factory import StructureFactory
 from src.simulation.grid.structure.structure_type import StructureType
 from src.simulation.grid.structure_generator import StructureGenerator
+from src.simulation.grid.structure_registry import StructureRegistry
+from src.simulation.grid.summed_area_table import SummedAreaTable
 from src.simulation.grid.temperature import get_temperature_for_day
 from src.simulation.grid.structure.work.work import Work
+from src.simulation.grid.structure.work.construction.construction import Construction
 from src.simulation.grid.structure.store.barn import Barn
 from src.simulation.grid.structure.store.home import Home
 from src.simulation.grid.structure.work.farm import Farm
@@ -22,46 +31,71 @@ from src.simulation.grid.structure.work.mine import Mine
 from src.simulation.grid.structure.work.tree import Tree
 
 if TYPE_CHECKING:
+    from src.config import Config
     from src.simulation.simulation import Simulation
 
 
 class Grid:
-    _char_to_num: Dict[str, int] = {
-        settings.get("home_construction_char", "h"): settings.get("home_construction_obstacle_rating", 10),
-        settings.get("home_char", "H"): settings.get("home_obstacle_rating", 0),
-        settings.get("barn_construction_char", "b"): settings.get("barn_construction_obstacle_rating", 10),
-        settings.get("barn_char", "B"): settings.get("barn_obstacle_rating", 0),
-        settings.get("farm_construction_char", "f"): settings.get("farm_construction_obstacle_rating", 3),
-        settings.get("farm_char", "F"): settings.get("farm_obstacle_rating", 5),
-        settings.get("mine_construction_char", "m"): settings.get("mine_construction_obstacle_rating", 0),
-        settings.get("mine_char", "M"): settings.get("mine_obstacle_rating", 0),
-        settings.get("empty_char", " "): settings.get("empty_obstacle_rating", 1),
-        settings.get("tree_char", "*"): settings.get("tree_obstacle_rating", 10),
-    }
-
-    _building_types = "".join(
-        [
-            settings.get("home_construction_char", "h"),
-            settings.get("home_char", "H"),
-            settings.get("barn_construction_char", "b"),
-            settings.get("barn_char", "B"),
-            settings.get("farm_construction_char", "f"),
-            settings.get("farm_char", "F"),
-            settings.get("mine_construction_char", "m"),
-            settings.get("mine_char", "M"),
-        ]
-    )
+    # (dy, dx) of the 8 neighbors, in the order get_empty_spots_near_town lists the spots around a building
+    _directions: List[Tuple[int, int]] = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
 
     def __init__(self, simulation: Simulation, size: int) -> None:
-        logger.debug(f"Initializing simulation with grid size {size}.")
+        logger.debug("Initializing simulation with grid size {}.", size)
 
         self._simulation: Simulation = simulation
         self._width: int = size
         self._height: int = size
 
+        config: Config = settings.get_config()
+        self._char_to_num: Dict[str, int] = {
+            config.home_construction_char: config.home_construction_obstacle_rating,
+            config.home_char: config.home_obstacle_rating,
+            config.barn_construction_char: config.barn_construction_obstacle_rating,
+            config.barn_char: config.barn_obstacle_rating,
+            config.farm_construction_char: config.farm_construction_obstacle_rating,
+            config.farm_char: config.farm_obstacle_rating,
+            config.mine_construction_char: config.mine_construction_obstacle_rating,
+            config.mine_char: config.mine_obstacle_rating,
+            config.empty_char: config.empty_obstacle_rating,
+            config.tree_char: config.tree_obstacle_rating,
+        }
+        self._building_types: str = "".join(
+            [
+                config.home_construction_char,
+                config.home_char,
+                config.barn_construction_char,
+                config.barn_char,
+                config.farm_construction_char,
+                config.farm_char,
+                config.mine_construction_char,
+                config.mine_char,
+            ]
+        )
+        CellCodec.configure(config)
+
         grid_generator: GridGenerator = GridGenerator(size)
         logger.debug("Generating grid using GridGenerator.")
-        self._grid: List[List[str]] = grid_generator.generate()
+        self._grid: List[List[str]] = grid_generator.generate()  # kept in sync with _cells for get_grid
+        self._cells: np.ndarray = CellCodec.encode_grid(self._grid)
+        self._ratings: np.ndarray = CellCodec.get_lookup_table(self._char_to_num)  # obstacle rating by code
+
+        # summed area tables per set of codes, built on first query and kept up to date by set_char
+        self._area_tables: Dict[Tuple[int, ...], SummedAreaTable] = {}
+
+        # reachability of walkable cells, built on first query and kept up to date by set_char
+        self._component_labels: Optional[ComponentLabels] = None
+
+        # set_char stamps each cell with a running write count, so planned paths and cached views of an area
+        # can tell when any cell in it has changed
+        self._write_count: int = 0
+        self._versions: np.ndarray = np.zeros((size, size), dtype=np.int64)
+
+        # top left corner, as y * width + x, of the structure covering each cell, -1 where there is none
+        self._owners: np.ndarray = np.full((size, size), -1, dtype=np.int64)
+
+        # shared by every mover, kept in sync with the grid by set_char
+        self._path_finding_grid: PathFindingGrid = PathFindingGrid(matrix=self.get_path_finding_matrix())
+        logger.debug("Initialized shared path finding grid.")
 
         self._disaster_generator: GridDisasterGenerator = GridDisasterGenerator(self)
         logger.debug("Initialized disaster generator.")
@@ -71,359 +105,487 @@ class Grid:
 
         structure_generator: StructureGenerator = StructureGenerator(self, self._structure_factory)
         logger.debug("Generating structures using StructureGenerator.")
-        self._structures: Dict[Location, Structure] = (
+        self._structures: StructureRegistry = StructureRegistry(
             structure_generator.find_structures()
         )  # stores the top left corner of every structure
 
+        self._field_of_view: FieldOfView = FieldOfView(self)
+
         self._day: int = 0
         self._temp: float = 0
-        logger.debug(f"Simulation initialized with {len(self._structures)} structures.")
+        logger.debug("Simulation initialized with {} structures.", len(self._structures))
 
     def get_time(self) -> int:
         logger.debug("Retrieving simulation time.")
         time = self._simulation.get_time()
-        logger.debug(f"Simulation time: {time}")
+        logger.debug("Simulation time: {}", time)
         return time
 
     def get_temperature_for_day(self) -> float:
-        logger.debug(f"Retrieving temperature for day {self._day}.")
+        logger.debug("Retrieving temperature for day {}.", self._day)
         other_day = self._simulation.get_day()
         if other_day != self._day:
-            logger.debug(f"Day has changed from {self._day} to {other_day}. Updating temperature.")
+            logger.debug("Day has changed from {} to {}. Updating temperature.", self._day, other_day)
             self._day = other_day
-            self._temp = get_temperature_for_day(self._day)
+            self._temp = get_temperature_for_day(self._day, settings.get_config().mean_temp_f)
         else:
-            logger.debug(f"Temperature for day {self._day} already calculated: {self._temp}.")
+            logger.debug("Temperature for day {} already calculated: {}.", self._day, self._temp)
         return self._temp
 
-    def generate_disasters(self, chance: float = settings.get("disaster_chance", 0.50)) -> None:
-        logger.debug(f"Generating disasters with a chance of {chance}.")
+    def generate_disasters(self, chance: Optional[float] = None) -> None:
+        if chance is None:
+            chance = settings.get_config().disaster_chance
+        logger.debug("Generating disasters with a chance of {}.", chance)
         self._disaster_generator.generate(chance)
-        logger.info(f"Disasters generated with a chance of {chance}.")
+        logger.info("Disasters generated with a chance of {}.", chance)
 
     def get_grid(self) -> List[List[str]]:
+        """Character view of the grid. Only read from it, cells are changed with set_char."""
         logger.debug("Retrieving the grid.")
         return self._grid
 
+    def get_cells(self) -> np.ndarray:
+        """Read only uint8 matrix of CellCodec codes, indexed [y, x]."""
+        logger.debug("Retrieving the cell codes.")
+        cells = self._cells.view()
+        cells.flags.writeable = False
+        return cells
+
+    def get_mask(self, *codes: int) -> np.ndarray:
+        """Boolean matrix, indexed [y, x], that is True where the cell has one of the given codes."""
+        logger.debug("Retrieving mask for codes {}.", codes)
+        return np.isin(self._cells, codes)
+
+    def get_region(self, location: Location, width: int, height: int) -> np.ndarray:
+        """Read only slice of the cell codes with its top left corner at location, clipped to the grid."""
+        logger.debug("Retrieving {}x{} region at {}.", width, height, location)
+        x0, y0 = max(location.x, 0), max(location.y, 0)
+        return self.get_cells()[y0 : max(location.y + height, 0), x0 : max(location.x + width, 0)]
+
+    def set_char(self, location: Location, char: str) -> None:
+        logger.debug("Setting location {} to character '{}'.", location, char)
+        walkable = self._char_to_num[char] > 0
+        if (
+            self._component_labels is not None
+            and (self._char_to_num[self._grid[location.y][location.x]] > 0) != walkable
+        ):
+            self._component_labels.set_walkable(location.x, location.y, walkable)
+        self._grid[location.y][location.x] = char
+        old_code, new_code = self._cells.item(location.y, location.x), CellCodec.encode(char)
+        self._cells[location.y, location.x] = new_code
+        for codes, table in self._area_tables.items():
+            if (old_code in codes) != (new_code in codes):
+                table.set(location.x, location.y, new_code in codes)
+        self._write_count += 1
+        self._versions[location.y, location.x] = self._write_count
+        self._update_path_finding_node(location)
+
+    def get_version(self, location: Location) -> int:
+        logger.debug("Retrieving version of location {}.", location)
+        return self._versions.item(location.y, location.x)
+
+    def get_region_version(self, location: Location, width: int, height: int) -> int:
+        """Changes whenever a cell in the rectangle (clipped to the grid) with its top left corner at location changes."""
+        x0, y0 = max(location.x, 0), max(location.y, 0)
+        region = self._versions[y0 : max(location.y + height, 0), x0 : max(location.x + width, 0)]
+        return int(region.max(initial=0))
+
+    def get_field_of_view(self) -> FieldOfView:
+        """Shared by everyone's vision so views from the same spot are computed once."""
+        return self._field_of_view
+
+    def get_path_finding_grid(self) -> PathFindingGrid:
+        logger.debug("Retrieving the shared path finding grid.")
+        return self._path_finding_grid
+
+    def _update_path_finding_node(self, location: Location) -> None:
+        rating: int = self._char_to_num[self._grid[location.y][location.x]]
+        logger.debug("Updating path finding node at {} to rating {}.", location, rating)
+        # invert coordinates for the pathfinding library
+        if rating > 0:
+            self._path_finding_grid.update_node(location.y, location.x, weight=rating, walkable=True)
+        else:
+            self._path_finding_grid.update_node(location.y, location.x, walkable=False)
+
+    def count_in_area(self, location: Location, width: int, height: int, *codes: int) -> int:
+        """Number of cells with one of the given codes in the rectangle with its top left corner at location."""
+        logger.debug("Counting cells with codes {} in {}x{} area at {}.", codes, width, height, location)
+        table = self._area_tables.get(codes)
+        if table is None:
+            table = SummedAreaTable(self.get_mask(*codes))
+            self._area_tables[codes] = table
+        return table.count(location.x, location.y, width, height)
+
+    def is_area_free(self, location: Location, width: int, height: int) -> bool:
+        """True if the rectangle is inside the grid and holds no building or construction."""
+        logger.debug("Checking if {}x{} area at {} is free.", width, height, location)
+        if not self.is_in_bounds(location) or not self.is_in_bounds(
+            Location(location.x + width - 1, location.y + height - 1)
+        ):
+            return False
+        building_codes = tuple(CellCodec.encode(char) for char in self._building_types)
+        return self.count_in_area(location, width, height, *building_codes) == 0
+
+    def can_reach(self, start: Location, end: Location) -> bool:
+        """True if a mover standing at start can find a path to end."""
+        logger.debug("Checking if {} can be reached from {}.", end, start)
+        if not self.is_in_bounds(start) or not self.is_in_bounds(end):
+            return False
+        labels = self._get_component_labels()
+        end_label = labels.get_label(end.x, end.y)
+        return end_label > 0 and end_label in self._get_start_labels(start)
+
+    def get_random_reachable_location(self, start: Location) -> Optional[Location]:
+        """A random walkable location in the same component as start, None if nothing is reachable."""
+        logger.debug("Picking a random location reachable from {}.", start)
+        if not self.is_in_bounds(start):
+            return None
+        start_labels = sorted(self._get_start_labels(start))
+        if not start_labels:
+            logger.warning("No reachable locations from {}.", start)
+            return None
+        labels = self._get_component_labels()
+        cells = np.concatenate([labels.get_cells(label) for label in start_labels])
+        y, x = divmod(int(cells[random.randrange(len(cells))]), self._width)
+        return Location(x, y)
+
+    def _get_start_labels(self, start: Location) -> Set[int]:
+        # a mover standing on a cell that is not walkable can still step onto its walkable neighbors
+        labels = self._get_component_labels()
+        label = labels.get_label(start.x, start.y)
+        if label > 0:
+            return {label}
+        neighbor_labels = {
+            labels.get_label(neighbor.x, neighbor.y)
+            for neighbor in start.get_neighbors()
+            if self.is_in_bounds(neighbor)
+        }
+        neighbor_labels.discard(0)
+        return neighbor_labels
+
+    def _get_component_labels(self) -> ComponentLabels:
+        if self._component_labels is None:
+            logger.debug("Labelling walkable components.")
+            self._component_labels = ComponentLabels(self._ratings[self._cells] > 0)
+        return self._component_labels
+
     def get_buildings(self) -> Dict[Location, Structure]:
         logger.debug("Retrieving buildings (excluding trees).")
-        buildings = {
-            location: structure for location, structure in self._structures.items() if not isinstance(structure, Tree)
-        }
-        logger.debug(f"Found {len(buildings)} buildings.")
+        buildings = dict(self._structures.get_buildings())
+        logger.debug("Found {} buildings.", len(buildings))
         return buildings
 
     def get_structure(self, location: Location) -> Structure:
-        logger.debug(f"Retrieving structure at location {location}.")
+        logger.debug("Retrieving structure at location {}.", location)
         structure = self._structures.get(location)
         if structure:
-            logger.debug(f"Structure at {location} found: {structure}.")
+            logger.debug("Structure at {} found: {}.", location, structure)
         else:
-            logger.warning(f"Structure at {location} not found.")
+            logger.warning("Structure at {} not found.", location)
         return structure
 
     def get_structure_locations(self, structure_type: Type[Structure]) -> List[Location]:
-        logger.debug(f"Retrieving locations of structures of type {structure_type}.")
-        locations = [
-            location for location, building in self._structures.items() if isinstance(building, structure_type)
-        ]
-        logger.debug(f"Found {len(locations)} locations for {structure_type}.")
+        logger.debug("Retrieving locations of structures of type {}.", structure_type)
+        locations = list(self._structures.get_by_type(structure_type).keys())
+        logger.debug("Found {} locations for {}.", len(locations), structure_type)
         return locations
 
     def get_structures(self, structure_type: Type[Structure]) -> List[Structure]:
-        logger.debug(f"Retrieving structures of type {structure_type}.")
-        locations = self.get_structure_locations(structure_type)
-        structures = [self.get_structure(location) for location in locations]
-        logger.debug(f"Found {len(structures)} structures of type {structure_type}.")
+        logger.debug("Retrieving structures of type {}.", structure_type)
+        structures = list(self._structures.get_by_type(structure_type).values())
+        logger.debug("Found {} structures of type {}.", len(structures), structure_type)
         return structures
 
     def get_structure_count(self, structure_type: Type[Structure]) -> int:
-        logger.debug(f"Counting structures of type {structure_type}.")
-        count = sum(1 for structure in self._structures.values() if isinstance(structure, structure_type))
-        logger.debug(f"Found {count} structures of type {structure_type}.")
+        logger.debug("Counting structures of type {}.", structure_type)
+        count = len(self._structures.get_by_type(structure_type))
+        logger.debug("Found {} structures of type {}.", count, structure_type)
         return count
 
-    def find_top_left_corner(self, where: Location) -> None:
-        logger.debug(f"Finding top-left corner starting from {where}.")
-
-        while not self.is_empty(where) and self.is_in_bounds(Location(where.x - 1, where.y)):
-            where.x -= 1
-            logger.debug(f"Moved left to {where}.")
-        if self.is_empty(where):
-            where.x += 1
-        logger.debug(f"Adjusted x-coordinate to {where.x}.")
-
-        while not self.is_empty(where) and self.is_in_bounds(Location(where.x, where.y - 1)):
-            where.y -= 1
-            logger.debug(f"Moved up to {where}.")
-        if self.is_empty(where):
-            where.y += 1
-        logger.debug(f"Adjusted y-coordinate to {where.y}. Top-left corner found at {where}.")
+    def get_owner(self, location: Location) -> Optional[Location]:
+        """Top left corner of the structure covering location, None if no structure covers it."""
+        owner = self._owners.item(location.y, location.x)
+        if owner < 0:
+            return None
+        y, x = divmod(owner, self._width)
+        return Location(x, y)
+
+    def set_owner(self, location: Location, width: int, height: int, owner: Optional[Location]) -> None:
+        """Mark the width x height area at location as covered by the structure at owner, or by nothing."""
+        logger.debug("Setting owner of {}x{} area at {} to {}.", width, height, location, owner)
+        x0, y0 = max(location.x, 0), max(location.y, 0)
+        area = self._owners[y0 : max(location.y + height, 0), x0 : max(location.x + width, 0)]
+        area[...] = -1 if owner is None else owner.y * self._width + owner.x
 
     def remove(self, structure: Structure, deconstruct: bool = False) -> None:
-        logger.debug(f"Removing structure at {structure.get_location()}. Deconstruct: {deconstruct}")
+        logger.debug("Removing structure at {}. Deconstruct: {}", structure.get_location(), deconstruct)
 
         location = structure.get_location()
 
         if location in self._structures:
-            logger.debug(f"Structure at {location} found. Removing.")
-            del self._structures[location]
+            logger.debug("Structure at {} found. Removing.", location)
+            self._structures.remove(location)
         else:
-            logger.warning(f"Structure at {location} not found in structures.")
+            logger.warning("Structure at {} not found in structures.", location)
 
         if isinstance(structure, Home):
-            logger.debug(f"Removing owner from home at {location}.")
+            logger.debug("Removing owner from home at {}.", location)
             structure.remove_owner()
 
-        logger.debug(f"Calling remove method on structure at {location}.")
+        logger.debug("Calling remove method on structure at {}.", location)
         structure.remove()
 
         # Ensure the structure is removed once more, just in case
         if location in self._structures:
-            logger.debug(f"Structure at {location} found again. Removing.")
-            del self._structures[location]
+            logger.debug("Structure at {} found again. Removing.", location)
+            self._structures.remove(location)
 
         if deconstruct:
-            logger.debug(f"Deconstructing structure at {location}.")
+            logger.debug("Deconstructing structure at {}.", location)
             self._deconstruct_building(structure)
 
     def _deconstruct_building(self, building: Structure) -> None:
-        logger.debug(f"Deconstructing building at {building.get_location()}.")
+        logger.debug("Deconstructing building at {}.", building.get_location())
 
         if isinstance(building, Home):
             structure_type = StructureType.HOME
-            logger.debug(f"Building is a Home. Setting structure type to {structure_type}.")
+            logger.debug("Building is a Home. Setting structure type to {}.", structure_type)
         elif isinstance(building, Mine):
             structure_type = StructureType.MINE
-            logger.debug(f"Building is a Mine. Setting structure type to {structure_type}.")
+            logger.debug("Building is a Mine. Setting structure type to {}.", structure_type)
         elif isinstance(building, Farm):
             structure_type = StructureType.FARM
-            logger.debug(f"Building is a Farm. Setting structure type to {structure_type}.")
+            logger.debug("Building is a Farm. Setting structure type to {}.", structure_type)
         elif isinstance(building, Barn):
             structure_type = StructureType.BARN
-            logger.debug(f"Building is a Barn. Setting structure type to {structure_type}.")
+            logger.debug("Building is a Barn. Setting structure type to {}.", structure_type)
         else:
-            logger.warning(f"Unknown building type {building} for deconstruction. Aborting.")
+            logger.warning("Unknown building type {} for deconstruction. Aborting.", building)
             return
 
         structure: Structure = self._structure_factory.create_instance(structure_type, building.get_location())
-        logger.debug(f"New {structure_type} structure created at {building.get_location()}.")
-        self._structures[structure.get_location()] = structure
+        logger.debug("New {} structure created at {}.", structure_type, building.get_location())
+        self._structures.add(structure.get_location(), structure)
 
     def get_empty_spots_near_town(self) -> List[Location]:
+        """
+        Empty cells touching a building or construction but not a tree.
+        A spot is listed once for every building cell it touches, in the order of a row by row scan of the buildings
+        looking in each of _directions, so a random pick favors spots next to more of the town.
+        """
         logger.debug("Starting search for empty spots near towns.")
 
-        rows = len(self._grid)
-        cols = len(self._grid[0])
-        empty_spots = []
-
-        logger.debug(f"Building types to check for: {self._building_types}")
-
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+        building_mask = self.get_mask(*[CellCodec.encode(char) for char in self._building_types])
+        spots_mask = self.get_mask(CellCodec.EMPTY) & ~self._touches(self.get_mask(CellCodec.TREE))
+
+        # [building, direction] -> the spot in that direction of the building, if it is one
+        ys, xs = np.nonzero(building_mask)
+        dys = np.array([dy for dy, _ in self._directions])
+        dxs = np.array([dx for _, dx in self._directions])
+        spot_ys = ys[:, np.newaxis] + dys
+        spot_xs = xs[:, np.newaxis] + dxs
+        in_bounds = (spot_ys >= 0) & (spot_ys < self._height) & (spot_xs >= 0) & (spot_xs < self._width)
+        is_spot = np.zeros_like(in_bounds)
+        is_spot[in_bounds] = spots_mask[spot_ys[in_bounds], spot_xs[in_bounds]]
+        empty_spots = [Location(x, y) for y, x in zip(spot_ys[is_spot].tolist(), spot_xs[is_spot].tolist())]
+
+        logger.debug("Found {} empty spots near towns.", len(empty_spots))
+        return empty_spots
 
-        for i in range(rows):
-            for j in range(cols):
-                if self._grid[i][j] not in self._building_types:
+    @staticmethod
+    def _touches(mask: np.ndarray) -> np.ndarray:
+        """True where one of the 8 neighbors of a cell is set in mask."""
+        padded = np.pad(mask, 1)
+        height, width = mask.shape
+        touches = np.zeros_like(mask)
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                if dx == 0 and dy == 0:
                     continue
+                touches |= padded[1 + dy : 1 + dy + height, 1 + dx : 1 + dx + width]
+        return touches
 
-                location: Location = Location(j, i)
-                logger.debug(f"Building or construction found at {location}. Checking surrounding spots.")
-
-                for dx, dy in directions:
-                    ni, nj = i + dx, j + dy
-                    neighbor_location = Location(nj, ni)
-
-                    if not self.is_in_bounds(neighbor_location):
-                        continue
-                    if not self.is_empty(neighbor_location):
-                        continue
-
-                    logger.debug(f"Empty spot found at {neighbor_location}. Checking adjacency to trees.")
-
-                    # Now check if this empty spot is adjacent to a tree
-                    is_adjacent_to_tree = False
-                    for ddx, ddy in directions:
-                        nn_i, nn_j = ni + ddx, nj + ddy
-                        tree_neighbor: Location = Location(nn_j, nn_i)
-                        if 0 <= nn_i < rows and 0 <= nn_j < cols and self.is_tree(tree_neighbor):
-                            is_adjacent_to_tree = True
-                            logger.debug(f"Spot {neighbor_location} is adjacent to tree at {tree_neighbor}.")
-                            break
-
-                    if not is_adjacent_to_tree:
-                        logger.debug(f"Spot {neighbor_location} is valid and added to empty spots.")
-                        empty_spots.append(neighbor_location)
+    def grow_trees(self) -> None:
+        config: Config = settings.get_config()
+        chance: float = config.tree_growth_chance
+        logger.debug("Starting tree growth process with a chance of {}.", chance)
+
+        # visit the trees row by row, including trees grown during the pass further along, y * width + x order
+        pending: List[int] = [location.y * self._width + location.x for location in self._structures.get_by_type(Tree)]
+        heapq.heapify(pending)
+        visited = -1
+        while pending:
+            cell = heapq.heappop(pending)
+            if cell == visited:
+                continue
+            visited = cell
+            y, x = divmod(cell, self._width)
+            location: Location = Location(x, y)
+            tree: Structure = self._structures.get(location)
 
-        logger.debug(f"Found {len(empty_spots)} empty spots near towns.")
-        return empty_spots
+            if not isinstance(tree, Tree):
+                continue
 
-    def grow_trees(self) -> None:
-        chance: int = settings.get("tree_growth_chance", 0.01)
-        logger.debug(f"Starting tree growth process with a chance of {chance}.")
+            logger.debug("Tree found at {}. Checking its neighbors for growth.", location)
 
-        for i in range(len(self._grid)):
-            for j in range(len(self._grid[i])):
-                location: Location = Location(j, i)
-                tree: Structure = self._structures.get(location)
+            neighbors: List[Location] = location.get_neighbors()
+            random.shuffle(neighbors)
 
-                if not isinstance(tree, Tree):
+            for neighbor in neighbors:
+                if not self.is_in_bounds(neighbor):
+                    logger.debug("Neighbor {} is out of bounds. Skipping.", neighbor)
                     continue
-
-                logger.debug(f"Tree found at {location}. Checking its neighbors for growth.")
-
-                neighbors: List[Location] = location.get_neighbors()
-                random.shuffle(neighbors)
-
-                for neighbor in neighbors:
-                    if not self.is_in_bounds(neighbor):
-                        logger.debug(f"Neighbor {neighbor} is out of bounds. Skipping.")
-                        continue
-                    if not self.is_empty(neighbor):
-                        logger.debug(f"Neighbor {neighbor} is not empty. Skipping.")
-                        continue
-                    if random.random() < chance:
-                        logger.info(f"Growing tree at {neighbor}.")
-                        self._grid[neighbor.y][neighbor.x] = settings.get("tree_char", "*")  # Place a tree here
-                        neighbor_tree: Structure = self._structure_factory.create_instance(StructureType.TREE, neighbor)
-                        if isinstance(neighbor_tree, Tree):
-                            neighbor_tree.set_yield_func(tree.get_yield_func())
-                            self._structures[neighbor] = neighbor_tree
-                            logger.debug(f"Tree successfully grown at {neighbor}.")
-                            break
-                        else:
-                            logger.debug(f"Failed to create a valid tree structure at {neighbor}.")
+                if not self.is_empty(neighbor):
+                    logger.debug("Neighbor {} is not empty. Skipping.", neighbor)
+                    continue
+                if random.random() < chance:
+                    logger.info("Growing tree at {}.", neighbor)
+                    self.set_char(neighbor, config.tree_char)  # Place a tree here
+                    neighbor_tree: Structure = self._structure_factory.create_instance(StructureType.TREE, neighbor)
+                    if isinstance(neighbor_tree, Tree):
+                        neighbor_tree.set_yield_func(tree.get_yield_func())
+                        self._structures.add(neighbor, neighbor_tree)
+                        logger.debug("Tree successfully grown at {}.", neighbor)
+                        if (neighbor.y, neighbor.x) > (y, x):
+                            heapq.heappush(pending, neighbor.y * self._width + neighbor.x)
+                        break
+                    else:
+                        logger.debug("Failed to create a valid tree structure at {}.", neighbor)
 
         logger.debug("Tree growth process completed.")
 
-    def work_structures_exchange_memories(self):
-        logger.debug("Starting memory exchange for work structures.")
+    def add_staffed_work(self, work: Work) -> None:
+        self._structures.add_staffed(work)
 
-        work_structures: List[Work] = list(filter(lambda s: isinstance(s, Work), self._structures.values()))
+    def remove_staffed_work(self, work: Work) -> None:
+        self._structures.remove_staffed(work)
+
+    def work_structures_exchange_memories(self):
+        work_structures: List[Work] = self._structures.get_staffed()
+        logger.debug("Starting memory exchange for {} staffed work structures.", len(work_structures))
 
         for work_structure in work_structures:
-            logger.debug(f"Exchanging memories for work structure {work_structure}.")
+            logger.debug("Exchanging memories for work structure {}.", work_structure)
             work_structure.exchange_worker_memories()
 
         logger.debug("Memory exchange for work structures completed.")
 
     def start_building_construction(self, building_type: StructureType, location: Location) -> None:
         try:
-            logger.debug(f"Attempting to start construction of {building_type} at {location}.")
+            logger.debug("Attempting to start construction of {} at {}.", building_type, location)
             building: Structure = self._structure_factory.create_instance(building_type, location)
-            logger.info(f"Construction started for {building_type} at {location}.")
+            logger.info("Construction started for {} at {}.", building_type, location)
         except Exception as e:
-            logger.error(f"Could not start structure construction at {location}. Error: {e}")
+            logger.error("Could not start structure construction at {}. Error: {}", location, e)
             return
-        self._structures[location] = building
-        logger.debug(f"Structure at {location} added to the list of structures.")
+        self._structures.add(location, building)
+        logger.debug("Structure at {} added to the list of structures.", location)
+
+    def add_completed_construction(self, construction: Construction) -> None:
+        logger.debug("Construction at {} is complete.", construction.get_location())
+        self._structures.add_completed(construction)
 
     def turn_completed_constructions_to_buildings(self):
-        logger.debug("Turning completed constructions into buildings.")
+        constructions: List[Construction] = self._structures.get_completed()
+        logger.debug("Turning {} completed constructions into buildings.", len(constructions))
 
-        locations: List[Location] = list(self._structures.keys())
-        for location in locations:
-            logger.debug(f"Checking structure at {location}.")
+        for construction in constructions:
+            location: Location = construction.get_location()
+            logger.debug("Checking structure at {}.", location)
 
             if self.is_construction_barn(location):
                 building_type = StructureType.BARN
-                logger.debug(f"Construction at {location} is a barn.")
+                logger.debug("Construction at {} is a barn.", location)
             elif self.is_construction_farm(location):
                 building_type = StructureType.FARM
-                logger.debug(f"Construction at {location} is a farm.")
+                logger.debug("Construction at {} is a farm.", location)
             elif self.is_construction_home(location):
                 building_type = StructureType.HOME
-                logger.debug(f"Construction at {location} is a home.")
+                logger.debug("Construction at {} is a home.", location)
             elif self.is_construction_mine(location):
                 building_type = StructureType.MINE
-                logger.debug(f"Construction at {location} is a mine.")
+                logger.debug("Construction at {} is a mine.", location)
             else:
-                logger.debug(f"Construction at {location} is not recognized. Skipping.")
+                logger.debug("Construction at {} is not recognized. Skipping.", location)
                 continue
 
-            if self._structures[location].has_capacity():
-                logger.debug(f"Structure at {location} still has capacity. Skipping.")
+            if construction.has_capacity():
+                logger.debug("Structure at {} still has capacity. Skipping.", location)
                 continue
 
-            logger.info(f"Turning construction at {location} into a building.")
-            self._structures[location] = self._structure_factory.create_instance(building_type, location)
-            logger.debug(f"Building at {location} updated to {building_type}.")
+            logger.info("Turning construction at {} into a building.", location)
+            self.remove(construction)  # clear the construction site so the building can be placed on it
+            self._structures.add(location, self._structure_factory.create_instance(building_type, location))
+            logger.debug("Building at {} updated to {}.", location, building_type)
 
     def is_in_bounds(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is within bounds.")
+        logger.debug("Checking if location {} is within bounds.", location)
         in_bounds = 0 <= location.x < self._width and 0 <= location.y < self._height
-        logger.debug(f"Location {location} is {'within' if in_bounds else 'out of'} bounds.")
+        logger.debug("Location {} is {} bounds.", location, "within" if in_bounds else "out of")
         return in_bounds
 
     def get_path_finding_matrix(self) -> List[List[int]]:
         logger.debug("Generating path finding matrix.")
 
-        logger.debug(f"Character to obstacle rating map: {self._char_to_num}")
-
-        path_finding_matrix: List[List[int | str]] = deepcopy(self._grid)
+        logger.debug("Character to obstacle rating map: {}", self._char_to_num)
 
-        logger.debug(
-            f"Starting to fill the path finding matrix based on grid size {len(self._grid)}x{len(self._grid[0])}."
-        )
-
-        for i in range(len(self._grid)):
-            row = self._grid[i]
-            for j in range(len(row)):
-                cell = row[j]
-                # invert coordinates for the pathfinding library
-                path_finding_matrix[j][i] = self._char_to_num[cell]
-                logger.debug(f"Setting path_finding_matrix[{j}][{i}] = {self._char_to_num[cell]} (cell: {cell})")
+        # invert coordinates for the pathfinding library
+        path_finding_matrix: List[List[int]] = self._ratings[self._cells].T.tolist()
 
         logger.debug("Path finding matrix generation complete.")
 
         return path_finding_matrix
 
     def is_tree(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a tree.")
-        return self.is_char(location, settings.get("tree_char", "*"))
+        logger.debug("Checking if location {} is a tree.", location)
+        return self._is_code(location, CellCodec.TREE)
 
     def is_barn(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a barn.")
-        return self.is_char(location, settings.get("barn_char", "B"))
+        logger.debug("Checking if location {} is a barn.", location)
+        return self._is_code(location, CellCodec.BARN)
 
     def is_construction_barn(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a construction barn.")
-        return self.is_char(location, settings.get("barn_construction_char", "b"))
+        logger.debug("Checking if location {} is a construction barn.", location)
+        return self._is_code(location, CellCodec.BARN_CONSTRUCTION)
 
     def is_home(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a home.")
-        return self.is_char(location, settings.get("home_char", "H"))
+        logger.debug("Checking if location {} is a home.", location)
+        return self._is_code(location, CellCodec.HOME)
 
     def is_construction_home(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a construction home.")
-        return self.is_char(location, settings.get("home_construction_char", "h"))
+        logger.debug("Checking if location {} is a construction home.", location)
+        return self._is_code(location, CellCodec.HOME_CONSTRUCTION)
 
     def is_farm(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a farm.")
-        return self.is_char(location, settings.get("farm_char", "F"))
+        logger.debug("Checking if location {} is a farm.", location)
+        return self._is_code(location, CellCodec.FARM)
 
     def is_construction_farm(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a construction farm.")
-        return self.is_char(location, settings.get("farm_construction_char", "f"))
+        logger.debug("Checking if location {} is a construction farm.", location)
+        return self._is_code(location, CellCodec.FARM_CONSTRUCTION)
 
     def is_mine(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a mine.")
-        return self.is_char(location, settings.get("mine_char", "M"))
+        logger.debug("Checking if location {} is a mine.", location)
+        return self._is_code(location, CellCodec.MINE)
 
     def is_construction_mine(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is a construction mine.")
-        return self.is_char(location, settings.get("mine_construction_char", "m"))
+        logger.debug("Checking if location {} is a construction mine.", location)
+        return self._is_code(location, CellCodec.MINE_CONSTRUCTION)
 
     def is_empty(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is empty.")
-        return self.is_char(location, settings.get("empty_char", " "))
+        logger.debug("Checking if location {} is empty.", location)
+        return self._is_code(location, CellCodec.EMPTY)
 
     def is_char(self, location: Location, char: str) -> bool:
-        logger.debug(f"Checking if location {location} contains character '{char}'.")
+        logger.debug("Checking if location {} contains character '{}'.", location, char)
+        return self._is_code(location, CellCodec.encode(char))
+
+    def _is_code(self, location: Location, code: int) -> bool:
         if not self.is_in_bounds(location):
-            logger.warning(f"You called is_char with a location that is out of bounds {location}")
+            logger.warning("You called is_char with a location that is out of bounds {}", location)
             return False
 
-        return self._grid[location.y][location.x] == char
+        return self._cells.item(location.y, location.x) == code
 
     def get_width(self) -> int:
         logger.debug("Getting grid width.")
@@ -436,6 +598,8 @@ class Grid:
     def flush(self):
         logger.debug("Flushing disaster generator.")
         self._disaster_generator.flush()
+        logger.info("Vision cache counts this year: {}", self._field_of_view.get_cache_counts())
+        self._field_of_view.flush()
 
     def get_disaster_counts(self) -> Dict[str, int]:
         logger.debug("Getting disaster counts.")
@@ -30,7 +30,7 @@ class GridDisasterGenerator:
 
         # Log the initialization of the disaster generator
         logger.debug("Initialized GridDisasterGenerator.")
-        logger.debug(f"Initial disaster counts: {self._disaster_counts}")
+        logger.debug("Initial disaster counts: {}", self._disaster_counts)
 
     def generate(self, chance: float) -> None:
         """Randomly trigger one of the disaster types with a given chance."""
@@ -38,7 +38,7 @@ class GridDisasterGenerator:
             severity = random.randint(1, 10)
 
             # Log the generation of a disaster
-            logger.debug(f"Disaster generated with severity {severity}.")
+            logger.debug("Disaster generated with severity {}.", severity)
 
             # List of disaster methods
             disaster_methods = [
@@ -52,12 +52,12 @@ class GridDisasterGenerator:
 
             # Randomly pick one disaster to trigger
             chosen_disaster, disaster_name = random.choice(disaster_methods)
-            logger.debug(f"Triggering disaster: {disaster_name}.")
+            logger.debug("Triggering disaster: {}.", disaster_name)
             chosen_disaster(severity)
 
             # Increment the disaster count for the chosen disaster
             self._disaster_counts[disaster_name] += 1
-            logger.debug(f"Disaster count for {disaster_name}: {self._disaster_counts[disaster_name]}.")
+            logger.debug("Disaster count for {}: {}.", disaster_name, self._disaster_counts[disaster_name])
 
     def get_disaster_counts(self) -> Dict[str, int]:
         """Return the current disaster count statistics."""
@@ -71,67 +71,67 @@ class GridDisasterGenerator:
 
     def _rats_eat_home_food(self, severity: int) -> None:
         """Remove food from home storage based on disaster severity."""
-        logger.debug(f"Rats are eating home food with severity {severity}.")
+        logger.debug("Rats are eating home food with severity {}.", severity)
         affected_homes_percent = (severity // 2) / 10
         homes: List[Structure] = self._grid.get_structures(Home)
         num_affected = int(len(homes) * affected_homes_percent)
-        logger.debug(f"Number of homes affected: {num_affected}/{len(homes)}.")
+        logger.debug("Number of homes affected: {}/{}.", num_affected, len(homes))
 
         homes_affected = random.sample(homes, num_affected)
         for home in homes_affected:
             resources: List[str] = home.get_resource_names()
             for resource in resources:
-                logger.debug(f"Removing resource {resource} from home at {home.get_location()}.")
+                logger.debug("Removing resource {} from home at {}.", resource, home.get_location())
                 home.remove_resource(resource, home.get_resource(resource))
 
     def _burn_buildings(self, severity: int) -> None:
         """Burn down buildings based on severity."""
-        logger.debug(f"Burning buildings with severity {severity}.")
+        logger.debug("Burning buildings with severity {}.", severity)
         buildings_burned_percent = (severity // 2) / 10
         buildings: List[Structure] = list(self._grid.get_buildings().values())
         random.shuffle(buildings)
 
         num_buildings_to_process = int(len(buildings) * buildings_burned_percent)
-        logger.debug(f"Number of buildings to process: {num_buildings_to_process}/{len(buildings)}.")
+        logger.debug("Number of buildings to process: {}/{}.", num_buildings_to_process, len(buildings))
 
         buildings_to_burn = buildings[:num_buildings_to_process]
 
         for building in buildings_to_burn:
-            logger.debug(f"Burning building at {building.get_location()}.")
+            logger.debug("Burning building at {}.", building.get_location())
             if random.choice([True, False]):
                 self._grid.remove(building)
-                logger.debug(f"Building at {building.get_location()} burned down.")
+                logger.debug("Building at {} burned down.", building.get_location())
             else:
                 self._grid.remove(building, True)
-                logger.debug(f"Building at {building.get_location()} burned down and deconstructed.")
+                logger.debug("Building at {} burned down and deconstructed.", building.get_location())
 
     def _decrease_farm_yield(self, severity: int) -> None:
         """Disease infects the farm, reducing resources or crops."""
-        logger.debug(f"Decreasing farm yield with severity {severity}.")
+        logger.debug("Decreasing farm yield with severity {}.", severity)
         farms_diseased_percent = (severity // 2) / 10
         farms: List[Structure] = self._grid.get_structures(Farm)
         num_affected = int(len(farms) * farms_diseased_percent)
-        logger.debug(f"Number of farms affected: {num_affected}/{len(farms)}.")
+        logger.debug("Number of farms affected: {}/{}.", num_affected, len(farms))
 
         farms_affected = random.sample(farms, num_affected)
         for farm in farms_affected:
-            logger.debug(f"Decreasing yield for farm at {farm.get_location()}.")
+            logger.debug("Decreasing yield for farm at {}.", farm.get_location())
             farm.decrease_yield()
 
     def _decrease_mine_yield(self, severity: int) -> None:
-        logger.debug(f"Decreasing mine yield with severity {severity}.")
+        logger.debug("Decreasing mine yield with severity {}.", severity)
         percent_affected = (severity // 2) / 10
         mines: List[Structure] = self._grid.get_structures(Mine)
         num_affected = int(len(mines) * percent_affected)
-        logger.debug(f"Number of mines affected: {num_affected}/{len(mines)}.")
+        logger.debug("Number of mines affected: {}/{}.", num_affected, len(mines))
 
         mines_affected = random.sample(mines, num_affected)
         for mine in mines_affected:
-            logger.debug(f"Decreasing yield for mine at {mine.get_location()}.")
+            logger.debug("Decreasing yield for mine at {}.", mine.get_location())
             mine.decrease_yield()
 
     def _forest_fire(self, severity: int) -> None:
-        logger.debug(f"Starting forest fire with severity {severity}.")
+        logger.debug("Starting forest fire with severity {}.", severity)
         max_width = self._grid.get_width()
         max_height = self._grid.get_height()
 
@@ -145,28 +145,30 @@ class GridDisasterGenerator:
         start_y = random.randint(0, max_height - burned_height)
 
         removal_probability = severity * 0.1
-        logger.debug(f"Burned area: width {burned_width}, height {burned_height}, starting at ({start_x}, {start_y}).")
-        logger.debug(f"Chance of tree removal: {removal_probability * 100}%.")
+        logger.debug(
+            "Burned area: width {}, height {}, starting at ({}, {}).", burned_width, burned_height, start_x, start_y
+        )
+        logger.debug("Chance of tree removal: {}%.", removal_probability * 100)
 
         for x in range(start_x, start_x + burned_width):
             for y in range(start_y, start_y + burned_height):
                 location = Location(x, y)
 
                 if self._grid.is_tree(location) and random.random() <= removal_probability:
-                    logger.debug(f"Tree at {location} removed by fire.")
+                    logger.debug("Tree at {} removed by fire.", location)
                     self._grid.remove(self._grid.get_structure(location))
 
     def _steal_barn_resources(self, severity: int) -> None:
-        logger.debug(f"Stealing barn resources with severity {severity}.")
+        logger.debug("Stealing barn resources with severity {}.", severity)
         percent_affected = (severity // 2) / 10
         barns: List[Structure] = self._grid.get_structures(Barn)
         num_affected = int(len(barns) * percent_affected)
-        logger.debug(f"Number of barns affected: {num_affected}/{len(barns)}.")
+        logger.debug("Number of barns affected: {}/{}.", num_affected, len(barns))
 
         barns_affected = random.sample(barns, num_affected)
         for barn in barns_affected:
             if isinstance(barn, Barn):
                 resources: List[str] = barn.get_resource_names()
                 for resource in resources:
-                    logger.debug(f"Stealing resource {resource} from barn at {barn.get_location()}.")
+                    logger.debug("Stealing resource {} from barn at {}.", resource, barn.get_location())
                     barn.remove_resource(resource, barn.get_resource(resource))
@@ -1,36 +1,47 @@
 import random
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
+import numpy as np
+
+from src.config import Config
 from src.logger import logger
 from src.settings import settings
+from src.simulation.grid.summed_area_table import SummedAreaTable
 
 
 class GridGenerator:
     def __init__(
         self,
         size: int,
-        tree_density: float = settings.get("tree_density", 0.4),
-        ca_iterations: int = settings.get("ca_iterations", 40),
-        town_clearance_radius: int = settings.get("town_clearance_radius", 15),
-        building_buffer: int = settings.get("building_buffer", 1),
+        tree_density: Optional[float] = None,
+        ca_iterations: Optional[int] = None,
+        town_clearance_radius: Optional[int] = None,
+        building_buffer: Optional[int] = None,
     ) -> None:
+        config: Config = settings.get_config()
+        tree_density = config.tree_density if tree_density is None else tree_density
+        ca_iterations = config.ca_iterations if ca_iterations is None else ca_iterations
+        town_clearance_radius = config.town_clearance_radius if town_clearance_radius is None else town_clearance_radius
+        building_buffer = config.building_buffer if building_buffer is None else building_buffer
         self._grid: List[List[str]] = []
+        self._tree_mask: np.ndarray = np.zeros((size, size), dtype=bool)
+        self._occupied: SummedAreaTable = SummedAreaTable(np.zeros((size, size), dtype=bool))
         self._width: int = size
         self._height: int = size
         self._tree_density: float = tree_density
         self._ca_iterations: int = ca_iterations
-        self._tree_char: str = settings.get("tree_char", "*")
+        self._tree_char: str = config.tree_char
 
-        self._num_houses: int = random.randint(settings.get("num_house_min", 3), settings.get("num_house_max", 8))
-        self._num_farms: int = random.randint(settings.get("num_farm_min", 1), settings.get("num_farm_max", 3))
-        self._num_barns: int = random.randint(settings.get("num_barn_min", 1), settings.get("num_barn_max", 2))
-        self._num_mines: int = random.randint(settings.get("num_mines_min", 1), settings.get("num_mines_max", 2))
+        self._num_houses: int = random.randint(config.num_house_min, config.num_house_max)
+        self._num_farms: int = random.randint(config.num_farm_min, config.num_farm_max)
+        self._num_barns: int = random.randint(config.num_barn_min, config.num_barn_max)
+        self._num_mines: int = random.randint(config.num_mines_min, config.num_mines_max)
 
         self._building_sizes: dict[str, Tuple[int, int]] = {
-            settings.get("home_char", "H"): (settings.get("home_size", 2), settings.get("home_size", 2)),
-            settings.get("farm_char", "F"): (settings.get("farm_size", 5), settings.get("farm_size", 5)),
-            settings.get("barn_char", "B"): (settings.get("barn_size", 3), settings.get("barn_size", 3)),
-            settings.get("mine_char", "M"): (settings.get("mine_size", 3), settings.get("mine_size", 3)),
+            config.home_char: (config.home_size, config.home_size),
+            config.farm_char: (config.farm_size, config.farm_size),
+            config.barn_char: (config.barn_size, config.barn_size),
+            config.mine_char: (config.mine_size, config.mine_size),
         }
 
         self._town_clearance_radius: int = town_clearance_radius
@@ -38,16 +49,16 @@ class GridGenerator:
 
         # Log the initialization parameters using f-string formatting
         logger.debug("GridGenerator initialized with the following parameters:")
-        logger.debug(f"Grid size: {self._width}x{self._height}")
-        logger.debug(f"Tree density: {self._tree_density}")
-        logger.debug(f"CA iterations: {self._ca_iterations}")
-        logger.debug(f"Town clearance radius: {self._town_clearance_radius}")
-        logger.debug(f"Building buffer: {self._building_buffer}")
-        logger.debug(f"Building sizes: {self._building_sizes}")
-        logger.debug(f"Number of houses: {self._num_houses}")
-        logger.debug(f"Number of farms: {self._num_farms}")
-        logger.debug(f"Number of barns: {self._num_barns}")
-        logger.debug(f"Number of mines: {self._num_mines}")
+        logger.debug("Grid size: {}x{}", self._width, self._height)
+        logger.debug("Tree density: {}", self._tree_density)
+        logger.debug("CA iterations: {}", self._ca_iterations)
+        logger.debug("Town clearance radius: {}", self._town_clearance_radius)
+        logger.debug("Building buffer: {}", self._building_buffer)
+        logger.debug("Building sizes: {}", self._building_sizes)
+        logger.debug("Number of houses: {}", self._num_houses)
+        logger.debug("Number of farms: {}", self._num_farms)
+        logger.debug("Number of barns: {}", self._num_barns)
+        logger.debug("Number of mines: {}", self._num_mines)
 
     def generate(self) -> List[List[str]]:
         logger.debug("Starting grid generation process...")
@@ -57,7 +68,7 @@ class GridGenerator:
         self._initialize_grid()
 
         # Add clustered trees based on tree density
-        logger.debug(f"Adding clustered trees with density {self._tree_density}...")
+        logger.debug("Adding clustered trees with density {}...", self._tree_density)
         self._add_clustered_trees()
 
         # Generate the town layout, placing buildings
@@ -68,7 +79,7 @@ class GridGenerator:
         return self._grid
 
     def _initialize_grid(self) -> None:
-        logger.debug(f"Initializing grid with size {self._width} x {self._height}...")
+        logger.debug("Initializing grid with size {} x {}...", self._width, self._height)
 
         # Initialize grid with empty spaces
         self._grid = [[" " for _ in range(self._width)] for _ in range(self._height)]
@@ -80,30 +91,43 @@ class GridGenerator:
 
         center_x, center_y = self._width // 2, self._height // 2
         self._clear_town_area(center_x, center_y)
+        self._occupied = SummedAreaTable(np.array(self._grid) != " ")
 
+        config: Config = settings.get_config()
         buildings = [
-            (settings.get("home_char", "H"), self._num_houses, settings.get("home_completion_prob", 0.8)),
-            (settings.get("farm_char", "F"), self._num_farms, settings.get("farm_completion_prob", 0.8)),
-            (settings.get("barn_char", "B"), self._num_barns, settings.get("barn_completion_prob", 0.8)),
-            (settings.get("mine_char", "M"), self._num_mines, settings.get("mine_completion_prob", 0.8)),
+            (config.home_char, self._num_houses, config.home_completion_prob),
+            (config.farm_char, self._num_farms, config.farm_completion_prob),
+            (config.barn_char, self._num_barns, config.barn_completion_prob),
+            (config.mine_char, self._num_mines, config.mine_completion_prob),
         ]
 
         for building_type, count, completion_prob in buildings:
             logger.debug(
-                f"Placing {count} buildings of type '{building_type}' with a completion probability of {completion_prob:.2f}..."
+                "Placing {} buildings of type '{}' with a completion probability of {:.2f}...",
+                count,
+                building_type,
+                completion_prob,
             )
             self._place_building_random(building_type, True)  # Place the first building (always completed)
             for i in range(count - 1):
                 is_completed = random.random() < completion_prob
-                logger.debug(f"Building {i + 1}/{count - 1} of type '{building_type}' - Completed: {is_completed}")
+                logger.debug(
+                    "Building {}/{} of type '{}' - Completed: {}", i + 1, count - 1, building_type, is_completed
+                )
                 self._place_building_random(building_type, is_completed)
 
         logger.debug(
-            f"Town generation completed with {self._num_houses} homes, {self._num_farms} farms, {self._num_barns} barns, and {self._num_mines} mines placed."
+            "Town generation completed with {} homes, {} farms, {} barns, and {} mines placed.",
+            self._num_houses,
+            self._num_farms,
+            self._num_barns,
+            self._num_mines,
         )
 
     def _clear_town_area(self, center_x: int, center_y: int) -> None:
-        logger.debug(f"Clearing town area with radius {self._town_clearance_radius} around ({center_x}, {center_y})...")
+        logger.debug(
+            "Clearing town area with radius {} around ({}, {})...", self._town_clearance_radius, center_x, center_y
+        )
         radius = self._town_clearance_radius
         for dy in range(-radius, radius + 1):
             for dx in range(-radius, radius + 1):
@@ -113,125 +137,125 @@ class GridGenerator:
         logger.debug("Town area cleared.")
 
     def _place_building_random(self, building_type: str, is_completed: bool) -> None:
-        logger.debug(f"Placing building of type '{building_type}' (Completed: {is_completed})...")
+        logger.debug("Placing building of type '{}' (Completed: {})...", building_type, is_completed)
         center_x, center_y = self._width // 2, self._height // 2
         width, height = self._building_sizes[building_type]
 
-        # Search for a random location to place the building, expanding outward
-        for distance in range(1, max(self._width, self._height)):
-            for dy in range(-distance, distance + 1):
-                for dx in range(-distance, distance + 1):
-                    x, y = center_x + dx, center_y + dy
-                    if 0 <= x < self._width and 0 <= y < self._height:
-                        if self._can_place_building(x, y, width, height):
-                            building_char = building_type if is_completed else building_type.lower()
-                            logger.debug(f"Placing building at ({x}, {y})")
-                            self._clear_area(x, y, width, height)
-                            self._place_on_grid(x, y, width, height, building_char)
-                            logger.debug("Building placed.")
-                            return
-        logger.warning(f"Failed to place building of type '{building_type}' after searching the grid.")
-
-    def _can_place_building(self, x: int, y: int, width: int, height: int) -> bool:
-        logger.debug(f"Checking if building can be placed at ({x}, {y}) with size ({width}, {height})...")
-
-        if x + width > self._width or y + height > self._height:
-            logger.debug("Building exceeds grid boundaries.")
-            return False
-
-        for dy in range(-self._building_buffer, height + self._building_buffer):
-            for dx in range(-self._building_buffer, width + self._building_buffer):
-                new_x, new_y = x + dx, y + dy
-                if 0 <= new_x < self._width and 0 <= new_y < self._height:
-                    if self._grid[new_y][new_x] != " ":
-                        logger.debug(f"Blocked by non-empty cell at ({new_x}, {new_y}). Cannot place building here.")
-                        return False
-        logger.debug(f"Building can be placed at ({x}, {y}).")
-        return True
+        # Search outward from the center in growing squares, scanning each square row by row.
+        # The first spot found is the first free spot, in row major order, of the smallest square holding one.
+        free = self._occupied.get_empty_top_lefts(width, height, self._building_buffer)
+        if free.any():
+            ys, xs = np.indices(free.shape)
+            distances = np.maximum(np.abs(xs - center_x), np.abs(ys - center_y))
+            distance = max(int(distances[free].min()), 1)
+            if distance < max(self._width, self._height):
+                y, x = (int(i) for i in np.argwhere(free & (distances <= distance))[0])
+                building_char = building_type if is_completed else building_type.lower()
+                logger.debug("Placing building at ({}, {})", x, y)
+                self._clear_area(x, y, width, height)
+                self._place_on_grid(x, y, width, height, building_char)
+                logger.debug("Building placed.")
+                return
+        logger.warning("Failed to place building of type '{}' after searching the grid.", building_type)
 
     def _clear_area(self, x: int, y: int, width: int, height: int) -> None:
-        logger.debug(f"Clearing area around ({x}, {y}) with size ({width}, {height})...")
+        logger.debug("Clearing area around ({}, {}) with size ({}, {})...", x, y, width, height)
 
         for dy in range(-self._building_buffer, height + self._building_buffer):
             for dx in range(-self._building_buffer, width + self._building_buffer):
                 new_x, new_y = x + dx, y + dy
                 if 0 <= new_x < self._width and 0 <= new_y < self._height:
                     if self._grid[new_y][new_x] == self._tree_char:
-                        logger.debug(f"Clearing tree at ({new_x}, {new_y}).")
+                        logger.debug("Clearing tree at ({}, {}).", new_x, new_y)
                         self._grid[new_y][new_x] = " "
                     elif self._grid[new_y][new_x] == " ":
-                        logger.debug(f"Cell at ({new_x}, {new_y}) is already empty.")
+                        logger.debug("Cell at ({}, {}) is already empty.", new_x, new_y)
                         self._grid[new_y][new_x] = " "
         logger.debug("Area cleared.")
 
     def _place_on_grid(self, x: int, y: int, width: int, height: int, building_char: str) -> None:
-        logger.debug(f"Placing building of type '{building_char}' at ({x}, {y}) with size ({width}, {height})...")
+        logger.debug(
+            "Placing building of type '{}' at ({}, {}) with size ({}, {})...", building_char, x, y, width, height
+        )
 
         for dy in range(height):
             for dx in range(width):
                 self._grid[y + dy][x + dx] = building_char
-                logger.debug(f"Placed '{building_char}' at position ({x + dx}, {y + dy}).")
+                logger.debug("Placed '{}' at position ({}, {}).", building_char, x + dx, y + dy)
+        self._occupied.set_region(x, y, np.ones((height, width), dtype=bool))
 
-        logger.debug(f"Building placed at ({x}, {y}).")
+        logger.debug("Building placed at ({}, {}).", x, y)
 
     def _add_clustered_trees(self) -> None:
-        logger.debug(f"Starting tree clustering with density {self._tree_density}.")
+        logger.debug("Starting tree clustering with density {}.", self._tree_density)
         self._generate_inner_trees()
         self._do_cellular_automata()
         logger.debug("Tree clustering completed.")
 
     def _generate_inner_trees(self) -> None:
         logger.debug("Generating trees within the grid...")
-        for i in range(2, len(self._grid) - 2):
-            for j in range(2, len(self._grid[i]) - 2):
-                if random.random() < self._tree_density:
-                    self._grid[i][j] = self._tree_char
-                    logger.debug(f"Planted tree at ({j}, {i}).")
+        rows, cols = max(self._height - 4, 0), max(self._width - 4, 0)
+
+        # one draw for every inner cell, in the same row major order as drawing cell by cell
+        draws = self._random_sample(rows * cols).reshape(rows, cols)
+        self._tree_mask = np.zeros((self._height, self._width), dtype=bool)
+        self._tree_mask[2 : self._height - 2, 2 : self._width - 2] = draws < self._tree_density
+        self._set_trees_on_grid()
+
+        logger.debug("Planted {} trees.", int(self._tree_mask.sum()))
         logger.debug("Tree generation complete.")
 
     def _do_cellular_automata(self) -> None:
-        logger.debug(f"Starting cellular automata with {self._ca_iterations} iterations.")
+        logger.debug("Starting cellular automata with {} iterations.", self._ca_iterations)
 
+        inner = (slice(2, self._height - 2), slice(2, self._width - 2))
         for iteration in range(self._ca_iterations):
-            logger.debug(f"Iteration {iteration + 1} of {self._ca_iterations}...")
+            logger.debug("Iteration {} of {}...", iteration + 1, self._ca_iterations)
 
-            grid_copy = [row[:] for row in self._grid]
-            for i in range(2, len(self._grid) - 2):
-                for j in range(2, len(self._grid[i]) - 2):
-                    count = self._count_number_of_neighbors(i, j)
-                    logger.debug(f"Cell ({i}, {j}) has {count} neighbors.")
+            count = self._count_number_of_neighbors(self._tree_mask)
+            trees = self._tree_mask[inner]
+            neighbors = count[inner]
 
-                    if self._grid[i][j] == self._tree_char and count < 3:
-                        grid_copy[i][j] = " "
-                        logger.debug(f"Cell ({i}, {j}) has fewer than 3 neighbors, removing tree.")
-                    elif self._grid[i][j] == " " and count > 4:
-                        grid_copy[i][j] = self._tree_char
-                        logger.debug(f"Cell ({i}, {j}) has more than 4 neighbors, adding tree.")
+            # trees with fewer than 3 neighbors die, empty cells with more than 4 neighbors grow a tree
+            self._tree_mask[inner] = np.where(trees, neighbors >= 3, neighbors > 4)
 
-            self._grid = grid_copy
-            logger.debug(f"Iteration {iteration + 1} complete.")
+            logger.debug("Iteration {} complete.", iteration + 1)
 
+        self._set_trees_on_grid()
         logger.debug("Cellular automata process completed.")
 
-    def _count_number_of_neighbors(self, row: int, col: int) -> int:
-        count = 0
-        logger.debug(f"Counting neighbors for cell ({row}, {col})...")
-
-        for i in range(-1, 2):
-            for j in range(-1, 2):
-                if (
-                    (i == 0 and j == 0)  # Skip the cell itself
-                    or not (0 <= row + i < len(self._grid))  # Out of bounds check
-                    or not (0 <= col + j < len(self._grid[row]))  # Out of bounds check
-                ):
+    @staticmethod
+    def _count_number_of_neighbors(tree_mask: np.ndarray) -> np.ndarray:
+        """Number of trees in the 8 cells around every cell, cells outside the grid count as empty."""
+        height, width = tree_mask.shape
+        padded = np.pad(tree_mask, 1).astype(np.uint8)
+        count = np.zeros((height, width), dtype=np.uint8)
+        for dy in range(3):
+            for dx in range(3):
+                if dy == 1 and dx == 1:  # Skip the cell itself
                     continue
-                if self._grid[row + i][col + j] == self._tree_char:
-                    count += 1
-                    logger.debug(f"Neighbor at ({row + i}, {col + j}) is a tree.")
-
-        logger.debug(f"Cell ({row}, {col}) has {count} tree neighbors.")
+                count += padded[dy : dy + height, dx : dx + width]
         return count
 
+    def _set_trees_on_grid(self) -> None:
+        self._grid = [[self._tree_char if tree else " " for tree in row] for row in self._tree_mask.tolist()]
+
+    @staticmethod
+    def _random_sample(count: int) -> np.ndarray:
+        """
+        Draw count values from the random module in one vectorized call.
+        numpy's legacy generator is the same Mersenne Twister as the random module, so copying the state
+        over and back gives exactly the values (and leaves random in exactly the state) that count calls
+        to random.random() would, keeping worlds reproducible from random.seed.
+        """
+        version, internal_state, gauss_next = random.getstate()
+        generator = np.random.RandomState()
+        generator.set_state(("MT19937", np.array(internal_state[:-1], dtype=np.uint32), internal_state[-1]))
+        sample = generator.random_sample(count)
+        _, key, position, *_ = generator.get_state()
+        random.setstate((version, tuple(int(k) for k in key) + (int(position),), gauss_next))
+        return sample
+
 
 def print_grid(grid: List[List[str]]) -> None:
     # Top border: Adjusted to account for spaces between characters
@@ -1,69 +1,98 @@
-from typing import List
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
 from src.logger import logger
 from src.settings import settings
 
 
 class Location:
-    def __init__(self, x: int, y: int) -> None:
-        logger.debug(f"Initializing Location with x={x}, y={y}")
-        self.x = x
-        self.y = y
-
-        self._neighbor_offsets = [
-            (-1, -1),
-            (0, -1),
-            (1, -1),  # Top-left, Top, Top-right
-            (-1, 0),
-            (1, 0),  # Left,          Right
-            (-1, 1),
-            (0, 1),
-            (1, 1),  # Bottom-left, Bottom, Bottom-right
-        ]
+    """
+    A cell of the grid, an immutable value that is compared and hashed by its coordinates.
+    Locations are interned, creating the same coordinates again returns the same instance,
+    so there is one per cell no matter how many times the code asks for it and copies are the instance itself.
+    """
+
+    __slots__ = ("x", "y", "_hash")
+
+    x: int
+    y: int
+
+    _neighbor_offsets: ClassVar[Tuple[Tuple[int, int], ...]] = (
+        (-1, -1),
+        (0, -1),
+        (1, -1),  # Top-left, Top, Top-right
+        (-1, 0),
+        (1, 0),  # Left,          Right
+        (-1, 1),
+        (0, 1),
+        (1, 1),  # Bottom-left, Bottom, Bottom-right
+    )
+
+    _interned: ClassVar[Dict[Tuple[int, int], "Location"]] = {}
+
+    def __new__(cls, x: int, y: int) -> "Location":
+        location = cls._interned.get((x, y))
+        if location is None:
+            logger.debug("Initializing Location with x={}, y={}", x, y)
+            location = object.__new__(cls)
+            object.__setattr__(location, "x", x)
+            object.__setattr__(location, "y", y)
+            object.__setattr__(location, "_hash", hash((x, y)))
+            cls._interned[(x, y)] = location
+        return location
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Location is immutable, make a new one instead")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Location is immutable")
 
     def __eq__(self, other) -> bool:
-        logger.debug(f"Comparing Location({self.x}, {self.y}) to {other}")
+        logger.debug("Comparing Location({}, {}) to {}", self.x, self.y, other)
+        if self is other:
+            return True
         if not isinstance(other, Location):
             logger.debug("Other is not a Location instance, returning False.")
             return False
         result = self.x == other.x and self.y == other.y
-        logger.debug(f"Equality result: {result}")
+        logger.debug("Equality result: {}", result)
         return result
 
     def __hash__(self) -> int:
-        logger.debug(f"Hashing Location({self.x}, {self.y})")
-        return hash((self.x, self.y))
+        logger.debug("Hashing Location({}, {})", self.x, self.y)
+        return self._hash
 
     def __copy__(self) -> "Location":
-        logger.debug(f"Copying Location({self.x}, {self.y})")
-        return Location(self.x, self.y)
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Location":
+        return self
+
+    def __reduce__(self) -> Tuple[type, Tuple[int, int]]:
+        return Location, (self.x, self.y)
 
     def __str__(self) -> str:
         location_str = f"Location(x={self.x}, y={self.y})"
-        logger.debug(f"String representation: {location_str}")
+        logger.debug("String representation: {}", location_str)
         return location_str
 
     def distance_to(self, other: "Location") -> float:
-        logger.debug(f"Calculating distance from Location({self.x}, {self.y}) to {other}")
+        logger.debug("Calculating distance from Location({}, {}) to {}", self.x, self.y, other)
         if not isinstance(other, Location):
             logger.error("Argument must be a Location instance")
             raise ValueError("Argument must be a Location instance")
         distance = ((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5
-        logger.debug(f"Calculated distance: {distance}")
+        logger.debug("Calculated distance: {}", distance)
         return distance
 
     def is_one_away(self, other: "Location") -> bool:
-        logger.debug(f"Checking if Location({self.x}, {self.y}) is one step away from {other}")
+        logger.debug("Checking if Location({}, {}) is one step away from {}", self.x, self.y, other)
 
-        # Check if the difference between the current location and the other location
-        # matches any of the offsets in _neighbor_offsets
-        for dx, dy in self._neighbor_offsets:
-            if self.x + dx == other.x and self.y + dy == other.y:
-                logger.debug(f"One step away: True")
-                return True
-
-        logger.debug(f"One step away: False")
-        return False
+        # one of the eight neighbors, at most one step on each axis and not the same cell
+        dx = other.x - self.x
+        dy = other.y - self.y
+        result = -1 <= dx <= 1 and -1 <= dy <= 1 and (dx != 0 or dy != 0)
+        logger.debug("One step away: {}", result)
+        return result
 
     def is_at_same_location(self, wanted_location: "Location") -> bool:
         if self.x == wanted_location.x and self.y == wanted_location.y:
@@ -72,19 +101,21 @@ class Location:
             return False
 
     def get_neighbors(self) -> List["Location"]:
-        logger.debug(f"Getting neighbors for Location({self.x}, {self.y})")
+        logger.debug("Getting neighbors for Location({}, {})", self.x, self.y)
 
         neighbors = []
         for dx, dy in self._neighbor_offsets:
             new_location = Location(self.x + dx, self.y + dy)
-            logger.debug(f"Adding neighbor: {new_location}")
+            logger.debug("Adding neighbor: {}", new_location)
             neighbors.append(new_location)
 
-        logger.debug(f"Total neighbors found: {len(neighbors)}")
+        logger.debug("Total neighbors found: {}", len(neighbors))
         return neighbors
 
-    def is_near(self, location: "Location", distance: int = settings.get("near", 5)) -> bool:
-        logger.debug(f"Checking if Location({self.x}, {self.y}) is near {location} within distance {distance}")
+    def is_near(self, location: "Location", distance: Optional[int] = None) -> bool:
+        if distance is None:
+            distance = settings.get_config().near
+        logger.debug("Checking if Location({}, {}) is near {} within distance {}", self.x, self.y, location, distance)
         result = self.distance_to(location) < distance
-        logger.debug(f"Is near result: {result}")
+        logger.debug("Is near result: {}", result)
         return result
@@ -7,29 +7,31 @@ from src.settings import settings
 from src.simulation.grid.structure.store.store import Store
 
 if TYPE_CHECKING:
+    from src.config import Config
     from src.simulation.grid.grid import Grid
     from src.simulation.grid.location import Location
 
 
 class Barn(Store):
     def __init__(self, grid: Grid, location: Location) -> None:
-        logger.debug(f"Initializing Barn at location {location}")
+        logger.debug("Initializing Barn at location {}", location)
 
+        config: Config = settings.get_config()
         allowed_resources = {
-            "food": settings.get("barn_food_store", 500),
-            "stone": settings.get("barn_stone_store", 100),
-            "wood": settings.get("barn_wood_store", 200),
+            "food": config.barn_food_store,
+            "stone": config.barn_stone_store,
+            "wood": config.barn_wood_store,
         }
 
-        logger.debug(f"Allowed resources for the Barn: {allowed_resources}")
+        logger.debug("Allowed resources for the Barn: {}", allowed_resources)
 
         super().__init__(
             grid,
             location,
-            settings.get("barn_size", 3),
-            settings.get("barn_size", 3),
-            settings.get("barn_char", "B"),
+            config.barn_size,
+            config.barn_size,
+            config.barn_char,
             allowed_resources,
         )
 
-        logger.info(f"Barn initialized at location {location} with allowed resources.")
+        logger.info("Barn initialized at location {} with allowed resources.", location)
@@ -20,7 +20,7 @@ class Structure(ABC):
         height: int,
         char: str,
     ):
-        logger.debug(f"Initializing structure at {location}, size: {width}x{height}, char: {char}")
+        logger.debug("Initializing structure at {}, size: {}x{}, char: {}", location, width, height, char)
 
         self._grid: Grid = grid
         self._location = location
@@ -29,6 +29,7 @@ class Structure(ABC):
         self._char: str = char
         if not self._grid.is_char(location, char):  # this is important for the first pass on the grid
             self._add_structure_on_grid()
+        self._grid.set_owner(location, width, height, location)
 
     def _validate_structure_area(self, is_adding: bool) -> None:
         """
@@ -39,27 +40,32 @@ class Structure(ABC):
         :param is_adding: True if adding a structure, False if removing a structure.
         """
         logger.debug(
-            f"Validating structure area at {self._location}, size: {self._width}x{self._height}, adding: {is_adding}"
+            "Validating structure area at {}, size: {}x{}, adding: {}",
+            self._location,
+            self._width,
+            self._height,
+            is_adding,
         )
 
-        for dy in range(self._height):
-            for dx in range(self._width):
-                location = Location(self._location.x + dx, self._location.y + dy)
-
-                # Check if the location is within bounds
-                if not self._grid.is_in_bounds(location):
-                    raise ValueError(f"Location {location} is out of bounds")
-
-                # Check if adding: location must be empty or contain a tree
-                if is_adding:
-                    if not self._grid.is_empty(location) and not self._grid.is_tree(location):
-                        raise ValueError(f"Location {location} is already occupied by another building or tree")
-                # Check if removing: location must be occupied by the structure
-                else:
+        far_corner = Location(self._location.x + self._width - 1, self._location.y + self._height - 1)
+        for location in (self._location, far_corner):
+            # Check if the location is within bounds
+            if not self._grid.is_in_bounds(location):
+                raise ValueError(f"Location {location} is out of bounds")
+
+        # Check if adding: every location must be empty or contain a tree
+        if is_adding:
+            if not self._grid.is_area_free(self._location, self._width, self._height):
+                raise ValueError(f"Area at {self._location} is already occupied by another building")
+        # Check if removing: every location must be occupied by the structure
+        else:
+            for dy in range(self._height):
+                for dx in range(self._width):
+                    location = Location(self._location.x + dx, self._location.y + dy)
                     if self._grid.get_grid()[location.y][location.x] != self._char:
                         raise ValueError(f"No structure found at {location} to remove")
 
-        logger.debug(f"Validation passed for area at {self._location}")
+        logger.debug("Validation passed for area at {}", self._location)
 
     def _add_structure_on_grid(self) -> None:
         """
@@ -67,9 +73,9 @@ class Structure(ABC):
         and ensuring no overlap with existing structures or trees.
         Construction can only start once all required resources are delivered.
         """
-        logger.debug(f"Adding structure at {self._location}, char: {self._char}")
+        logger.debug("Adding structure at {}, char: {}", self._location, self._char)
 
-        if self._char == settings.get("tree_char", "*"):
+        if self._char == settings.get_config().tree_char:
             return
 
         # Validate the area before placing the structure
@@ -79,12 +85,12 @@ class Structure(ABC):
         for dy in range(self._height):
             for dx in range(self._width):
                 location = Location(self._location.x + dx, self._location.y + dy)
-                self._grid.get_grid()[location.y][location.x] = self._char
+                self._grid.set_char(location, self._char)
 
-        logger.info(f"Structure added at {self._location}, char: {self._char}")
+        logger.info("Structure added at {}, char: {}", self._location, self._char)
 
     def remove(self) -> None:
-        logger.debug(f"Removing structure at {self._location}, char: {self._char}")
+        logger.debug("Removing structure at {}, char: {}", self._location, self._char)
         self._remove_structure_on_grid()
 
     def _remove_structure_on_grid(self) -> None:
@@ -93,7 +99,7 @@ class Structure(ABC):
         occupied by the structure. It checks if the structure is present at the
         specified location and only removes it if no other structures are in the way.
         """
-        logger.debug(f"Removing structure at {self._location}, char: {self._char}")
+        logger.debug("Removing structure at {}, char: {}", self._location, self._char)
 
         # Validate the area before removing the structure
         self._validate_structure_area(is_adding=False)
@@ -103,9 +109,10 @@ class Structure(ABC):
             for dx in range(self._width):
                 location = Location(self._location.x + dx, self._location.y + dy)
                 # Clear the cell (remove the structure)
-                self._grid.get_grid()[location.y][location.x] = settings.get("empty_char", " ")
+                self._grid.set_char(location, settings.get_config().empty_char)
+        self._grid.set_owner(self._location, self._width, self._height, None)
 
-        logger.info(f"Structure removed at {self._location}, char: {self._char}")
+        logger.info("Structure removed at {}, char: {}", self._location, self._char)
 
     def get_location(self):
         return self._location
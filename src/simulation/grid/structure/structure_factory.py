@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import logging
 from typing import TYPE_CHECKING, Dict, Type
 
+from src.logger import logger
 from src.simulation.grid.structure.store.barn import Barn
 from src.simulation.grid.structure.store.home import Home
 from src.simulation.grid.structure.structure import Structure
@@ -19,10 +19,6 @@ if TYPE_CHECKING:
     from src.simulation.grid.grid import Grid
     from src.simulation.grid.location import Location
 
-# Set up logging
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-
 
 class StructureFactory:
     _constructors: Dict[StructureType, Type[Structure]] = {
@@ -39,18 +35,18 @@ class StructureFactory:
 
     def __init__(self, grid: Grid) -> None:
         self._grid = grid
-        logger.debug(f"StructureFactory initialized with grid: {self._grid}")
+        logger.debug("StructureFactory initialized with grid: {}", self._grid)
 
     def create_instance(self, building_type: StructureType, location: Location) -> Structure:
-        logger.debug(f"Creating structure of type {building_type} at location {location}")
+        logger.debug("Creating structure of type {} at location {}", building_type, location)
 
         # Check if building_type is valid
         if building_type not in self._constructors:
-            logger.error(f"Invalid structure type: {building_type}")
+            logger.error("Invalid structure type: {}", building_type)
             raise ValueError(f"Invalid structure type: {building_type}")
 
         building_class: Type[Structure] = self._constructors[building_type]
         structure = building_class(self._grid, location)
 
-        logger.info(f"Structure of type {building_type} created at location {location}")
+        logger.info("Structure of type {} created at location {}", building_type, location)
         return structure
@@ -7,31 +7,34 @@ from src.settings import settings
 from src.simulation.grid.structure.work.construction.construction import Construction
 
 if TYPE_CHECKING:
+    from src.config import Config
     from src.simulation.grid.grid import Grid
     from src.simulation.grid.location import Location
 
 
 class ConstructionFarm(Construction):
     def __init__(self, grid: Grid, location: Location):
-        logger.debug(f"Initializing ConstructionFarm at location {location}")
+        logger.debug("Initializing ConstructionFarm at location {}", location)
 
+        config: Config = settings.get_config()
         super().__init__(
             grid,
             location,
-            settings.get("farm_size", 5),
-            settings.get("farm_size", 5),
-            settings.get("farm_construction_char", "f"),
-            required_wood=settings.get("farm_req_wood", 30),
-            required_stone=settings.get("farm_req_stone", 0),
-            max_work_count=settings.get("farm_max_construction_work_count", 2),
-            max_worker_count=settings.get("farm_max_construction_worker_count", 3),
-            finished_completion_level=settings.get("farm_finished_completion_level", 3),
+            config.farm_size,
+            config.farm_size,
+            config.farm_construction_char,
+            required_wood=config.farm_req_wood,
+            required_stone=config.farm_req_stone,
+            max_work_count=config.farm_max_construction_work_count,
+            max_worker_count=config.farm_max_construction_worker_count,
+            finished_completion_level=config.farm_finished_completion_level,
         )
 
         logger.info(
-            f"ConstructionFarm initialized with required wood: {settings.get('farm_req_wood', 30)}, "
-            f"required stone: {settings.get('farm_req_stone', 0)}, "
-            f"max workers: {settings.get('farm_max_construction_worker_count', 3)}, "
-            f"max work count: {settings.get('farm_max_construction_work_count', 2)}, "
-            f"finished completion level: {settings.get('farm_finished_completion_level', 3)}"
+            "ConstructionFarm initialized with required wood: {}, required stone: {}, max workers: {}, max work count: {}, finished completion level: {}",
+            config.farm_req_wood,
+            config.farm_req_stone,
+            config.farm_max_construction_worker_count,
+            config.farm_max_construction_work_count,
+            config.farm_finished_completion_level,
         )
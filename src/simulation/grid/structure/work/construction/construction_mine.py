@@ -7,31 +7,34 @@ from src.settings import settings
 from src.simulation.grid.structure.work.construction.construction import Construction
 
 if TYPE_CHECKING:
+    from src.config import Config
     from src.simulation.grid.grid import Grid
     from src.simulation.grid.location import Location
 
 
 class ConstructionMine(Construction):
     def __init__(self, grid: Grid, location: Location):
-        logger.debug(f"Initializing ConstructionMine at location {location}")
+        logger.debug("Initializing ConstructionMine at location {}", location)
 
+        config: Config = settings.get_config()
         super().__init__(
             grid,
             location,
-            settings.get("mine_size", 3),
-            settings.get("mine_size", 3),
-            settings.get("mine_construction_char", "m"),
-            required_wood=settings.get("mine_req_wood", 40),
-            required_stone=settings.get("mine_req_stone", 40),
-            max_work_count=settings.get("mine_max_construction_work_count", 5),
-            max_worker_count=settings.get("mine_max_construction_worker_count", 3),
-            finished_completion_level=settings.get("mine_finished_completion_level", 5),
+            config.mine_size,
+            config.mine_size,
+            config.mine_construction_char,
+            required_wood=config.mine_req_wood,
+            required_stone=config.mine_req_stone,
+            max_work_count=config.mine_max_construction_work_count,
+            max_worker_count=config.mine_max_construction_worker_count,
+            finished_completion_level=config.mine_finished_completion_level,
         )
 
         logger.info(
-            f"ConstructionMine initialized with required wood: {settings.get('mine_req_wood', 40)}, "
-            f"required stone: {settings.get('mine_req_stone', 40)}, "
-            f"max workers: {settings.get('mine_max_construction_worker_count', 3)}, "
-            f"max work count: {settings.get('mine_max_construction_work_count', 5)}, "
-            f"finished completion level: {settings.get('mine_finished_completion_level', 5)}"
+            "ConstructionMine initialized with required wood: {}, required stone: {}, max workers: {}, max work count: {}, finished completion level: {}",
+            config.mine_req_wood,
+            config.mine_req_stone,
+            config.mine_max_construction_worker_count,
+            config.mine_max_construction_work_count,
+            config.mine_finished_completion_level,
         )
@@ -9,25 +9,28 @@ from src.settings import settings
 from src.simulation.grid.structure.work.work import Work
 
 if TYPE_CHECKING:
+    from src.config import Config
     from src.simulation.grid.grid import Grid
     from src.simulation.grid.location import Location
 
 
 class Farm(Work):
     def __init__(self, grid: Grid, location: Location) -> None:
-        logger.debug(f"Initializing Farm at location {location}")
+        logger.debug("Initializing Farm at location {}", location)
 
-        max_worker_count: int = settings.get("farm_max_worker_count", 3)
-        max_work_count: int = settings.get("farm_max_work_count", 3)
-        yield_variance = np.random.normal(
-            loc=settings.get("farm_yield_var_loc", 0), scale=settings.get("farm_yield_var_scale", 4)
-        )
+        config: Config = settings.get_config()
+        self._min_yield: float = config.farm_min_yield
+        self._max_yield: float = config.farm_max_yield
+
+        max_worker_count: int = config.farm_max_worker_count
+        max_work_count: int = config.farm_max_work_count
+        yield_variance = np.random.normal(loc=config.farm_yield_var_loc, scale=config.farm_yield_var_scale)
         super().__init__(
             grid,
             location,
-            settings.get("farm_size", 5),
-            settings.get("farm_size", 5),
-            settings.get("farm_char", "F"),
+            config.farm_size,
+            config.farm_size,
+            config.farm_char,
             max_worker_count,
             max_work_count,
             self._get_yield,
@@ -35,10 +38,11 @@ class Farm(Work):
         )
 
         logger.info(
-            f"Farm initialized with max workers: {max_worker_count}, "
-            f"max work count: {max_work_count}, "
-            f"yield variance: {yield_variance:.2f}, "
-            f"size: {settings.get('farm_size', 5)}"
+            "Farm initialized with max workers: {}, max work count: {}, yield variance: {:.2f}, size: {}",
+            max_worker_count,
+            max_work_count,
+            yield_variance,
+            config.farm_size,
         )
 
     def _get_yield(self) -> float:
@@ -59,12 +63,12 @@ class Farm(Work):
         yield_factor: float = np.exp(-((temp - optimal_temp) ** 2) / (2 * std_dev_temp**2))
 
         # Scale the yield factor to the desired range (25 to 50 food)
-        min_yield: float = settings.get("farm_min_yield", 25)
-        max_yield: float = settings.get("farm_max_yield", 50)
+        min_yield: float = self._min_yield
+        max_yield: float = self._max_yield
 
         # Linearly scale the yield factor to range between min_yield and max_yield
         adjusted_yield: float = min_yield + (max_yield - min_yield) * yield_factor
 
-        logger.debug(f"Calculated farm yield: {adjusted_yield:.2f} (Temperature: {temp}°F)")
+        logger.debug("Calculated farm yield: {:.2f} (Temperature: {}°F)", adjusted_yield, temp)
 
         return adjusted_yield
@@ -9,28 +9,28 @@ from src.settings import settings
 from src.simulation.grid.structure.work.work import Work
 
 if TYPE_CHECKING:
+    from src.config import Config
     from src.simulation.grid.grid import Grid
     from src.simulation.grid.location import Location
 
 
 class Mine(Work):
     def __init__(self, grid: Grid, location: Location) -> None:
-        logger.debug(f"Initializing Mine at location {location}")
+        logger.debug("Initializing Mine at location {}", location)
 
-        max_worker_count: int = settings.get("mine_max_worker_count", 6)
-        max_work_count: int = settings.get("mine_max_work_count", 4)
+        config: Config = settings.get_config()
+        max_worker_count: int = config.mine_max_worker_count
+        max_work_count: int = config.mine_max_work_count
         yield_func: Callable[[], float] = lambda: np.random.normal(
-            loc=settings.get("mine_yield_func_loc", 3), scale=settings.get("mine_yield_func_scale", 1)
-        )
-        yield_variance = np.random.normal(
-            loc=settings.get("mine_yield_var_loc", 3), scale=settings.get("mine_yield_var_scale", 0.9)
+            loc=config.mine_yield_func_loc, scale=config.mine_yield_func_scale
         )
+        yield_variance = np.random.normal(loc=config.mine_yield_var_loc, scale=config.mine_yield_var_scale)
         super().__init__(
             grid,
             location,
-            settings.get("mine_size", 3),
-            settings.get("mine_size", 3),
-            settings.get("mine_char", "M"),
+            config.mine_size,
+            config.mine_size,
+            config.mine_char,
             max_worker_count,
             max_work_count,
             yield_func,
@@ -38,8 +38,9 @@ class Mine(Work):
         )
 
         logger.info(
-            f"Mine initialized with max workers: {max_worker_count}, "
-            f"max work count: {max_work_count}, "
-            f"yield variance: {yield_variance:.2f}, "
-            f"size: {settings.get('mine_size', 3)}"
+            "Mine initialized with max workers: {}, max work count: {}, yield variance: {:.2f}, size: {}",
+            max_worker_count,
+            max_work_count,
+            yield_variance,
+            config.mine_size,
         )
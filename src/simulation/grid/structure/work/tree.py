@@ -9,28 +9,28 @@ from src.settings import settings
 from src.simulation.grid.structure.work.work import Work
 
 if TYPE_CHECKING:
+    from src.config import Config
     from src.simulation.grid.grid import Grid
     from src.simulation.grid.location import Location
 
 
 class Tree(Work):
     def __init__(self, grid: Grid, location: Location) -> None:
-        logger.debug(f"Initializing Tree at location {location}")
+        logger.debug("Initializing Tree at location {}", location)
 
-        max_worker_count: int = settings.get("tree_max_worker_count", 1)
-        max_work_count: int = settings.get("tree_max_work_count", 2)
+        config: Config = settings.get_config()
+        max_worker_count: int = config.tree_max_worker_count
+        max_work_count: int = config.tree_max_work_count
         yield_func: Callable[[], float] = lambda: np.random.normal(
-            loc=settings.get("tree_yield_func_loc", 3), scale=settings.get("tree_yield_func_scale", 1)
-        )
-        yield_variance = np.random.normal(
-            loc=settings.get("tree_yield_var_loc", 3), scale=settings.get("tree_yield_var_scale", 0.9)
+            loc=config.tree_yield_func_loc, scale=config.tree_yield_func_scale
         )
+        yield_variance = np.random.normal(loc=config.tree_yield_var_loc, scale=config.tree_yield_var_scale)
         super().__init__(
             grid,
             location,
-            settings.get("tree_size", 1),
-            settings.get("tree_size", 1),
-            settings.get("tree_char", "*"),
+            config.tree_size,
+            config.tree_size,
+            config.tree_char,
             max_worker_count,
             max_work_count,
             yield_func,
@@ -38,8 +38,9 @@ class Tree(Work):
         )
 
         logger.debug(
-            f"Tree initialized with max workers: {max_worker_count}, "
-            f"max work count: {max_work_count}, "
-            f"yield variance: {yield_variance:.2f}, "
-            f"size: {settings.get('tree_size', 1)}"
+            "Tree initialized with max workers: {}, max work count: {}, yield variance: {:.2f}, size: {}",
+            max_worker_count,
+            max_work_count,
+            yield_variance,
+            config.tree_size,
         )
@@ -33,10 +33,10 @@ class StructureGenerator:
                 location: Location = Location(x, y)
 
                 if self._grid.is_empty(location):
-                    logger.debug(f"Location {location} is empty. Skipping.")
+                    logger.debug("Location {} is empty. Skipping.", location)
                     continue
 
-                logger.debug(f"Processing location {location}.")
+                logger.debug("Processing location {}.", location)
 
                 # Determine the structure type
                 if self._grid.is_tree(location):
@@ -58,28 +58,31 @@ class StructureGenerator:
                 elif self._grid.is_construction_mine(location):
                     structure_type = StructureType.CONSTRUCTION_MINE
                 else:
-                    logger.error(f"Unknown structure at location {location}.")
+                    logger.error("Unknown structure at location {}.", location)
                     raise Exception("I see a char you didnt tell me about")
 
-                if structure_type != StructureType.TREE:
-                    self._grid.find_top_left_corner(location)
+                # cells are visited row by row, so the first cell seen of a structure is its top left corner
+                # and every later cell of it already has an owner
+                if self._grid.get_owner(location) is not None:
+                    logger.debug("Location {} belongs to an existing structure. Skipping.", location)
+                    continue
 
                 # Create and store structure
                 if location not in structures:
-                    logger.debug(f"Creating structure of type {structure_type} at location {location}.")
+                    logger.debug("Creating structure of type {} at location {}.", structure_type, location)
                     structure = self._structure_factory.create_instance(structure_type, location)
                     if structure:
                         structures[location] = structure
                     else:
-                        logger.warning(f"Failed to create structure at location {location}.")
+                        logger.warning("Failed to create structure at location {}.", location)
 
         self._group_tree_yields(list(structures.values()))
 
-        logger.debug(f"Found {len(structures)} structures.")
+        logger.debug("Found {} structures.", len(structures))
         return structures
 
     def _group_tree_yields(self, structures: List[Structure]) -> None:
-        logger.debug(f"Grouping trees and generating yields for {len(structures)} structures.")
+        logger.debug("Grouping trees and generating yields for {} structures.", len(structures))
         trees: List[Tree] = []
         tree_index: Dict[Location, int] = {}
         index: int = 0
@@ -91,7 +94,7 @@ class StructureGenerator:
                 index += 1
                 trees.append(structure)
 
-        logger.debug(f"Found {len(trees)} trees.")
+        logger.debug("Found {} trees.", len(trees))
 
         ds: DisjointSet = DisjointSet(len(trees))
         directions: List[Tuple[int, int]] = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
@@ -106,11 +109,11 @@ class StructureGenerator:
                 if (
                     0 <= nx < self._grid.get_height()
                     and 0 <= ny < self._grid.get_width()
-                    and self._grid.get_grid()[nx][ny] == settings.get("tree_char", "*")
+                    and self._grid.get_grid()[nx][ny] == settings.get_config().tree_char
                 ):
                     neighbor_location: Location = Location(nx, ny)
                     if neighbor_location in tree_index:
-                        logger.debug(f"Connecting tree at {location} with neighbor {neighbor_location}.")
+                        logger.debug("Connecting tree at {} with neighbor {}.", location, neighbor_location)
                         ds.union(tree_index[location], tree_index[neighbor_location])
 
         grove_groups: Dict[int, List[Tree]] = {}
@@ -127,7 +130,7 @@ class StructureGenerator:
 
         groves: List[List[Tree]] = list(grove_groups.values())
 
-        logger.debug(f"Generated {len(groves)} groves.")
+        logger.debug("Generated {} groves.", len(groves))
         for grove in groves:
             yield_func: Callable[[], float] = self._generate_random_distribution(10, 50)
             for tree in grove:
@@ -135,7 +138,7 @@ class StructureGenerator:
 
     @staticmethod
     def _generate_random_distribution(min_val: float, max_val: float) -> Callable[[], float]:
-        logger.debug(f"Generating random distribution with min={min_val} and max={max_val}.")
+        logger.debug("Generating random distribution with min={} and max={}.", min_val, max_val)
         if min_val >= max_val:
             logger.error("min_val should be less than max_val")
             raise ValueError("min_val should be less than max_val")
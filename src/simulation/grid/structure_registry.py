@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Type
+
+from src.logger import logger
+from src.simulation.grid.structure.structure import Structure
+from src.simulation.grid.structure.work.tree import Tree
+
+if TYPE_CHECKING:
+    from src.simulation.grid.location import Location
+    from src.simulation.grid.structure.work.construction.construction import Construction
+    from src.simulation.grid.structure.work.work import Work
+
+
+class StructureRegistry:
+    """
+    Every structure on the grid by its top left corner, also indexed by every structure class it is an instance of.
+    Type queries cost the size of their result instead of a scan over every structure, most of which are trees.
+    """
+
+    def __init__(self, structures: Dict[Location, Structure]) -> None:
+        self._structures: Dict[Location, Structure] = {}
+        self._by_type: Dict[Type[Structure], Dict[Location, Structure]] = {}
+        self._buildings: Dict[Location, Structure] = {}  # everything that isn't a tree
+        self._staffed: Dict[Location, Work] = {}  # work structures that have someone working at them
+        self._completed: Dict[Location, Construction] = {}  # constructions waiting to become buildings
+        for location, structure in structures.items():
+            self.add(location, structure)
+        logger.debug("Registered {} structures of {} types.", len(self._structures), len(self._by_type))
+
+    def __len__(self) -> int:
+        return len(self._structures)
+
+    def __contains__(self, location: Location) -> bool:
+        return location in self._structures
+
+    def get(self, location: Location) -> Optional[Structure]:
+        return self._structures.get(location)
+
+    def get_locations(self) -> List[Location]:
+        return list(self._structures.keys())
+
+    def get_by_type(self, structure_type: Type[Structure]) -> Dict[Location, Structure]:
+        """The structures that are instances of structure_type, treat it as read only."""
+        return self._by_type.get(structure_type, {})
+
+    def get_buildings(self) -> Dict[Location, Structure]:
+        """The structures that are not trees, treat it as read only."""
+        return self._buildings
+
+    def get_staffed(self) -> List[Work]:
+        return list(self._staffed.values())
+
+    def get_completed(self) -> List[Construction]:
+        return list(self._completed.values())
+
+    def add(self, location: Location, structure: Structure) -> None:
+        """Register structure at location, replacing whatever was registered there."""
+        old = self._structures.get(location)
+        if old is not None:
+            self._unindex(location, old)
+        self._structures[location] = structure
+        for structure_type in self._get_types(structure):
+            self._by_type.setdefault(structure_type, {})[location] = structure
+        if not isinstance(structure, Tree):
+            self._buildings[location] = structure
+
+    def remove(self, location: Location) -> Optional[Structure]:
+        structure = self._structures.pop(location, None)
+        if structure is not None:
+            self._unindex(location, structure)
+        return structure
+
+    def add_staffed(self, work: Work) -> None:
+        location = work.get_location()
+        if self._structures.get(location) is work:
+            self._staffed[location] = work
+
+    def remove_staffed(self, work: Work) -> None:
+        location = work.get_location()
+        if self._staffed.get(location) is work:
+            del self._staffed[location]
+
+    def add_completed(self, construction: Construction) -> None:
+        location = construction.get_location()
+        if self._structures.get(location) is construction:
+            self._completed[location] = construction
+
+    def _unindex(self, location: Location, structure: Structure) -> None:
+        for structure_type in self._get_types(structure):
+            del self._by_type[structure_type][location]
+        self._buildings.pop(location, None)
+        self._staffed.pop(location, None)
+        self._completed.pop(location, None)
+
+    @staticmethod
+    def _get_types(structure: Structure) -> List[Type[Structure]]:
+        return [cls for cls in type(structure).__mro__ if issubclass(cls, Structure)]
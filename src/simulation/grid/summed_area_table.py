@@ -0,0 +1,68 @@
+import numpy as np
+
+from src.logger import logger
+
+
+class SummedAreaTable:
+    """
+    Integral image over a boolean mask, answers how many cells of any rectangle are set in O(1).
+    Rectangles are given by their top left corner and are clipped to the mask.
+    """
+
+    def __init__(self, mask: np.ndarray) -> None:
+        logger.debug("Building summed area table of shape {}.", mask.shape)
+        self._mask: np.ndarray = mask.astype(bool)
+        self._height, self._width = mask.shape
+        # _table[y, x] is the number of set cells above and left of (x, y)
+        self._table: np.ndarray = np.zeros((self._height + 1, self._width + 1), dtype=np.int64)
+        self._table[1:, 1:] = self._mask.cumsum(axis=0).cumsum(axis=1)
+
+    def count(self, x: int, y: int, width: int, height: int) -> int:
+        x0, y0 = min(max(x, 0), self._width), min(max(y, 0), self._height)
+        x1, y1 = min(max(x + width, 0), self._width), min(max(y + height, 0), self._height)
+        if x1 <= x0 or y1 <= y0:
+            return 0
+        table = self._table
+        return int(table[y1, x1] - table[y0, x1] - table[y1, x0] + table[y0, x0])
+
+    def is_empty(self, x: int, y: int, width: int, height: int) -> bool:
+        return self.count(x, y, width, height) == 0
+
+    def set_region(self, x: int, y: int, values: np.ndarray) -> None:
+        """Overwrite the mask with values at (x, y) and update only the part of the table it affects."""
+        logger.debug("Updating summed area table region of shape {} at ({}, {}).", values.shape, x, y)
+        region_height, region_width = values.shape
+        region = (slice(y, y + region_height), slice(x, x + region_width))
+        delta = values.astype(np.int64) - self._mask[region]
+        if not delta.any():
+            return
+        self._mask[region] = values
+
+        # every table entry below and right of the region grows by the delta it covers
+        spread = np.zeros((self._height - y, self._width - x), dtype=np.int64)
+        spread[:region_height, :region_width] = delta
+        self._table[y + 1 :, x + 1 :] += spread.cumsum(axis=0).cumsum(axis=1)
+
+    def set(self, x: int, y: int, value: bool) -> None:
+        """Overwrite one cell of the mask, like set_region with a 1x1 region but without the spreading."""
+        delta = int(value) - int(self._mask[y, x])
+        if delta:
+            self._mask[y, x] = value
+            self._table[y + 1 :, x + 1 :] += delta
+
+    def get_empty_top_lefts(self, width: int, height: int, buffer: int = 0) -> np.ndarray:
+        """
+        Boolean matrix, indexed [y, x], that is True where a width x height rectangle with its top left corner
+        at (x, y) fits inside the mask and the rectangle grown by buffer on every side (clipped) is empty.
+        """
+        xs = np.arange(self._width)
+        ys = np.arange(self._height)
+        x0 = np.clip(xs - buffer, 0, self._width)[np.newaxis, :]
+        x1 = np.clip(xs + width + buffer, 0, self._width)[np.newaxis, :]
+        y0 = np.clip(ys - buffer, 0, self._height)[:, np.newaxis]
+        y1 = np.clip(ys + height + buffer, 0, self._height)[:, np.newaxis]
+
+        table = self._table
+        counts = table[y1, x1] - table[y0, x1] - table[y1, x0] + table[y0, x0]
+        fits = ((xs + width) <= self._width)[np.newaxis, :] & ((ys + height) <= self._height)[:, np.newaxis]
+        return fits & (counts == 0)
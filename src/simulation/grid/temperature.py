@@ -1,6 +1,7 @@
 import numpy as np
 
 from src.logger import logger
+from src.config import Config
 from src.settings import settings
 
 
@@ -22,24 +23,29 @@ def get_temperature_for_day(
     """
 
     # Ensure the day_of_year is within the valid range (1 to 30)
-    if not (1 <= day_of_year <= settings.get("days_per_year", 30)):
-        logger.error(f"Invalid day_of_year: {day_of_year}. Must be between 1 and 30.")
+    config: Config = settings.get_config()
+    if not (1 <= day_of_year <= config.days_per_year):
+        logger.error("Invalid day_of_year: {}. Must be between 1 and 30.", day_of_year)
         raise ValueError("day_of_year must be between 1 and 365")
     logger.debug(
-        f"Getting temperature for day {day_of_year} with mean={mean_temp_f}, amplitude={amplitude_f}, std_dev={std_dev_f}"
+        "Getting temperature for day {} with mean={}, amplitude={}, std_dev={}",
+        day_of_year,
+        mean_temp_f,
+        amplitude_f,
+        std_dev_f,
     )
 
     # Calculate the seasonal variation using a sine wave
-    seasonal_variation_f = amplitude_f * np.sin(2 * np.pi * (day_of_year - 81) / settings.get("days_per_year", 30))
-    logger.debug(f"Seasonal variation for day {day_of_year}: {seasonal_variation_f:.2f}°F")
+    seasonal_variation_f = amplitude_f * np.sin(2 * np.pi * (day_of_year - 81) / config.days_per_year)
+    logger.debug("Seasonal variation for day {}: {:.2f}°F", day_of_year, seasonal_variation_f)
 
     # The mean of the normal distribution is the mean_temp adjusted by the seasonal variation
     temp_mean_f = mean_temp_f + seasonal_variation_f
-    logger.debug(f"Adjusted mean temperature for day {day_of_year}: {temp_mean_f:.2f}°F")
+    logger.debug("Adjusted mean temperature for day {}: {:.2f}°F", day_of_year, temp_mean_f)
 
     # Generate a random temperature based on the normal distribution
     temperature_f = np.random.normal(loc=temp_mean_f, scale=std_dev_f)
-    logger.debug(f"Generated temperature for day {day_of_year}: {temperature_f:.2f}°F")
+    logger.debug("Generated temperature for day {}: {:.2f}°F", day_of_year, temperature_f)
 
     return temperature_f
 
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from typing import TYPE_CHECKING, Dict, Iterator, List
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 
 from src.settings import settings
 from src.logger import logger
 from src.simulation.people.home_manager import HomeManager
 from src.simulation.people.people_disaster_generator import PeopleDisasterGenerator
 from src.simulation.people.people_generator import PeopleGenerator
+from src.simulation.people.stuck_detector import StuckDetector
 
 if TYPE_CHECKING:
+    from src.config import Config
     from person.person import Person
 
     from src.simulation.grid.grid import Grid
@@ -25,6 +26,7 @@ class People:
         self._people: List[Person] = self._people_generator.generate()
         self._disaster_generator: PeopleDisasterGenerator = PeopleDisasterGenerator(self)
         self._home_manager: HomeManager = HomeManager(self)
+        self._stuck_detector: StuckDetector = StuckDetector(self, self._grid)
 
     def take_actions_for_day(self) -> None:
         for action in range(self._actions_per_day):
@@ -35,12 +37,12 @@ class People:
                     dead.append(person)
                     continue
                 person.take_action()
-                logger.debug(f"{person.get_name()} should have taken action for the {action} time.")
+                logger.debug("{} should have taken action for the {} time.", person.get_name(), action)
                 logger.debug("These people are talking a lot and should have gotten others memories.")
             for person in dead:
                 person.divorce()
                 self._people.remove(person)
-                logger.info(f"{person.get_name()} is dead. Their spouse is widowed. :(")
+                logger.info("{} is dead. Their spouse is widowed. :(", person.get_name())
             if action % 3 == 0:
                 self._grid.work_structures_exchange_memories()  # workers talk while working
 
@@ -48,16 +50,15 @@ class People:
         self._home_manager.swap_homes()
 
     def kill_stuck(self) -> None:
-        for person in self._people:
-            if person.is_stuck():
-                person.kill()  # they got stuck and died
-                self._people.remove(person)
-                logger.info(f"{person.get_name()} got stuck and died. :(")
+        for person in self._stuck_detector.get_stuck_people():
+            person.kill()  # they got stuck and died
+            self._people.remove(person)
+            logger.info("{} got stuck and died. :(", person.get_name())
 
     def spouses_share_memory(self):
         for person in self.get_married_people():
             person.exchange_memories(person.get_spouse())
-            logger.debug(f"{person.get_name()} and {person.get_spouse().get_name()} should have shared memories.")
+            logger.debug("{} and {} should have shared memories.", person.get_name(), person.get_spouse().get_name())
 
     def get_time(self) -> int:
         return self._simulation.get_time()
@@ -70,9 +71,11 @@ class People:
         for person in self._people:
             person.get_scheduler().flush()
 
-    def generate_disasters(self, chance: float = settings.get("disaster_chance", 0.50)) -> None:
+    def generate_disasters(self, chance: Optional[float] = None) -> None:
+        if chance is None:
+            chance = settings.get_config().disaster_chance
         self._disaster_generator.generate(chance)
-        logger.debug(f"Disasters generated at chance of {chance}")
+        logger.debug("Disasters generated at chance of {}", chance)
 
     def print(self) -> None:
         for person in self._people:
@@ -81,7 +84,7 @@ class People:
     def age(self) -> None:
         for person in self._people:
             person.age()
-        logger.info(f"{len(self._people)} people aged by one year")
+        logger.info("{} people aged by one year", len(self._people))
 
     def __len__(self) -> int:
         return len(self._people)
@@ -91,7 +94,7 @@ class People:
         for person in self._people:
             average_health += person.get_health()
         average_health /= len(self._people)
-        logger.debug(f"{len(self._people)} people have average of {average_health:.2f} health")
+        logger.debug("{} people have average of {:.2f} health", len(self._people), average_health)
         return average_health
 
     def get_average_hunger(self) -> float:
@@ -99,21 +102,25 @@ class People:
         for person in self._people:
             average_hunger += person.get_hunger()
         average_hunger /= len(self._people)
-        logger.debug(f"{len(self._people)} people have average of {average_hunger:.2f} hunger")
+        logger.debug("{} people have average of {:.2f} hunger", len(self._people), average_hunger)
         return average_hunger
 
     def make_babies(self) -> None:
+        config: Config = settings.get_config()
         for person in self.get_married_people():
             if (
-                (person.get_age() >= settings.get("adult_age", 18))
-                and (person.get_age() <= settings.get("infertile_age", 50))
-                and (person.get_spouse().get_age() >= settings.get("adult_age", 18))
-                and (person.get_spouse().get_age() <= settings.get("infertile_age", 50))
+                (person.get_age() >= config.adult_age)
+                and (person.get_age() <= config.infertile_age)
+                and (person.get_spouse().get_age() >= config.adult_age)
+                and (person.get_spouse().get_age() <= config.infertile_age)
             ):
                 # create a baby next to the person's house
-                baby = self._people_generator.make_baby(deepcopy(person.get_location()))
+                baby = self._people_generator.make_baby(person.get_location())
                 logger.debug(
-                    f"Baby {baby} born at {person.get_location()}. Parents house is at {person.get_home().get_location()}"
+                    "Baby {} born at {}. Parents house is at {}",
+                    baby,
+                    person.get_location(),
+                    person.get_home().get_location(),
                 )
                 self._people.append(baby)
 
@@ -128,7 +135,7 @@ class People:
                 continue
             visited_people.append(person)
             visited_people.append(person.get_spouse())
-            logger.debug(f"{person.get_name()} is married to {person.get_spouse().get_name()}")
+            logger.debug("{} is married to {}", person.get_name(), person.get_spouse().get_name())
             if not person.has_home():
                 continue
             married_people.append(person)
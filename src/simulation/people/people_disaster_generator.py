@@ -50,7 +50,7 @@ class PeopleDisasterGenerator:
 
                 # Increment the disaster count for the chosen disaster
                 self._disaster_counts[disaster_name] += 1
-                logger.info(f"Oh no! {disaster_name} disaster at severity {severity}")
+                logger.info("Oh no! {} disaster at severity {}", disaster_name, severity)
 
     def get_disaster_counts(self) -> Dict[str, int]:
         """Return the current disaster count statistics."""
@@ -77,21 +77,21 @@ class PeopleDisasterGenerator:
                 person.divorce()
                 visited.add(person)
                 visited.add(spouse)
-                logger.debug(f"{person.get_name()} and {spouse.get_name()} are divorced.")
+                logger.debug("{} and {} are divorced.", person.get_name(), spouse.get_name())
 
     def _sickness(self, severity: int) -> None:
         """Person gets sick, losing health."""
         affected_people = self._get_affected_people(severity, 0.1)
         for person in affected_people:
-            person.set_health(settings.get("sick_health_decr", -30))  # arbitrary decrement value
-            logger.debug(f"{person.get_name()} got sick. Health: {person.get_health()}")
+            person.set_health(settings.get_config().sick_health_decr)  # arbitrary decrement value
+            logger.debug("{} got sick. Health: {}", person.get_name(), person.get_health())
 
     def _craving(self, severity: int) -> None:
         """Craving causes hunger to increase."""
         affected_people = self._get_affected_people(severity, 0.1)
         for person in affected_people:
-            person.set_hunger(settings.get("sick_hunger_decr", -30))  # arbitrary decrement value
-            logger.debug(f"{person.get_name()} has craving. Hunger: {person.get_hunger()}")
+            person.set_hunger(settings.get_config().craving_hunger_decr)  # arbitrary decrement value
+            logger.debug("{} has craving. Hunger: {}", person.get_name(), person.get_hunger())
 
     def _death(self, severity: int) -> None:
         """A bunch of people die."""
@@ -99,13 +99,13 @@ class PeopleDisasterGenerator:
         for person in affected_people:
             person.kill()  # person is dead
             self._people.get_people().remove(person)
-            logger.debug(f"{person.get_name()} died from a disaster. :(")
+            logger.debug("{} died from a disaster. :(", person.get_name())
 
     def _forget_tasks(self, severity: int) -> None:
         """Person forgets their tasks."""
         affected_people = self._get_affected_people(severity, 0.1)
         for person in affected_people:
-            logger.debug(f"{person.get_name()} forgot their tasks.")
+            logger.debug("{} forgot their tasks.", person.get_name())
             person = Scheduler(person.get_simulation(), person)
             person.flush()
 
@@ -115,7 +115,7 @@ class PeopleDisasterGenerator:
         for person in affected_people:
             # send person to a random corner of the grid.
             person.set_location(Location(0, 0))
-            logger.debug(f"{person.get_name()} sleepwalked into the woods.")
+            logger.debug("{} sleepwalked into the woods.", person.get_name())
 
     def _so_many_babies(self, severity: int) -> None:
         """A person or group has a baby boom."""
@@ -123,13 +123,13 @@ class PeopleDisasterGenerator:
         if severity > 5:
             people.make_babies()  # triplets
         people.make_babies()  # twins
-        logger.debug(f"{len(people)} people had a baby boom.")
+        logger.debug("{} people had a baby boom.", len(people))
 
     def _get_affected_people(self, severity: int, percent: float) -> People:
         percent_affected = severity * percent
         people = self._people.get_people()
         random.shuffle(people)
         num_affected = int(len(people) * percent_affected)
-        logger.debug(f"percent affected: {percent_affected}.")
-        logger.debug(f"Number of total people: {len(people)}. Number of affected people: {num_affected}")
+        logger.debug("percent affected: {}.", percent_affected)
+        logger.debug("Number of total people: {}. Number of affected people: {}", len(people), num_affected)
         return random.sample(people, num_affected)
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import os
 import random
-from copy import deepcopy
 from typing import TYPE_CHECKING, List
 
 from src.logger import logger
@@ -11,6 +10,7 @@ from src.simulation.grid.structure.store.home import Home
 from src.simulation.people.person.person import Person
 
 if TYPE_CHECKING:
+    from src.config import Config
     from src.simulation.grid.location import Location
     from src.simulation.simulation import Simulation
 
@@ -64,15 +64,14 @@ class PeopleGenerator:
         people: List[Person] = []
         names: List[str] = self._get_names()
         empty_spots_near_town: List[Location] = self._grid.get_empty_spots_near_town()
+        config: Config = settings.get_config()
         for pk in range(self._max_pk):
             name: str = random.choice(names)
-            location: Location = deepcopy(random.choice(empty_spots_near_town))
-            age: int = random.randint(
-                settings.get("inital_spawn_age_min", 20), settings.get("inital_spawn_age_max", 30)
-            )
+            location: Location = random.choice(empty_spots_near_town)
+            age: int = random.randint(config.initial_spawn_age_min, config.initial_spawn_age_max)
             person: Person = self._make_person(name, pk, location, age)
             people.append(person)
-        logger.info(f"Generated {len(people)} people")
+        logger.info("Generated {} people", len(people))
         return people
 
     def make_baby(self, location: Location) -> Person:
@@ -80,7 +79,7 @@ class PeopleGenerator:
         age: int = 0
         self._max_pk += 1
         person: Person = self._make_person(name, self._max_pk, location, age)
-        logger.info(f"Baby {name} was born!")
+        logger.info("Baby {} was born!", name)
         return person
 
     def _make_person(self, name, pk, location, age) -> Person:
@@ -1,10 +1,16 @@
-from typing import Set
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING, Collection, Dict, Iterable, List, Set, Tuple
 
 from src.settings import settings
-from src.simulation.grid.grid import Grid
 from src.simulation.grid.location import Location
 from src.logger import logger
 
+if TYPE_CHECKING:
+    from src.config import Config
+    from src.simulation.grid.grid import Grid
+
 
 class Memory:
     def __init__(self, what: str, where: Location, when: int):
@@ -33,58 +39,83 @@ class Memory:
 class Memories:
     def __init__(self, grid: Grid) -> None:
         self._grid: Grid = grid
-
-        self._memories: Set[Memory] = set()
-
-    def get_memories(self) -> Set[Memory]:
+        self._config: Config = settings.get_config()
+        self._expire_after: int = self._config.memory_expire
+
+        self._memories: Dict[Location, Memory] = {}  # the memory at each location, in the order they were added
+        self._sequences: Dict[Location, int] = {}  # when, in added count, the memory at each location was added
+        self._locations: Dict[str, Set[Location]] = {}  # the locations of each char
+        # (when, order added, memory) oldest first, memories that were replaced are skipped when they come up
+        self._expiry_queue: List[Tuple[int, int, Memory]] = []
+        self._added_count: int = 0
+
+    def get_memories(self) -> Collection[Memory]:
+        self._remove_expired()
+        return self._memories.values()
+
+    def get_sequence(self) -> int:
+        """Grows every time a memory is added, see get_memories_since."""
+        return self._added_count
+
+    def get_memories_since(self, sequence: int) -> List[Memory]:
+        """The memories added after get_sequence() returned sequence, oldest first."""
+        self._remove_expired()
+        memories: List[Memory] = []
+        for where, memory in reversed(self._memories.items()):
+            if self._sequences[where] <= sequence:
+                break
+            memories.append(memory)
+        memories.reverse()
+        return memories
+
+    def _remove_expired(self) -> None:
         current_time = self._grid.get_time()
-        # Remove expired memories
-        expired_count = len(self._memories)
-        self._memories = {
-            memory for memory in self._memories if current_time - memory.get_when() <= settings.get("memory_expire", 50)
-        }
-        expired_count -= len(self._memories)
+        expired_count = 0
+        while self._expiry_queue and current_time - self._expiry_queue[0][0] > self._expire_after:
+            _, _, memory = heapq.heappop(self._expiry_queue)
+            if self._memories.get(memory.get_where()) is memory:
+                self._remove(memory.get_where())
+                expired_count += 1
         if expired_count > 0:
-            logger.debug(f"{expired_count} expired memories removed based on the expiration time.")
-        return self._memories
+            logger.debug("{} expired memories removed based on the expiration time.", expired_count)
 
     def _get_locations(self, char: str) -> Set[Location]:
-        logger.debug(f"Fetching locations associated with character '{char}'.")
-        filtered_memories = filter(lambda memory: memory.get_what() == char, self.get_memories())
-        locations = set(map(lambda memory: memory.get_where(), filtered_memories))
-        logger.debug(f"Found {len(locations)} locations associated with character '{char}'.")
+        logger.debug("Fetching locations associated with character '{}'.", char)
+        self._remove_expired()
+        locations = set(self._locations.get(char, ()))
+        logger.debug("Found {} locations associated with character '{}'.", len(locations), char)
 
         return locations
 
     def get_barn_locations(self) -> Set[Location]:
-        return self._get_locations(settings.get("barn_char", "B"))
+        return self._get_locations(self._config.barn_char)
 
     def get_barn_construction_locations(self) -> Set[Location]:
-        return self._get_locations(settings.get("barn_construction_char", "b"))
+        return self._get_locations(self._config.barn_construction_char)
 
     def get_farm_locations(self) -> Set[Location]:
-        return self._get_locations(settings.get("farm_char", "F"))
+        return self._get_locations(self._config.farm_char)
 
     def get_farm_construction_locations(self) -> Set[Location]:
-        return self._get_locations(settings.get("farm_construction_char", "f"))
+        return self._get_locations(self._config.farm_construction_char)
 
     def get_mine_locations(self) -> Set[Location]:
-        return self._get_locations(settings.get("mine_char", "M"))
+        return self._get_locations(self._config.mine_char)
 
     def get_mine_construction_locations(self) -> Set[Location]:
-        return self._get_locations(settings.get("mine_construction_char", "m"))
+        return self._get_locations(self._config.mine_construction_char)
 
     def get_home_locations(self) -> Set[Location]:
-        return self._get_locations(settings.get("home_char", "H"))
+        return self._get_locations(self._config.home_char)
 
     def get_home_construction_locations(self) -> Set[Location]:
-        return self._get_locations(settings.get("home_construction_char", "h"))
+        return self._get_locations(self._config.home_construction_char)
 
     def get_tree_locations(self) -> Set[Location]:
-        return self._get_locations(settings.get("tree_char", "*"))
+        return self._get_locations(self._config.tree_char)
 
     def get_empty_locations(self) -> Set[Location]:
-        return self._get_locations(settings.get("empty_char", " "))
+        return self._get_locations(self._config.empty_char)
 
     def get_building_locations(self) -> Set[Location]:
         return (
@@ -94,74 +125,90 @@ class Memories:
             | self.get_home_locations()
         )
 
-    def combine(self, other: "Memories") -> None:
+    def combine(self, other: "Memories", since: int = 0) -> None:
+        """
+        Merge in the other memories, keeping the newest memory for each location.
+        Pass since (the other's get_sequence() from an earlier combine) to only merge what the other added after it.
+        """
         logger.debug("Combining memories from another instance into the current one.")
+        self._remove_expired()
 
-        other_memories_count = len(other.get_memories())
-        logger.debug(f"The other memory instance contains {other_memories_count} memories.")
+        other_memories: Collection[Memory] = other.get_memories_since(since) if since else other.get_memories()
+        logger.debug("The other memory instance contains {} memories.", len(other_memories))
 
         # Merge the memories from both 'self' and 'other', keeping the newest memory for each location
-        for memory in other.get_memories():
-            existing_memory = next((m for m in self._memories if m.get_where() == memory.get_where()), None)
+        for memory in list(other_memories):
+            existing_memory = self._memories.get(memory.get_where())
             if existing_memory:
                 # If an existing memory is found for the same location, compare the timestamps
-                logger.debug(
-                    f"Memory conflict detected for location {memory.get_where()}. "
-                    f"Existing memory timestamp: {existing_memory.get_when()}, "
-                    f"incoming memory timestamp: {memory.get_when()}."
-                )
                 if memory.get_when() > existing_memory.get_when():
                     # Replace the old memory with the newer one
-                    logger.debug(f"Incoming memory for location {memory.get_where()} is newer. Updating memory.")
+                    logger.debug("Incoming memory for location {} is newer. Updating memory.", memory.get_where())
                     self.add(memory.get_what(), memory.get_where())
-                else:
-                    logger.debug(f"Existing memory for location {memory.get_where()} is newer. No update needed.")
             else:
                 # If no memory exists for this location, simply add the new memory
-                logger.debug(f"No existing memory found for location {memory.get_where()}. Adding new memory.")
-                self._memories.add(memory)
-
-        logger.debug(f"Memory combination complete. Total memories after combination: {len(self._memories)}.")
+                logger.debug("No existing memory found for location {}. Adding new memory.", memory.get_where())
+                self._insert(memory)
+
+        logger.debug("Memory combination complete. Total memories after combination: {}.", len(self._memories))
+
+    @staticmethod
+    def share(group: List["Memories"]) -> None:
+        """
+        Give everyone in the group the newest memory of every location anyone in the group knows.
+        Collects the newest memory of each location once and combines that into everyone, instead of every pair.
+        """
+        if not group:
+            return
+        logger.debug("Sharing memories within a group of {}.", len(group))
+        union: Memories = Memories(group[0]._grid)
+        for memories in group:
+            for memory in memories.get_memories():
+                newest = union._memories.get(memory.get_where())
+                if newest is None or memory.get_when() > newest.get_when():
+                    union._insert(memory)
+        for memories in group:
+            memories.combine(union)
 
     def add(self, what: str, where: Location) -> None:
-        logger.debug(f"Adding a new memory with content '{what}' at location {where}.")
+        logger.debug("Adding a new memory with content '{}' at location {}.", what, where)
 
         if not self._grid.is_in_bounds(where):
-            logger.warning(f"Tried to add an out of bounds location to memory {where}")
+            logger.warning("Tried to add an out of bounds location to memory {}", where)
             return
 
-        # Validate location and adjust if necessary
-        if not self._grid.is_tree(where) or not self._grid.is_empty(where):
-            logger.debug(f"Location {where} is either not a tree or not empty. Adjusting location to top-left corner.")
-            self._grid.find_top_left_corner(where)
+        # remember structures by their top left corner
+        owner = self._grid.get_owner(where)
+        if owner is not None:
+            logger.debug("Location {} is part of the structure at {}.", where, owner)
+            where = owner
 
-        # Remove any existing memory for the same location
-        logger.debug(f"Removing any existing memory at location {where}.")
-        self._remove(where)
+        # Create a new memory, replacing any existing memory for the same location
+        current_time = self._grid.get_time()
+        self._insert(Memory(what, where, current_time))
+        logger.debug("New memory added: '{}' at location {} with timestamp {}.", what, where, current_time)
 
-        # Create a new memory and add it to the set
+    def add_all(self, seen: Iterable[Tuple[str, Location]]) -> None:
+        """Add a memory of what is at each in bounds location, all at the current time, like add does one by one."""
         current_time = self._grid.get_time()
-        new_memory = Memory(what, where, current_time)
-        self._memories.add(new_memory)
-        logger.debug(f"New memory added: '{what}' at location {where} with timestamp {current_time}.")
-        logger.debug(f"Memory successfully added. Total memories: {len(self._memories)}.")
+        added_count = self._added_count
+        for what, where in seen:
+            owner = self._grid.get_owner(where)
+            self._insert(Memory(what, owner if owner is not None else where, current_time))
+        logger.debug("{} memories added with timestamp {}.", self._added_count - added_count, current_time)
+
+    def _insert(self, memory: Memory) -> None:
+        where = memory.get_where()
+        self._remove(where)
+        self._memories[where] = memory
+        self._sequences[where] = self._added_count + 1
+        self._locations.setdefault(memory.get_what(), set()).add(where)
+        self._added_count += 1
+        heapq.heappush(self._expiry_queue, (memory.get_when(), self._added_count, memory))
 
     def _remove(self, where: Location) -> None:
-        logger.debug(f"Attempting to remove memory at location {where}.")
-
-        # Count memories before removal
-        initial_count = len(self._memories)
-        logger.debug(f"Initial memory count: {initial_count}.")
-
-        # Remove memory at the specified location if it exists
-        self._memories = {memory for memory in self._memories if memory.get_where() != where}
-
-        # Count memories after removal
-        final_count = len(self._memories)
-        logger.debug(f"Final memory count after removal: {final_count}.")
-
-        # Log the result of the removal operation
-        if final_count < initial_count:
-            logger.debug(f"Memory at location {where} was successfully removed.")
-        else:
-            logger.debug(f"No memory found at location {where} to remove.")
+        memory = self._memories.pop(where, None)
+        if memory is not None:
+            del self._sequences[where]
+            self._locations[memory.get_what()].discard(where)
+            logger.debug("Memory at location {} was removed.", where)
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from random import randint
 from typing import TYPE_CHECKING, List, Optional
 
 from pathfinding.core.diagonal_movement import DiagonalMovement
@@ -23,72 +21,83 @@ if TYPE_CHECKING:
 
 class Mover:
     def __init__(self, grid: Grid, person: Person, memories: Memories, speed: int) -> None:
-        logger.debug(f"Initializing Mover for person {person.get_name()} with speed {speed}.")
+        logger.debug("Initializing Mover for person {} with speed {}.", person.get_name(), speed)
         self._person = person
         self._grid = grid
         self._speed = speed
         self._memories = memories
-        self._vision = Vision(person, grid, settings.get("visibility", 15))
-        self._path_finding_grid = self._get_path_finding_grid()
-        logger.debug("Mover initialized with grid: %s, person: %s, speed: %d.", grid, person, speed)
+        self._vision = Vision(person, grid, settings.get_config().visibility)
+        logger.debug("Mover initialized with grid: {}, person: {}, speed: {}.", grid, person, speed)
 
     def explore(self) -> None:
         logger.debug("Explorer is searching for a random location.")
         random_location = self._get_random_location()
-        logger.debug(f"Random location chosen: {random_location}")
+        logger.debug("Random location chosen: {}", random_location)
         self.towards(random_location)
 
     def towards(self, target: Location) -> None:
-        self._path_finding_grid = self._get_path_finding_grid()
-        logger.debug(f"Moving towards target location: {target}.")
+        logger.debug("Moving towards target location: {}.", target)
         if not self._grid.is_in_bounds(target):
-            logger.warning(f"Target location {target} is out of bounds, aborting movement.")
+            logger.warning("Target location {} is out of bounds, aborting movement.", target)
             return
 
         if self._invalid(target):
-            logger.debug(f"Target location {target} is invalid, adjusting target.")
+            logger.debug("Target location {} is invalid, adjusting target.", target)
             target = self._adjust_target(target)
 
+        # plan once and follow the path, re-planning only if a cell ahead has changed
+        path: List[Location] = []
+        path_versions: List[int] = []
         for step in range(self._speed):
-            logger.debug(f"Step {step}: Combining vision with current memories.")
-            if step % 4 == 0:
-                self._memories.combine(self._vision.look_around())
-            path = self._get_path(target)
-
-            if path and len(path) >= 2:
-                next_node = path[1]
-                new_location = Location(next_node.y, next_node.x)  # Convert to Location
-                logger.debug(f"Moving to next location: {new_location}.")
+            logger.debug("Step {}: Combining vision with current memories.", step)
+            self._memories.combine(self._vision.look_around())
+
+            if not path or not self._is_path_current(path, path_versions):
+                logger.debug("Planning path to target: {}.", target)
+                path = self._get_location_path(target)
+                path_versions = [self._grid.get_version(location) for location in path]
+
+            if len(path) >= 2:
+                new_location = path[1]
+                logger.debug("Moving to next location: {}.", new_location)
                 self._place(new_location)
+                path.pop(0)
+                path_versions.pop(0)
             else:
                 if self._person.get_location() == target:
-                    logger.info(f"{self._person.get_name()} has arrived to their target")
+                    logger.info("{} has arrived to their target", self._person.get_name())
                 else:
-                    logger.warning(f"No valid path found to target: {target}")
+                    logger.warning("No valid path found to target: {}", target)
                 break
 
+    def _is_path_current(self, path: List[Location], path_versions: List[int]) -> bool:
+        logger.debug("Checking if the cells ahead on the path have changed.")
+        return all(
+            self._grid.get_version(location) == version for location, version in zip(path[1:], path_versions[1:])
+        )
+
     def _invalid(self, location: Location) -> bool:
-        logger.debug(f"Checking if location {location} is invalid (barn, mine, or home).")
+        logger.debug("Checking if location {} is invalid (barn, mine, or home).", location)
         result = (
             not self._grid.is_in_bounds(location)
             or self._grid.is_barn(location)
             or self._grid.is_mine(location)
             or self._grid.is_home(location)
         )
-        logger.debug(f"Location {location} is invalid: {result}")
+        logger.debug("Location {} is invalid: {}", location, result)
         return result
 
     def _adjust_target(self, target):
-        logger.debug(f"Adjusting target location {target} if necessary.")
+        logger.debug("Adjusting target location {} if necessary.", target)
         neighbors: List[Location] = target.get_neighbors()
         found: bool = False
         for neighbor in neighbors:
-            logger.debug(f"Checking if neighbor location {neighbor} is valid.")
+            logger.debug("Checking if neighbor location {} is valid.", neighbor)
 
             if not self._invalid(neighbor) and self.can_get_to(neighbor):
                 target = neighbor
                 found = True
-                logger.debug("New valid target found: {target}")
+                logger.debug("New valid target found: {}", target)
                 break
         if not found:
             logger.error("No valid targets found for movement. Raising exception.")
@@ -96,85 +105,80 @@ class Mover:
         return target
 
     def get_closest(self, locations: List[Location], current_location=None) -> Optional[Location]:
-        logger.debug(f"Getting the closest location from {current_location} to one of the target locations.")
+        logger.debug("Getting the closest location from {} to one of the target locations.", current_location)
         if not current_location:
             current_location = self._person.get_location()
-            logger.debug(f"Current location not provided. Using person's current location: {current_location}")
+            logger.debug("Current location not provided. Using person's current location: {}", current_location)
         if not locations:
             logger.warning("No target locations provided. Returning None.")
             return None
         closest_location = min(locations, key=lambda loc: current_location.distance_to(loc), default=None)
-        logger.debug(f"Closest location found: {closest_location}")
+        logger.debug("Closest location found: {}", closest_location)
         return closest_location
 
     def can_get_to(self, target: Location) -> bool:
-        logger.debug(f"Checking if a path exists to target location {target}")
-        path_exists = bool(self._get_path(target))
-        logger.debug(f"Path to target {target} exists: {path_exists}")
+        logger.debug("Checking if a path exists to target location {}", target)
+        path_exists = self._grid.can_reach(self._person.get_location(), target)
+        logger.debug("Path to target {} exists: {}", target, path_exists)
         return path_exists
 
     def _place(self, location: Location) -> None:
-        logger.debug(f"Placing person at location {location}")
-        current_location = deepcopy(self._person.get_location())
+        logger.debug("Placing person at location {}", location)
+        current_location = self._person.get_location()
 
         if not current_location.is_one_away(location):
             logger.error(
-                f"Attempted to place person at location {location}, which is not one away from current location {current_location}."
+                "Attempted to place person at location {}, which is not one away from current location {}.",
+                location,
+                current_location,
             )
             raise ValueError(f"Location is not one away: {location}")
 
         if not self._grid.is_in_bounds(location) or self._invalid(location):
-            logger.error(f"Attempted to place person at invalid location {location}")
+            logger.error("Attempted to place person at invalid location {}", location)
             raise ValueError(f"Location is not valid: {location} {self._grid.get_grid()[location.y][location.x]}")
 
         self._person.set_location(location)
-        logger.debug(f"Person successfully placed at location {location}")
+        logger.debug("Person successfully placed at location {}", location)
 
     def _get_random_location(self) -> Location:
         logger.debug("Getting a random valid location.")
 
-        while True:
-            x = randint(0, self._grid.get_width() - 1)
-            y = randint(0, self._grid.get_height() - 1)
-            location = Location(x, y)
+        # only sample from the cells this person can actually walk to
+        location = self._grid.get_random_reachable_location(self._person.get_location())
+        if location is None or self._invalid(location):
+            logger.warning("No reachable location to explore, staying in place.")
+            return self._person.get_location()
 
-            if self._grid.is_in_bounds(location) and not self._invalid(location) and self.can_get_to(location):
-                logger.debug(f"Random location found: {location}")
-                return location
+        logger.debug("Random location found: {}", location)
+        return location
 
-            logger.debug(f"Generated invalid location {location}. Trying again...")
+    def _get_location_path(self, target: Location) -> List[Location]:
+        return [Location(node.y, node.x) for node in self._get_path(target)]  # Convert to Location
 
     def _get_path(
         self,
         target: Location,
     ) -> List[PathFindingGridNode]:
-        logger.debug(f"Finding path to target location {target}")
-        start: Location = deepcopy(self._person.get_location())
+        logger.debug("Finding path to target location {}", target)
+        start: Location = self._person.get_location()
 
         if not self._grid.is_in_bounds(start) or self._invalid(start):
-            logger.error(f"Start location {start} is out of bounds or invalid. Raising exception.")
+            logger.error("Start location {} is out of bounds or invalid. Raising exception.", start)
             raise ValueError("Person out of bounds")
 
-        start_node = self._path_finding_grid.node(start.y, start.x)
-        end_node = self._path_finding_grid.node(target.y, target.x)
+        path_finding_grid: PathFindingGrid = self._grid.get_path_finding_grid()
+        start_node = path_finding_grid.node(start.y, start.x)
+        end_node = path_finding_grid.node(target.y, target.x)
 
-        logger.debug(f"Start node: {start_node}, End node: {end_node}")
+        logger.debug("Start node: {}, End node: {}", start_node, end_node)
 
         finder = AStarFinder(diagonal_movement=DiagonalMovement.always)
 
-        path, _ = finder.find_path(start_node, end_node, self._path_finding_grid)
-        logger.debug(f"Path found: {path}")
+        path, _ = finder.find_path(start_node, end_node, path_finding_grid)
+        logger.debug("Path found: {}", path)
         return path
 
-    def _get_path_finding_grid(self) -> PathFindingGrid:
-        logger.debug("Generating pathfinding grid.")
-
-        # Get the pathfinding matrix from the grid
-        matrix = self._grid.get_path_finding_matrix()
-        logger.debug(f"Pathfinding matrix retrieved: {matrix}")
-
-        return PathFindingGrid(matrix=matrix)
-
     # For debugging
     def _print_grid(self, target: Location, path) -> None:
         logger.debug("Printing grid.")
@@ -194,8 +198,8 @@ class Mover:
         path_locations = [Location(y, x) for y, x in path]
 
         # Log the grid dimensions and target position
-        logger.debug(f"Grid dimensions: {len(grid)} x {len(grid[0])}")
-        logger.debug(f"Target position: ({target_y}, {target_x})")
+        logger.debug("Grid dimensions: {} x {}", len(grid), len(grid[0]))
+        logger.debug("Target position: ({}, {})", target_y, target_x)
 
         # Top border: Adjusted to account for spaces between characters
         border = "+" + "-" * len(grid[0]) + "+"
@@ -219,7 +223,7 @@ class Mover:
                     row_display.append(cell)  # otherwise, display the normal grid cell
 
             # Log each row before printing for debugging purposes
-            logger.debug(f"Row {y_idx}: {' '.join(row_display)}")
+            logger.debug("Row {}: {}", y_idx, " ".join(row_display))
 
             # Print the row with no spaces between characters (join with an empty string)
             print("|" + " ".join(row_display) + "|")
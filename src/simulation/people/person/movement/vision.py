@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from copy import deepcopy
 from enum import Enum
 from typing import TYPE_CHECKING, Callable, Dict, List, Tuple, Set
 
+from src.settings import settings
+from src.simulation.grid.cell_codec import CellCodec
 from src.simulation.grid.location import Location
 from src.simulation.people.person.memories import Memories
 from src.logger import logger
 
 if TYPE_CHECKING:
+    from src.simulation.grid.field_of_view import FieldOfView
     from src.simulation.grid.grid import Grid
     from src.simulation.people.person.person import Person
 
@@ -26,20 +28,31 @@ class Vision:
         self._grid = grid
         self._visibility = visibility
         self._directions: List[Tuple[int, int]] = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
-        logger.debug(
-            f"Vision system initialized for {self._person} with visibility radius {self._visibility}.", self._person
-        )
+        # "shadowcasting" or "legacy" (the original recursive search)
+        self._engine: str = settings.get_config().vision_engine
+        self._field_of_view: FieldOfView = grid.get_field_of_view()
+        logger.debug("Vision system initialized for {} with visibility radius {}.", self._person, self._visibility)
 
     def look_around(self) -> Memories:
         """Initiates the visibility check and returns updated memories."""
-        logger.debug(f"{self._person} is looking around.")
+        logger.debug("{} is looking around.", self._person)
         memories: Memories = Memories(self._grid)
-        current_location = deepcopy(self._person.get_location())
-        logger.debug(f"Starting vision search from {current_location}.")
-        self._search(current_location, self._visibility, memories, set())
-        logger.debug(f"Vision search complete for {self._person}. Memory updated.", self._person)
+        current_location = self._person.get_location()
+        logger.debug("Starting vision search from {} using the {} engine.", current_location, self._engine)
+        if self._engine == "legacy":
+            self._search(current_location, self._visibility, memories, set())
+        else:
+            self._cast(current_location, memories)
+        logger.debug("Vision search complete for {}. Memory updated.", self._person)
         return memories
 
+    def _cast(self, location: Location, memories: Memories) -> None:
+        xs, ys, codes = self._field_of_view.compute(location, self._visibility)
+        # the field of view only reports cells inside the grid
+        memories.add_all(
+            (CellCodec.decode(code), Location(x, y)) for x, y, code in zip(xs.tolist(), ys.tolist(), codes.tolist())
+        )
+
     def _search(
         self,
         location: Location,
@@ -48,14 +61,14 @@ class Vision:
         blocked: Set[Location],
     ) -> None:
         if visibility <= 0:
-            logger.debug(f"Visibility range exhausted at {location}.")
+            logger.debug("Visibility range exhausted at {}.", location)
             return
         if location in blocked:
-            logger.debug(f"Location {location} is already blocked. Skipping.")
+            logger.debug("Location {} is already blocked. Skipping.", location)
             return
 
         blocked.add(location)
-        logger.debug(f"Searching location {location} with visibility {visibility}.")
+        logger.debug("Searching location {} with visibility {}.", location, visibility)
 
         for dx, dy in self._directions:
             neighbor = Location(location.x + dx, location.y + dy)
@@ -64,22 +77,22 @@ class Vision:
                     self._process_location(memory, blocked, neighbor)
                     self._search(neighbor, visibility - 1, memory, blocked)
             else:
-                logger.debug(f"Neighbor {neighbor} is out of bounds. Skipping.")
+                logger.debug("Neighbor {} is out of bounds. Skipping.", neighbor)
 
     def _process_location(self, memories: Memories, blocked: set[Location], location: Location) -> None:
         """Processes a location and updates memory if an object is found."""
-        logger.debug(f"Processing location {location}.")
+        logger.debug("Processing location {}.", location)
 
         if self._is_non_blocking_object(location, memories):
-            logger.debug(f"Non blocking object found at {location}.")
+            logger.debug("Non blocking object found at {}.", location)
             return
 
         if self._is_blocking_object(location, memories):
-            logger.debug(f"Blocking object found at {location}. View will be obstructed.")
+            logger.debug("Blocking object found at {}. View will be obstructed.", location)
             self._block_view(blocked, location)
             return
 
-        logger.error(f"Unknown character detected at {location}. Raising exception.")
+        logger.error("Unknown character detected at {}. Raising exception.", location)
         raise Exception(f"Unknown character at: {location}")
 
     def _is_non_blocking_object(self, location: Location, memories: Memories) -> bool:
@@ -94,7 +107,7 @@ class Vision:
         }
         for obj_type, check_fn in non_blocking_objects.items():
             if check_fn(location):
-                logger.debug(f"{obj_type} found at {location}.")
+                logger.debug("{} found at {}.", obj_type, location)
                 memories.add(self._grid.get_grid()[location.y][location.x], location)
                 return True
         return False
@@ -109,35 +122,35 @@ class Vision:
 
         for obj_type, check_fn in blocking_objects.items():
             if check_fn(location):
-                logger.debug(f"Blocking object {obj_type} detected at {location}.")
+                logger.debug("Blocking object {} detected at {}.", obj_type, location)
                 memories.add(self._grid.get_grid()[location.y][location.x], location)
                 return True
         return False
 
     def _block_view(self, blocked: set[Location], location: Location) -> None:
         """Marks the view as blocked for the given location."""
-        logger.debug(f"Blocking view from {location}.")
+        logger.debug("Blocking view from {}.", location)
         blocked.add(location)
         for direction in Direction:
             self._mark_blocked_in_direction(blocked, location, direction)
 
     def _mark_blocked_in_direction(self, blocked: set[Location], location: Location, direction: Direction) -> None:
         """Blocks visibility in a specific direction from the given location."""
-        logger.debug(f"Blocking view from location {location} towards {direction.name}.")
+        logger.debug("Blocking view from location {} towards {}.", location, direction.name)
         x, y = location.x, location.y
         if direction == Direction.LEFT:
             for k in range(x, -1, -1):
                 blocked.add(Location(k, y))
-                logger.debug(f"Location {Location(k, y)} blocked.")
+                logger.debug("Location {} blocked.", Location(k, y))
         elif direction == Direction.RIGHT:
             for k in range(x, self._grid.get_width()):
                 blocked.add(Location(k, y))
-                logger.debug(f"Location {Location(k, y)} blocked.")
+                logger.debug("Location {} blocked.", Location(k, y))
         elif direction == Direction.DOWN:
             for k in range(y, self._grid.get_height()):
                 blocked.add(Location(x, k))
-                logger.debug(f"Location {Location(x, k)} blocked.")
+                logger.debug("Location {} blocked.", Location(x, k))
         elif direction == Direction.UP:
             for k in range(y, -1, -1):
                 blocked.add(Location(x, k))
-                logger.debug(f"Location {Location(x, k)} blocked.")
+                logger.debug("Location {} blocked.", Location(x, k))
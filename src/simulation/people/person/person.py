@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from src.logger import logger
 from src.settings import settings
@@ -12,10 +12,10 @@ from src.simulation.people.person.scheduler.task.task_type import TaskType
 from src.simulation.people.person.thinker import Thinker
 
 if TYPE_CHECKING:
+    from src.config import Config
     from src.simulation.grid.location import Location
     from src.simulation.grid.structure.store.barn import Barn
     from src.simulation.grid.structure.store.home import Home
-    from src.simulation.grid.structure.structure import Structure
     from src.simulation.grid.structure.structure_type import StructureType
     from src.simulation.people.person.movement.move_result import MoveResult
     from src.simulation.simulation import Simulation
@@ -30,10 +30,11 @@ class Person:
         self._age: int = age
         self._simulation = simulation
         self._location: Location = location
+        self._config: Config = settings.get_config()
 
         # when your hunger gets below 25, health starts going down; when it gets above 75, health starts going up
-        self._health: int = settings.get("person_health_cap", 100)
-        self._hunger: int = settings.get("person_hunger_cap", 100)
+        self._health: int = self._config.person_health_cap
+        self._hunger: int = self._config.person_hunger_cap
 
         self._home: Optional[Home] = None
         self._spouse: Optional[Person] = None
@@ -43,6 +44,9 @@ class Person:
         self._memories: Memories = Memories(simulation.get_grid())
         for memory in starter_memories:
             self._memories.add(self._simulation.get_grid().get_grid()[memory.y][memory.x], memory)
+        # the other person's pk -> their memories sequence when they last shared with this person,
+        # keyed by pk so people who have died aren't kept alive here
+        self._received_memories: Dict[int, int] = {}
         self._navigator: Navigator = Navigator(simulation, self)
         self._thinker: Thinker = Thinker(simulation, self)
 
@@ -67,12 +71,21 @@ class Person:
     def get_name(self) -> str:
         return self._name
 
+    def get_pk(self) -> int:
+        return self._pk
+
     def exchange_memories(self, other: "Person") -> None:
         if not other:
             return
-        self._memories.combine(other.get_memories())
-        other.get_memories().combine(self._memories)
-        logger.info(f"{self._name} is exchanging memories with {other.get_name()}")
+        self.receive_memories(other)
+        other.receive_memories(self)
+        logger.info("{} is exchanging memories with {}", self._name, other.get_name())
+
+    def receive_memories(self, other: "Person") -> None:
+        """Merge in what the other person has learned since they last shared with this person."""
+        other_memories: Memories = other.get_memories()
+        self._memories.combine(other_memories, self._received_memories.get(other.get_pk(), 0))
+        self._received_memories[other.get_pk()] = other_memories.get_sequence()
 
     def get_empties(self) -> List[Location]:
         return list(self._memories.get_empty_locations())
@@ -84,13 +97,8 @@ class Person:
         return self._scheduler
 
     def get_work_structures(self) -> List[Location]:
-        logger.info(f"getting all structures {self._name} is working on.")
-        structures: List[Structure] = []
-        for task in self._scheduler.get_this_years_tasks():
-            structure: Structure = task.get_work_structure()
-            if structure:
-                structures.append(structure)
-        return list(map(lambda s: s.get_location(), structures))
+        logger.info("getting all structures {} is working on.", self._name)
+        return self._scheduler.get_work_structures()
 
     def kill(self):
         self.set_health(-100)
@@ -124,50 +132,50 @@ class Person:
 
     def set_location(self, other: Location) -> None:
         if not self._simulation.get_grid().is_in_bounds(other):
-            logger.error(f"{self._name} tried to move outside map bounds to {other}")
+            logger.error("{} tried to move outside map bounds to {}", self._name, other)
             return
 
         self._location = other
-        logger.info(f"{self._name} moved to new location: {self._location}")
+        logger.info("{} moved to new location: {}", self._name, self._location)
 
     def is_dead(self) -> bool:
-        return self._health <= 0 or self._age >= settings.get("person_age_max", 80)
+        return self._health <= 0 or self._age >= self._config.person_age_max
 
     def is_satiated(self) -> bool:
         return self.get_hunger() >= self.get_hunger_preference()
 
     def eat(self, building: Barn | Home) -> None:
-        logger.info(f"{self._name} is about to eat with hunger {self._hunger}")
+        logger.info("{} is about to eat with hunger {}", self._name, self._hunger)
         if isinstance(building, Home):
-            self.set_hunger(settings.get("home_eat_satiate", 15))
-            building.remove_resource(settings.get("food", "food"), settings.get("home_eat_satiate", 15))
-            logger.debug(f"{self._name} ate at home and their hunger is now {self._hunger}")
+            self.set_hunger(self._config.home_eat_satiate)
+            building.remove_resource(self._config.food, self._config.home_eat_satiate)
+            logger.debug("{} ate at home and their hunger is now {}", self._name, self._hunger)
         else:
-            self.set_hunger(settings.get("barn_eat_satiate", 10))
-            building.remove_resource(settings.get("food", "food"), settings.get("barn_eat_satiate", 10))
-            logger.debug(f"{self._name} ate in a barn and their hunger is now {self._hunger}")
+            self.set_hunger(self._config.barn_eat_satiate)
+            building.remove_resource(self._config.food, self._config.barn_eat_satiate)
+            logger.debug("{} ate in a barn and their hunger is now {}", self._name, self._hunger)
 
     def set_hunger(self, hunger: int) -> None:
         old_hunger = self._hunger
-        self._hunger = max(0, min(self._hunger + hunger, settings.get("person_hunger_cap", 100)))
-        logger.info(f"{self._name}'s hunger adjusted from {old_hunger} to {self._hunger}")
+        self._hunger = max(0, min(self._hunger + hunger, self._config.person_hunger_cap))
+        logger.info("{}'s hunger adjusted from {} to {}", self._name, old_hunger, self._hunger)
 
     def assign_spouse(self, spouse: "Person") -> None:
         self._spouse = spouse
 
     def divorce(self) -> None:
         if not self._spouse:
-            logger.warning(f"{self._name} has no spouse to divorce")
+            logger.warning("{} has no spouse to divorce", self._name)
             return
         old_spouse: Person = self._spouse
         self.get_spouse().leave_spouse()
         self._spouse = None
-        logger.info(f"{self._name} has divorced their spouse {old_spouse}")
+        logger.info("{} has divorced their spouse {}", self._name, old_spouse)
 
     def leave_spouse(self) -> None:
         self._home = None
         self._spouse = None
-        logger.info(f"{self._name} has left their spouse and home")
+        logger.info("{} has left their spouse and home", self._name)
 
     def get_spouse(self) -> Optional["Person"]:
         return self._spouse
@@ -178,37 +186,37 @@ class Person:
         self.remove_home()
         self._home = home
         home.assign_owner(self)
-        logger.info(f"{self._name} assigned to new home: {home}")
+        logger.info("{} assigned to new home: {}", self._name, home)
         if self.has_spouse():
             self.get_spouse().assign_home(home)
-            logger.debug(f"{self._name}'s spouse also assigned to the new home: {home}")
+            logger.debug("{}'s spouse also assigned to the new home: {}", self._name, home)
 
     def remove_home(self):
         if not self._home:
-            logger.warning(f"{self._name} tried to remove home but has no home to remove")
+            logger.warning("{} tried to remove home but has no home to remove", self._name)
             return
         self._home.assign_owner(None)
         self._home = None
-        logger.info(f"{self._name} removed from home")
+        logger.info("{} removed from home", self._name)
         if self.has_spouse():
             self._spouse.remove_home()
-            logger.debug(f"{self._name}'s spouse's home also removed")
+            logger.debug("{}'s spouse's home also removed", self._name)
 
     def set_health(self, health: int) -> None:
         old_health = self._health
-        self._health = max(0, min(self._health + health, settings.get("person_health_cap", 100)))
-        logger.info(f"{self._name}'s health adjusted from {old_health} to {self._health}")
+        self._health = max(0, min(self._health + health, self._config.person_health_cap))
+        logger.info("{}'s health adjusted from {} to {}", self._name, old_health, self._health)
 
     def has_home(self) -> bool:
         return self._home is not None
 
     def start_home_construction(self) -> None:
         self._scheduler.add(TaskType.START_HOME_CONSTRUCTION)
-        logger.info(f"{self._name} started home construction task")
+        logger.info("{} started home construction task", self._name)
 
     def work_farm(self) -> None:
         self._scheduler.add(TaskType.WORK_FARM)
-        logger.info(f"{self._name} started work farm task")
+        logger.info("{} started work farm task", self._name)
 
     def has_spouse(self) -> bool:
         return self._spouse is not None
@@ -216,9 +224,6 @@ class Person:
     def age(self) -> None:
         self._age += 1
 
-    def is_stuck(self) -> bool:
-        return self._navigator.is_stuck()
-
     def go_to_location(self, location: Location) -> None:
         self._navigator.move_to_location(location)
 
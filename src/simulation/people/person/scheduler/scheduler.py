@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import heapq
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
 
 from src.logger import logger
 from src.simulation.people.person.scheduler.task.task_factory import TaskFactory
 
 if TYPE_CHECKING:
+    from src.simulation.grid.location import Location
     from src.simulation.people.person.person import Person
     from src.simulation.people.person.scheduler.task.task import Task
     from src.simulation.people.person.scheduler.task.task_type import TaskType
@@ -18,29 +19,52 @@ class Scheduler:
 
     def __init__(self, simulation: Simulation, person: Person) -> None:
         self._task_factory: TaskFactory = TaskFactory(simulation, person)
-        self._this_years_tasks: List[Task] = []
         self._tasks: List[Task] = []
         self._current_task: Optional[Task] = None
 
-    def get_this_years_tasks(self):
-        return self._this_years_tasks
+        # this year's tasks are counted as they are added and finished, a finished task isn't kept
+        self._this_years_active_tasks: Set[Task] = set()
+        self._active_counts: Dict[TaskType, int] = {}
+        self._completed_counts: Dict[TaskType, int] = {}
+        # where this year's finished tasks worked, by how many tasks worked there
+        self._work_structure_counts: Dict[Location, int] = {}
+
+    def get_task_counts(self, finished: bool) -> Dict[TaskType, int]:
+        """How many of the tasks added this year are finished (or not yet) by type, treat it as read only."""
+        return self._completed_counts if finished else self._active_counts
+
+    def get_work_structures(self) -> List[Location]:
+        """Where this year's tasks work, once for every task."""
+        locations: List[Location] = []
+        for location, count in self._work_structure_counts.items():
+            locations.extend([location] * count)
+        for task in self._this_years_active_tasks:
+            structure = task.get_work_structure()
+            if structure:
+                locations.append(structure.get_location())
+        return locations
 
     def get_tasks(self):
         return self._tasks
 
     def flush(self):
-        self._this_years_tasks = []
+        self._this_years_active_tasks = set()
+        self._active_counts = {}
+        self._completed_counts = {}
+        self._work_structure_counts = {}
 
     def add(self, what: TaskType) -> None:
         task: Task = self._task_factory.create_instance(what)
         if not task:
-            logger.warning(f"Tried to add invalid task: {what}")
+            logger.warning("Tried to add invalid task: {}", what)
             return
         task_types = {type(task) for task in self._tasks}
         if type(task) not in task_types:
             self._add(task)
-            self._this_years_tasks.append(task)
-            logger.debug(f"Task {task} should be added to list of tasks")
+            self._this_years_active_tasks.add(task)
+            task_type = task.get_task_type()
+            self._active_counts[task_type] = self._active_counts.get(task_type, 0) + 1
+            logger.debug("Task {} should be added to list of tasks", task)
 
     def _add(self, task: Optional[Task]) -> None:
         if task:
@@ -60,7 +84,7 @@ class Scheduler:
         # Reward formula: Higher priority, less time remaining, fewer interruptions lead to higher reward
         # reward = priority_weight * time_remaining_weight / (1 + interruption_penalty)
         reward = priority_weight / (1 + interruption_penalty)
-        logger.debug(f"Task {task} should have reward {reward}")
+        logger.debug("Task {} should have reward {}", task, reward)
         return reward
 
     def execute(self) -> None:
@@ -69,7 +93,7 @@ class Scheduler:
             return
 
         if not self._current_task and self._tasks:
-            logger.debug(f"No current task, popping task from list of tasks")
+            logger.debug("No current task, popping task from list of tasks")
             self._current_task = self._pop()
 
         # Calculate the reward for continuing the current task
@@ -81,16 +105,31 @@ class Scheduler:
 
         # Apply the optimal stopping rule: stick to the current task if it has a higher reward
         if current_task_reward < next_task_reward:
-            logger.info(f"Next task {next_task} has higher reward. Switching from {self._current_task} to {next_task}")
+            logger.info(
+                "Next task {} has higher reward. Switching from {} to {}", next_task, self._current_task, next_task
+            )
             self._current_task.increment_interruptions()
             self._add(self._current_task)
             self._current_task = next_task
         else:
             self._add(next_task)
 
-        logger.info(f"Executing current task {self._current_task}")
+        logger.info("Executing current task {}", self._current_task)
         self._current_task.execute()
 
         if self._current_task.is_finished():
-            logger.debug(f"Current task {self._current_task} is finished")
+            logger.debug("Current task {} is finished", self._current_task)
+            self._count_finished(self._current_task)
             self._current_task = None
+
+    def _count_finished(self, task: Task) -> None:
+        if task not in self._this_years_active_tasks:
+            return  # added before the year started
+        self._this_years_active_tasks.remove(task)
+        task_type = task.get_task_type()
+        self._active_counts[task_type] -= 1
+        self._completed_counts[task_type] = self._completed_counts.get(task_type, 0) + 1
+        structure = task.get_work_structure()
+        if structure:
+            location = structure.get_location()
+            self._work_structure_counts[location] = self._work_structure_counts.get(location, 0) + 1
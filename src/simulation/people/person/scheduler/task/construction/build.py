@@ -50,26 +50,26 @@ class Build(Task, ABC):
         ):
             if self._build.needs_stone():
                 self._what_resource = "stone"
-                logger.debug(f"Needs stone to build")
+                logger.debug("Needs stone to build")
             elif self._build.needs_wood():
                 self._what_resource = "wood"
-                logger.debug(f"Needs wood to build")
+                logger.debug("Needs wood to build")
             elif self._what_resource:
                 if self._store:
                     if self._what_resource == "stone":
-                        logger.debug(f"Going to deliver stone to {self._build}")
+                        logger.debug("Going to deliver stone to {}", self._build)
                         self._build.deliver_stone(
                             self._store.remove_resource(self._what_resource, self._build.how_much_stone())
                         )
                     else:
-                        logger.debug(f"Going to deliver wood to {self._build}")
+                        logger.debug("Going to deliver wood to {}", self._build)
                         self._build.deliver_wood(
                             self._store.remove_resource(self._what_resource, self._build.how_much_wood())
                         )
                     self._finished()
-                    logger.info(f"{self._build} is finished being built.")
+                    logger.info("{} is finished being built.", self._build)
                 else:
-                    logger.debug(f"Not building, need to go to a store structure for {self._what_resource}")
+                    logger.debug("Not building, need to go to a store structure for {}", self._what_resource)
                     move_result: MoveResult = self._person.move_to_workable_structure(
                         self._store_structure, self._what_resource
                     )
@@ -78,27 +78,27 @@ class Build(Task, ABC):
                         logger.warning("Move result failed")
                         return
                     self._store: Optional[Store] = move_result.get_structure()
-                    logger.debug(f"Store {self._store} assigned to building {self._build}")
+                    logger.debug("Store {} assigned to building {}", self._store, self._build)
             else:
                 if self._build.work(self._person):
                     self._finished()
-                    logger.info(f"{self._build} is finished being built.")
+                    logger.info("{} is finished being built.", self._build)
 
         else:
-            logger.debug(f"Not building, need to go to different workable structure")
+            logger.debug("Not building, need to go to different workable structure")
             move_result: MoveResult = self._person.move_to_workable_structure(self._build_structure)
             self._build: Optional[Construction] = move_result.get_structure()
             if move_result.has_failed():
                 logger.warning("Move result failed")
                 self._finished(False)
                 return
-            logger.debug(f"Building {self._build} assigned to build")
+            logger.debug("Building {} assigned to build", self._build)
 
     @override
     def _clean_up_task(self) -> None:
         if self._build:
             self._build.remove_worker(self._person)
-            logger.debug(f"Removed worker,{self._person}, from {self._build}")
+            logger.debug("Removed worker,{}, from {}", self._person, self._build)
 
     @override
     def get_remaining_time(self) -> int:
@@ -23,7 +23,7 @@ class Explore(Task):
         self._how_far += 1
         self._person.explore()
         if self._how_far >= self._max_how_far:
-            logger.info(f"{self._person} explored {self._max_how_far} times")
+            logger.info("{} explored {} times", self._person, self._max_how_far)
             self._finished()
 
     @override
@@ -30,16 +30,16 @@ class FindHome(Task):
                         if not structure.has_owner():
                             self._person.assign_home(structure)
                             self._finished()
-                            logger.info(f"{self._person} found a home")
+                            logger.info("{} found a home", self._person)
                             return
                     else:
                         raise Exception("You are trying to go to a Home but are getting a different Structure")
             # if all homes have owners, construction a home (add build_home task)
-            logger.info(f"{self._person.get_name()} needs to start building a home")
+            logger.info("{} needs to start building a home", self._person.get_name())
             self._person.start_home_construction()
         else:
             self._finished()
-            logger.warning(f"{self._person} should already has a home: {self._person.has_home()}")
+            logger.warning("{} should already has a home: {}", self._person, self._person.has_home())
 
     @override
     def _clean_up_task(self) -> None:
@@ -8,17 +8,19 @@ from src.simulation.people.person.scheduler.task.start_construction.start_constr
 from src.simulation.people.person.scheduler.task.task_type import TaskType
 
 if TYPE_CHECKING:
+    from src.config import Config
     from src.simulation.people.person.person import Person
     from src.simulation.simulation import Simulation
 
 
 class StartBarnConstruction(StartConstruction):
     def __init__(self, simulation: Simulation, person: Person) -> None:
+        config: Config = settings.get_config()
         super().__init__(
             simulation,
             person,
-            settings.get("barn_size", 3),
-            settings.get("barn_size", 3),
+            config.barn_size,
+            config.barn_size,
             StructureType.CONSTRUCTION_BARN,
             TaskType.START_BARN_CONSTRUCTION,
         )
@@ -30,6 +30,9 @@ class Task(ABC):
     def __lt__(self, other: Task) -> bool:
         return self.get_priority() < other.get_priority()
 
+    def get_task_type(self) -> TaskType:
+        return self._task_type
+
     def get_interruptions(self) -> int:
         return self._interruptions
 
@@ -53,7 +56,7 @@ class Task(ABC):
             else:
                 reward = -1
             self._person.update_scheduler_rewards(self._task_type, reward)
-            logger.debug(f"{self._person} should have updated scheduler rewards")
+            logger.debug("{} should have updated scheduler rewards", self._person)
 
     def is_finished(self) -> bool:
         return self._is_finished
@@ -37,24 +37,24 @@ class Transport(Task):
             self._what_resource = self._backpack.what_resource()
             amount = self._backpack.get_resource(self._what_resource)
             self._resource = self._backpack.remove_resource(self._what_resource, amount)
-            logger.debug(f"Removed {amount} {self._what_resource} from backpack")
+            logger.debug("Removed {} {} from backpack", amount, self._what_resource)
         if self._store:  # I am at the store
-            logger.debug(f"{self._person} should be at {self._store}")
+            logger.debug("{} should be at {}", self._person, self._store)
             self._store.add_resource(self._what_resource, self._resource)
             self._what_resource = None
             self._resource = None
             self._store = None
             self._finished()
-            logger.info(f"{self._person} added {self._resource} {self._what_resource} at {self._resource}")
+            logger.info("{} added {} {} at {}", self._person, self._resource, self._what_resource, self._resource)
         else:
-            logger.debug(f"Need to go to workable structure, {self._store_structure}")
+            logger.debug("Need to go to workable structure, {}", self._store_structure)
             move_result: MoveResult = self._person.move_to_workable_structure(self._store_structure)
             self._store: Optional[Store] = move_result.get_structure()
             if move_result.has_failed():
                 self._finished(False)
                 logger.warning("Move result failed")
                 return
-            logger.debug(f"Store {self._store} assigned to transport")
+            logger.debug("Store {} assigned to transport", self._store)
 
     @override
     def _clean_up_task(self) -> None:
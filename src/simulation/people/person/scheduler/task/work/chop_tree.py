@@ -18,6 +18,6 @@ class ChopTree(Work):
             simulation,
             person,
             StructureType.TREE,
-            settings.get("wood", "wood"),
+            settings.get_config().wood,
             TaskType.CHOP_TREE,
         )
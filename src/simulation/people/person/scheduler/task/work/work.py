@@ -53,7 +53,7 @@ class Work(Task, ABC):
                 self._person.get_backpack().add_resource(self._resource_name, resource)
                 self._person.update_navigator_rewards(resource)
                 self._finished()
-                logger.info(f"{self._person} got {resource} {self._resource_name}")
+                logger.info("{} got {} {}", self._person, resource, self._resource_name)
 
         else:
             move_result: MoveResult = self._person.move_to_workable_structure(self._work_structure)
@@ -62,13 +62,13 @@ class Work(Task, ABC):
                 self._finished(False)
                 logger.warning("Move result failed")
                 return
-            logger.info(f"{self._person} is working at {self._work_structure}")
+            logger.info("{} is working at {}", self._person, self._work_structure)
 
     @override
     def _clean_up_task(self) -> None:
         if self._work:
             self._work.remove_worker(self._person)
-            logger.info(f"Removed worker,{self._person}, from {self._work_structure}")
+            logger.info("Removed worker,{}, from {}", self._person, self._work_structure)
 
     @override
     def get_remaining_time(self) -> int:
@@ -18,6 +18,6 @@ class WorkFarm(Work):
             simulation,
             person,
             StructureType.FARM,
-            settings.get("food", "food"),
+            settings.get_config().food,
             TaskType.WORK_FARM,
         )
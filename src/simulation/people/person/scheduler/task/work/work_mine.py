@@ -18,6 +18,6 @@ class WorkMine(Work):
             simulation,
             person,
             StructureType.MINE,
-            settings.get("stone", "stone"),
+            settings.get_config().stone,
             TaskType.WORK_MINE,
         )
@@ -11,6 +11,7 @@ from src.simulation.grid.structure.store.barn import Barn
 from src.simulation.people.person.scheduler.task.task_type import TaskType
 
 if TYPE_CHECKING:
+    from src.config import Config
     from src.simulation.people.person.person import Person
     from src.simulation.simulation import Simulation
 
@@ -22,9 +23,11 @@ class Thinker:
         self._scheduler = person.get_scheduler()
 
         # preferences per person
-        self._hunger_preference: int = random.randint(
-            settings.get("hunger_pref_min", 50), settings.get("hunger_pref_max", 100)
-        )
+        config: Config = settings.get_config()
+        self._hunger_preference: int = random.randint(config.hunger_pref_min, config.hunger_pref_max)
+        self._hunger_damage_threshold: int = config.hunger_damage_threshold
+        self._hunger_regen_threshold: int = config.hunger_regen_threshold
+        self._epsilon: float = config.person_epsilon
 
         self._time_without_home: int = 0
 
@@ -61,20 +64,27 @@ class Thinker:
         else:
             self._time_without_home = 0
         logger.info(
-            f"{self._person.get_name()} is starting an action with current hunger={self._person.get_hunger()} and health={self._person.get_health()}"
+            "{} is starting an action with current hunger={} and health={}",
+            self._person.get_name(),
+            self._person.get_hunger(),
+            self._person.get_health(),
         )
         self._person.set_hunger(-1)
-        logger.debug(f"{self._person.get_name()}'s hunger decreased by 1 to {self._person.get_hunger()}")
+        logger.debug("{}'s hunger decreased by 1 to {}", self._person.get_name(), self._person.get_hunger())
 
-        if self._person.get_hunger() < settings.get("hunger_damage_threshold", 20):
+        if self._person.get_hunger() < self._hunger_damage_threshold:
             self._person.set_health(-1)
             logger.debug(
-                f"{self._person.get_name()}'s health decreased due to being hungry (Health: {self._person.get_health()})"
+                "{}'s health decreased due to being hungry (Health: {})",
+                self._person.get_name(),
+                self._person.get_health(),
             )
-        elif self._person.get_hunger() > settings.get("hunger_regen_threshold", 50):
+        elif self._person.get_hunger() > self._hunger_regen_threshold:
             self._person.set_health(1)
             logger.debug(
-                f"{self._person.get_name()}'s health increased due to being full (Health: {self._person.get_health()})"
+                "{}'s health increased due to being full (Health: {})",
+                self._person.get_name(),
+                self._person.get_health(),
             )
 
         self._add_tasks()
@@ -82,58 +92,64 @@ class Thinker:
         self._adjust_priorities()
 
         logger.debug(
-            f"{self._person.get_name()} completed action with health={self._person.get_health()} and hunger={self._person.get_hunger()}"
+            "{} completed action with health={} and hunger={}",
+            self._person.get_name(),
+            self._person.get_health(),
+            self._person.get_hunger(),
         )
 
     def update_scheduler_rewards(self, task_type: TaskType, reward: int) -> None:
         old_reward = self._work_rewards.get(task_type, 0)
         self._work_rewards[task_type] = old_reward + reward
         logger.debug(
-            f"Updated rewards for {self._person.get_name()}: '{task_type}' reward changed from {old_reward} to {self._work_rewards[task_type]}"
+            "Updated rewards for {}: '{}' reward changed from {} to {}",
+            self._person.get_name(),
+            task_type,
+            old_reward,
+            self._work_rewards[task_type],
         )
 
     def _add_tasks(self) -> None:  # where tasks are added to the scheduler.
-        logger.info(f"Adding tasks for {self._person.get_name()}")
+        logger.info("Adding tasks for {}", self._person.get_name())
         # check to do this stuff every once in a while
         self._scheduler.add(TaskType.EXPLORE)
-        logger.debug(f"{self._person.get_name()} added EXPLORE task")
+        logger.debug("{} added EXPLORE task", self._person.get_name())
 
         if not self._person.get_spouse():
             self._scheduler.add(TaskType.FIND_SPOUSE)
-            logger.debug(f"{self._person.get_name()} added FIND_SPOUSE task")
+            logger.debug("{} added FIND_SPOUSE task", self._person.get_name())
 
         if not self._person.get_home():
             self._scheduler.add(TaskType.FIND_HOME)
-            logger.debug(f"{self._person.get_name()} added FIND_HOME task")
+            logger.debug("{} added FIND_HOME task", self._person.get_name())
 
         # Deliver items you are carrying
         if self._person.get_backpack().has_items():
             self._scheduler.add(TaskType.TRANSPORT)
-            logger.debug(f"{self._person.get_name()} has items in backpack and added TRANSPORT task")
+            logger.debug("{} has items in backpack and added TRANSPORT task", self._person.get_name())
 
         # Epsilon-Greedy algorithm to decide what type of work to do
         if self._person.get_backpack().has_capacity():
             self._add_work_task()
         else:
-            logger.debug(f"{self._person.get_name()}'s backpack is full; no work task added")
+            logger.debug("{}'s backpack is full; no work task added", self._person.get_name())
 
         if self._person.get_hunger() < self._hunger_preference:
             self._scheduler.add(TaskType.EAT)
-            logger.debug(f"{self._person.get_name()} is hungry and added EAT task")
+            logger.debug("{} is hungry and added EAT task", self._person.get_name())
 
     def _add_work_task(self) -> None:
         keys: List[TaskType] = list(self._work_rewards.keys())
-        epsilon: float = settings.get("person_epsilon", 0.05)
-        if np.random.rand() < epsilon or all(value == 0 for value in self._work_rewards.values()):
+        if np.random.rand() < self._epsilon or all(value == 0 for value in self._work_rewards.values()):
             random_index: int = np.random.randint(0, len(keys) - 1)
             task_type: TaskType = keys[random_index]
-            logger.debug(f"{self._person.get_name()} is exploring by selecting random task: {task_type}")
+            logger.debug("{} is exploring by selecting random task: {}", self._person.get_name(), task_type)
         else:
             task_type: TaskType = max(self._work_rewards, key=self._work_rewards.get)
-            logger.debug(f"{self._person.get_name()} selected highest reward task: {task_type}")
+            logger.debug("{} selected highest reward task: {}", self._person.get_name(), task_type)
 
         self._scheduler.add(task_type)
-        logger.info(f"{self._person.get_name()} added task '{task_type}' to scheduler")
+        logger.info("{} added task '{}' to scheduler", self._person.get_name(), task_type)
 
     def _adjust_priorities(self) -> None:
         # explore should be high if they dont have a lot of memories
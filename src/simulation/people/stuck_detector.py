@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING, List
+
+from src.logger import logger
+
+if TYPE_CHECKING:
+    from src.simulation.grid.grid import Grid
+    from src.simulation.grid.location import Location
+    from src.simulation.people.people import People
+    from src.simulation.people.person.person import Person
+
+
+class StuckDetector:
+    def __init__(self, people: People, grid: Grid):
+        self._people = people
+        self._grid = grid
+
+    def get_stuck_people(self) -> List[Person]:
+        """
+        A person is stuck if they can't get to a random empty spot near town.
+        The spots are found once for everyone and each check is a reachability lookup on the grid.
+        """
+        logger.debug("Checking who is stuck")
+        spots: List[Location] = self._grid.get_empty_spots_near_town()
+        if not spots:
+            logger.warning("No empty spots near town to check if people are stuck")
+            return []
+
+        stuck: List[Person] = []
+        for person in self._people.get_people():
+            location: Location = person.get_location()
+            spot: Location = random.choice(spots)
+            if spot == location:
+                others: List[Location] = [other for other in spots if other != location]
+                if not others:
+                    continue
+                spot = random.choice(others)
+
+            if not self._grid.can_reach(location, spot):
+                logger.warning("{} is stuck, they can't get to {}", person.get_name(), spot)
+                stuck.append(person)
+
+        logger.debug("Found {} stuck people out of {}", len(stuck), len(self._people))
+        return stuck
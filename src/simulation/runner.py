@@ -0,0 +1,103 @@
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from numbers import Number
+from typing import Dict, Iterator, Optional, Sequence
+
+import numpy as np
+
+from src.config import Config
+from src.logger import logger
+from src.simulation.simulation import Simulation
+
+
+@dataclass(frozen=True)
+class RunRecord:
+    """
+    The compact outcome of one simulation: every state's numbers by year (disaster counts included) and how long it took.
+    A failed run keeps the years it recorded before failing and the error's traceback.
+    """
+
+    index: int
+    seed: int
+    seconds: float
+    states: Dict[str, Dict[int, Dict[str, Number]]] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def is_failed(self) -> bool:
+        return self.error is not None
+
+    def to_json(self) -> str:
+        # numpy scalars are written as plain numbers
+        return json.dumps(asdict(self), default=lambda value: value.item())
+
+
+def run_simulations(
+    config: Config,
+    seeds: Sequence[int],
+    workers: Optional[int] = None,
+    results_dir: Optional[str] = None,
+) -> Iterator[RunRecord]:
+    """
+    Run a simulation with config for every seed in a pool of worker processes, one per core when workers is None,
+    yielding each run's record as soon as it finishes. A run that fails gives a failed record, the rest keep going.
+    When results_dir is given every run also saves its full results to results_dir/simulation_{index + 1}.
+    """
+    # spawned workers start clean instead of inheriting the log sinks' threads and open files
+    context = multiprocessing.get_context("spawn")
+    workers = workers or os.cpu_count() or 1
+    logger.info("Running {} simulations on {} processes.", len(seeds), workers)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_set_up_worker) as pool:
+        futures: Dict[Future, int] = {
+            pool.submit(_run, config, index, seed, results_dir): index for index, seed in enumerate(seeds)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                record: RunRecord = future.result()
+            except Exception:
+                # the worker itself died, there is nothing but the error to report
+                record = RunRecord(index, seeds[index], 0.0, error=traceback.format_exc())
+            if record.is_failed():
+                logger.error("Simulation {} (seed {}) failed:\n{}", index + 1, record.seed, record.error)
+            else:
+                logger.info(
+                    "Simulation {} (seed {}) completed in {:.2f} seconds", index + 1, record.seed, record.seconds
+                )
+            yield record
+
+
+def _set_up_worker() -> None:
+    # the main process does the logging, workers only report problems
+    logger.remove()
+    logger.configure("WARNING")
+    logger.add(sys.stderr, level="WARNING", format="{time:YYYY-MM-DD at HH:mm:ss} | {level} | {message}")
+
+
+def _run(config: Config, index: int, seed: int, results_dir: Optional[str]) -> RunRecord:
+    random.seed(seed)
+    np.random.seed(seed)
+
+    start_time = time.time()
+    simulation: Optional[Simulation] = None
+    error: Optional[str] = None
+    try:
+        simulation = Simulation(config)
+        simulation.run()
+    except Exception:
+        error = traceback.format_exc()
+    seconds = time.time() - start_time
+
+    if simulation is None:
+        return RunRecord(index, seed, seconds, error=error)
+    results = simulation.get_results()
+    if results_dir is not None:
+        results.save(os.path.join(results_dir, f"simulation_{index + 1}"))
+    return RunRecord(index, seed, seconds, results.get_states(), error)
@@ -1,13 +1,28 @@
+from typing import Optional
+
+from src.config import Config
 from src.logger import logger
 from src.settings import settings
+from src.simulation.grid.cell_codec import CellCodec
 from src.simulation.grid.grid import Grid
 from src.simulation.people.people import People
-from src.simulation.visualization.visualizer import Visualizer
+from src.simulation.visualization.results import SimulationResults
 
 
 class Simulation:
-    def __init__(self) -> None:
+    def __init__(self, config: Optional[Config] = None) -> None:
+        """
+        Runs with config, or with the active settings when it is None.
+        The settings (and the grid characters of CellCodec) are process wide, so config is made the active one
+        while the simulation is built and again when it runs. Simulations made one after another each run with
+        their own config, but only one config can be active in a process at a time: don't run simulations with
+        different configs at once in one process, run them in separate processes (see runner.py).
+        """
         logger.debug("Initializing simulation settings.")
+        if config is not None:
+            settings.use(config)
+        config = settings.get_config()
+        self._config: Config = config
 
         self._day: int = 0
         logger.debug("self._day initialized to 0.")
@@ -15,59 +30,67 @@ class Simulation:
         self._time: int = 0
         logger.debug("self._time initialized to 0.")
 
-        actions_per_day = settings.get("actions_per_day", 5)
-        logger.debug(f"actions_per_day set to {actions_per_day}.")
+        actions_per_day = config.actions_per_day
+        logger.debug("actions_per_day set to {}.", actions_per_day)
 
-        days_per_year = settings.get("days_per_year", 365)
-        logger.debug(f"days_per_year set to {days_per_year}.")
+        days_per_year = config.days_per_year
+        logger.debug("days_per_year set to {}.", days_per_year)
 
-        years = settings.get("years", 50)
-        logger.debug(f"years set to {years}.")
+        years = config.years
+        logger.debug("years set to {}.", years)
 
-        grid_size = settings.get("grid_size", 100)
-        logger.debug(f"grid_size set to {grid_size}.")
+        grid_size = config.grid_size
+        logger.debug("grid_size set to {}.", grid_size)
 
         self._days_per_year: int = days_per_year
-        logger.debug(f"self._days_per_year initialized to {self._days_per_year}.")
+        logger.debug("self._days_per_year initialized to {}.", self._days_per_year)
 
         self._actions_per_day: int = actions_per_day
-        logger.debug(f"self._actions_per_day initialized to {self._actions_per_day}.")
+        logger.debug("self._actions_per_day initialized to {}.", self._actions_per_day)
 
         self._years: int = years
-        logger.debug(f"self._years initialized to {self._years}.")
+        logger.debug("self._years initialized to {}.", self._years)
 
         self._grid: Grid = Grid(self, grid_size)
-        logger.debug(f"Grid initialized with grid_size {grid_size}.")
+        logger.debug("Grid initialized with grid_size {}.", grid_size)
 
         self._people: People = People(self, actions_per_day)
-        logger.debug(f"People initialized with actions_per_day {actions_per_day}.")
+        logger.debug("People initialized with actions_per_day {}.", actions_per_day)
 
         self._max_days: int = self._years * self._days_per_year
-        logger.debug(f"self._max_days calculated as {self._max_days}.")
+        logger.debug("self._max_days calculated as {}.", self._max_days)
+
+        self._results: SimulationResults = SimulationResults()
 
     def actions_per_year(self) -> int:
         result = self._days_per_year * self._actions_per_day
         logger.debug(
-            f"Calculating actions_per_year: {self._days_per_year} days/year * {self._actions_per_day} actions/day = {result}."
+            "Calculating actions_per_year: {} days/year * {} actions/day = {}.",
+            self._days_per_year,
+            self._actions_per_day,
+            result,
         )
         return result
 
     def increment_time(self) -> None:
-        logger.debug(f"Incrementing time. Current time: {self._time}.")
+        logger.debug("Incrementing time. Current time: {}.", self._time)
         self._time += 1
-        logger.debug(f"Time incremented. New time: {self._time}.")
+        logger.debug("Time incremented. New time: {}.", self._time)
 
     def get_time(self) -> int:
-        logger.debug(f"Retrieving current time: {self._time}.")
+        logger.debug("Retrieving current time: {}.", self._time)
         return self._time
 
-    def run(self) -> Visualizer:
+    def run(self) -> SimulationResults:
         logger.info("Simulation started.")
-        visualizer: Visualizer = Visualizer()
+        # another simulation may have been made with a different config since this one was
+        settings.use(self._config)
+        CellCodec.configure(self._config)
+        results: SimulationResults = self._results
 
         for day in range(self._max_days):
             self._day = day
-            logger.info(f"Day {day} begins.")
+            logger.info("Day {} begins.", day)
 
             if len(self._people) == 0:  # all the people dead
                 logger.info("Everybody died! Game over!")
@@ -86,7 +109,7 @@ class Simulation:
             self._people.kill_stuck()
 
             if self._has_been_a_year(day):
-                logger.info(f"Year completed on day {day}. Performing yearly actions.")
+                logger.info("Year completed on day {}. Performing yearly actions.", day)
                 self._people.swap_homes()  # people want to live close to work
                 logger.info("People swapped homes.")
 
@@ -103,17 +126,14 @@ class Simulation:
                 logger.info("Disasters created for the year.")
 
                 year = self._get_year(day)
-                logger.info(f"Year {year} logged into the visualizer.")
-                visualizer.add(year, self._grid, self._people)
-
-                # for debugging
-                # visualizer.display_town_slide_show()
+                logger.info("Year {} logged into the results.", year)
+                results.add(year, self._grid, self._people)
 
                 logger.info("Flushing logs for end-of-year data.")
                 self.flush()
 
         logger.info("Simulation ended.")
-        return visualizer
+        return results
 
     def flush(self) -> None:
         logger.debug("Flushing people and grid data...")
@@ -121,9 +141,10 @@ class Simulation:
         logger.debug("People data flushed.")
         self._grid.flush()
         logger.debug("Grid data flushed.")
+        logger.flush()
 
     def get_day(self) -> int:
-        logger.debug(f"Retrieving current day: {self._day}.")
+        logger.debug("Retrieving current day: {}.", self._day)
         return self._day
 
     def _create_disasters(self) -> None:
@@ -136,19 +157,31 @@ class Simulation:
     def _has_been_a_year(self, day) -> bool:
         is_year = day % self._days_per_year == 0
         logger.debug(
-            f"Checking if day {day} marks the end of a year. Days per year: {self._days_per_year}. Result: {is_year}."
+            "Checking if day {} marks the end of a year. Days per year: {}. Result: {}.",
+            day,
+            self._days_per_year,
+            is_year,
         )
         return is_year
 
     def _get_year(self, day: int) -> int:
         year = day // self._days_per_year
-        logger.debug(f"Calculating year from day {day}. Days per year: {self._days_per_year}. Year: {year}.")
+        logger.debug("Calculating year from day {}. Days per year: {}. Year: {}.", day, self._days_per_year, year)
         return year
 
     def get_grid(self) -> Grid:
         logger.debug("Retrieving grid object.")
         return self._grid
 
+    def get_results(self) -> SimulationResults:
+        """What the simulation recorded so far, also after run failed part way."""
+        return self._results
+
     def get_people(self) -> People:
         logger.debug("Retrieving people object.")
         return self._people
+
+
+def run(config: Optional[Config] = None) -> SimulationResults:
+    """Run one simulation with config (the active settings when None), returning what it recorded every year."""
+    return Simulation(config).run()
@@ -1,123 +1,98 @@
-import random
-import time
-from typing import Dict, List
+import math
+import os
+from typing import Dict, List, Optional
 
 import matplotlib.pyplot as plt
+import numpy as np
 import seaborn as sns
-from matplotlib import colors
-from tqdm import tqdm
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 
+from src.config import Config
 from src.logger import logger
-from src.settings import settings
+from src.settings import settings, settings_dir
+from src.simulation.grid.cell_codec import CellCodec
 
 
 class GridPlotter:
-    def __init__(self):
-        # Initialize the years dictionary to store plot figures
-        self._years: Dict[int, plt.Figure] = {}
-        logger.debug("Initialized _years dictionary to store plot figures.")
-
-        # Initialize color map dictionary for storing color assignments
-        self._color_map: dict[str, str] = {}
-        logger.debug("Initialized _color_map dictionary for color assignments.")
-
-        # Use a perceptually uniform palette to ensure distinct colors
-        self._palette = sns.color_palette("husl", n_colors=25)  # 25 distinct colors
-        logger.debug("Initialized color palette with 100 distinct colors using 'husl'.")
-
-        # Set a fixed salt for consistency
-        self._salt = 12345
-        logger.debug(f"Initialized fixed salt value: {self._salt}")
-
-    def _get_color_for_char(self, char: str) -> str:
-        if char not in self._color_map:
-            # Hash the character with a fixed salt for consistent results
-            hash_value = hash(char + str(self._salt))  # Add salt to the hash
-            color_index = abs(hash_value) % len(self._palette)
-            color_tuple = self._palette[color_index]
-
-            # Convert the RGB tuple to a hex color string
-            hex_color = colors.to_hex(color_tuple)
-
-            # Log the color generation process
-            logger.debug(f"Generated new color for '{char}': {hex_color}")
-
-            # Store the color for future use
-            self._color_map[char] = hex_color
-        else:
-            # Log when the color is being retrieved from the map
-            logger.debug(f"Retrieved existing color for '{char}': {self._color_map[char]}")
-
-        return self._color_map[char]
-
-    def add(self, year: int, grid: List[List[str]]) -> None:
-        logger.info(f"Adding grid snapshot for year {year}...")
-
-        fig, ax = plt.subplots(
-            figsize=(settings.get("fig_size", 8), settings.get("fig_size", 8))
-        )  # Adjust size as needed
-        ax.set_title("Grid Snapshot")
-        ax.set_xlabel("X Axis (Column index)")
-        ax.set_ylabel("Y Axis (Row index)")
-
-        # Determine the grid size
-        num_rows = len(grid)
-        num_cols = len(grid[0])
-
-        # Adjust plot limits to fit the squares tightly
-        ax.set_xlim(0, num_cols)
-        ax.set_ylim(num_rows, 0)  # Reverse Y-axis to match typical grid coordinates
+    """
+    Renders each year's grid as one image, the cell codes are looked up in a table of colors,
+    and writes it to a png in the plot directory right away, so no figures are kept between years.
+    Grids wider or taller than grid_plot_max_size cells are downsampled to fit.
+    """
+
+    def __init__(self, chars: List[str], directory: Optional[str] = None) -> None:
+        """chars is the character of every cell code, for the color key."""
+        config: Config = settings.get_config()
+        self._chars: List[str] = chars
+        self._directory: str = os.path.join(os.path.dirname(settings_dir), directory or config.plot_dir)
+        self._fig_size: int = config.fig_size
+        self._max_size: int = config.grid_plot_max_size
+
+        # Use a perceptually uniform palette to ensure distinct colors, one per cell code
+        palette = sns.color_palette("husl", n_colors=len(chars) + 1)
+        self._colors: np.ndarray = (np.array(palette) * 255).astype(np.uint8)  # rgb by cell code
+        self._colors[CellCodec.EMPTY] = (255, 255, 255)
+        logger.debug("Initialized {} cell colors, plots go to {}.", len(self._colors), self._directory)
+
+        # year -> png written for it
+        self._years: Dict[int, str] = {}
+
+    def add(self, year: int, cells: np.ndarray) -> None:
+        """Render the cell codes of the grid (indexed [y, x]) for year to a png."""
+        logger.info("Adding grid snapshot for year {}...", year)
+
+        # keep every step-th cell along each axis so the image is at most max_size cells on a side
+        step = max(1, math.ceil(max(cells.shape) / self._max_size))
+        image = self._colors[cells[::step, ::step]]
+        logger.debug("Rendering a {}x{} grid at 1/{} scale.", cells.shape[1], cells.shape[0], step)
+
+        fig = Figure(figsize=(self._fig_size, self._fig_size))
+        ax = fig.add_subplot()
+        ax.set_title(f"Grid Snapshot, Year {year}")
+        ax.imshow(image, interpolation="nearest", extent=(0, cells.shape[1], cells.shape[0], 0))
         ax.axis("off")  # Turn off axes and labels
+        self._add_color_key(ax, np.unique(cells))
 
-        logger.debug(f"Grid size: {num_rows} rows, {num_cols} columns.")
-        logger.info("Starting to plot each grid element...")
+        os.makedirs(self._directory, exist_ok=True)
+        path = os.path.join(self._directory, f"grid_year_{year:04d}.png")
+        fig.savefig(path, bbox_inches="tight")
+        self._years[year] = path
+        logger.info("Grid snapshot for year {} written to {}.", year, path)
 
-        # Plot each grid element with square markers
-        square_size = 1  # You can change this if needed
-        for row_idx, row in tqdm(enumerate(grid), desc="Adding Grid to Plot", total=num_rows):
-            for col_idx, char in enumerate(row):
-                color = self._get_color_for_char(char)
-                ax.scatter(col_idx, row_idx, color=color, s=square_size**2 * 100, marker="s")
+    def get_paths(self) -> Dict[int, str]:
+        """The png written for each year, treat it as read only."""
+        return self._years
 
-        # Add the color legend (key)
-        logger.info("Adding color legend to the plot...")
-        self._add_color_key(ax)
-
-        # Store the figure for this year
-        self._years[year] = fig
-        logger.info(f"Grid snapshot for year {year} added successfully.")
-
-    def _add_color_key(self, ax) -> None:
-        """Add a color key showing the terrain types and their associated colors."""
-        # Dynamically generate terrain types (for example, we use characters 'a', 'b', 'c', etc.)
-        terrain_types = list(self._color_map.keys())  # Use the terrain types from color_map
-
-        # Create a list of scatter objects (one per terrain type)
+    def _add_color_key(self, ax, codes: np.ndarray) -> None:
+        """Add a color key showing the terrain types in the grid and their associated colors."""
         handles = []
-        for char in terrain_types:
-            color = self._get_color_for_char(char)
-            handle = plt.Line2D(
+        for code in codes.tolist():
+            char = self._chars[code]
+            handle = Line2D(
                 [0],
                 [0],
                 marker="s",
                 color="w",
-                markerfacecolor=color,
+                markerfacecolor=self._colors[code] / 255,
+                markeredgecolor="black",
                 markersize=10,
-                label=char,
+                label=repr(char),
             )
             handles.append(handle)
 
-        # Add the legend
         ax.legend(handles=handles, loc="upper right", fontsize=8, title="Terrain Types")
-        logger.info("Color key added to the plot.")
 
     def show_slide_show(self, pause_time: float = 2.0) -> None:
-        """Displays a slideshow of the stored figures."""
+        """Displays a slideshow of the stored snapshots."""
         logger.info("Starting slideshow...")
 
-        for year, fig in tqdm(self._years.items(), desc="Displaying Slideshow", total=len(self._years)):
-            plt.show()
-            logger.info(f"Displayed slide for year {year}.")
-            time.sleep(pause_time)
+        for year, path in self._years.items():
+            fig = plt.figure(figsize=(self._fig_size, self._fig_size))
+            plt.imshow(plt.imread(path))
+            plt.axis("off")
+            plt.pause(pause_time)
+            plt.close(fig)
+            logger.info("Displayed slide for year {}.", year)
 
         logger.info("Slideshow completed.")
@@ -0,0 +1,94 @@
+import json
+import os
+from numbers import Number
+from typing import Any, Dict, List
+
+import numpy as np
+
+from src.logger import logger
+from src.simulation.grid.cell_codec import CellCodec
+from src.simulation.grid.grid import Grid
+from src.simulation.people.people import People
+from src.simulation.visualization.state.grid_disaster_state import GridDisasterState
+from src.simulation.visualization.state.grid_state import GridState
+from src.simulation.visualization.state.people_disaster_state import PeopleDisasterState
+from src.simulation.visualization.state.people_state import PeopleState
+from src.simulation.visualization.state.population_snapshot import PopulationSnapshot
+from src.simulation.visualization.state.resource_state import ResourceState
+from src.simulation.visualization.state.task_state import TaskState
+
+
+class SimulationResults:
+    """
+    What a simulation recorded at the end of every year: the numbers of each state and the grid's cell codes.
+    Nothing here imports a plotting library, save writes the results as results.json and grids.npz
+    for the Visualizer (or anything else) to load later.
+    """
+
+    def __init__(self) -> None:
+        # { title: { year: { label: number } } }
+        self._states: Dict[str, Dict[int, Dict[str, Number]]] = {}
+        # year -> cell codes of the grid, indexed [y, x]
+        self._grids: Dict[int, np.ndarray] = {}
+        # the character of every cell code
+        self._chars: List[str] = CellCodec.get_chars()
+
+    def add(self, year: int, grid: Grid, people: People) -> None:
+        logger.debug("Recording year {}.", year)
+        self._grids[year] = grid.get_cells().copy()
+
+        # the people and stores are walked once for all the states
+        snapshot: PopulationSnapshot = PopulationSnapshot(grid, people)
+        states = [
+            GridDisasterState(grid),
+            GridState(grid),
+            PeopleDisasterState(people),
+            PeopleState(snapshot),
+            ResourceState(snapshot),
+            TaskState(snapshot),
+        ]
+        for state in states:
+            title, data = state.get_data(state)
+            self._states.setdefault(title, {})[year] = data
+            logger.debug("Recorded {} for year {}: {}", title, year, data)
+
+    def get_states(self) -> Dict[str, Dict[int, Dict[str, Number]]]:
+        return self._states
+
+    def get_grids(self) -> Dict[int, np.ndarray]:
+        return self._grids
+
+    def get_chars(self) -> List[str]:
+        return self._chars
+
+    def get_years(self) -> List[int]:
+        return sorted(self._grids)
+
+    def save(self, directory: str) -> None:
+        """Write results.json (the chars and every state's numbers by year) and grids.npz (cell codes by year)."""
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "results.json"), "w", encoding="utf-8") as file:
+            json.dump({"chars": self._chars, "states": self._states}, file, indent=1, default=self._to_number)
+        np.savez_compressed(
+            os.path.join(directory, "grids.npz"), **{f"year_{year}": cells for year, cells in self._grids.items()}
+        )
+        logger.info("Results of {} years saved to {}.", len(self._grids), directory)
+
+    @classmethod
+    def load(cls, directory: str) -> "SimulationResults":
+        results = cls()
+        with open(os.path.join(directory, "results.json"), "r", encoding="utf-8") as file:
+            saved: Dict[str, Any] = json.load(file)
+        results._chars = saved["chars"]
+        results._states = {
+            title: {int(year): data for year, data in years.items()} for title, years in saved["states"].items()
+        }
+        with np.load(os.path.join(directory, "grids.npz")) as grids:
+            results._grids = {int(name.removeprefix("year_")): grids[name] for name in grids.files}
+        logger.debug("Loaded results of {} years from {}.", len(results._grids), directory)
+        return results
+
+    @staticmethod
+    def _to_number(value: Any) -> Number:
+        # numpy scalars
+        return value.item()
@@ -18,28 +18,28 @@ class GridState(State):
     @override
     def __init__(self, grid: Grid):
         self._barn_count: int = grid.get_structure_count(Barn)
-        logger.debug(f"Barn count: {self._barn_count}")
+        logger.debug("Barn count: {}", self._barn_count)
 
         self._construction_barn_count: int = grid.get_structure_count(ConstructionBarn)
-        logger.debug(f"Construction barn count: {self._construction_barn_count}")
+        logger.debug("Construction barn count: {}", self._construction_barn_count)
 
         self._farm_count: int = grid.get_structure_count(Farm)
-        logger.debug(f"Farm count: {self._farm_count}")
+        logger.debug("Farm count: {}", self._farm_count)
 
         self._construction_farm_count: int = grid.get_structure_count(ConstructionFarm)
-        logger.debug(f"Construction farm count: {self._construction_farm_count}")
+        logger.debug("Construction farm count: {}", self._construction_farm_count)
 
         self._mine_count: int = grid.get_structure_count(Mine)
-        logger.debug(f"Mine count: {self._mine_count}")
+        logger.debug("Mine count: {}", self._mine_count)
 
         self._construction_mine_count: int = grid.get_structure_count(ConstructionMine)
-        logger.debug(f"Construction mine count: {self._construction_mine_count}")
+        logger.debug("Construction mine count: {}", self._construction_mine_count)
 
         self._home_count: int = grid.get_structure_count(Home)
-        logger.debug(f"Home count: {self._home_count}")
+        logger.debug("Home count: {}", self._home_count)
 
         self._construction_home_count: int = grid.get_structure_count(ConstructionHome)
-        logger.debug(f"Construction home count: {self._construction_home_count}")
+        logger.debug("Construction home count: {}", self._construction_home_count)
 
         self._tree_count: int = grid.get_structure_count(Tree)
-        logger.debug(f"Tree count: {self._tree_count}")
+        logger.debug("Tree count: {}", self._tree_count)
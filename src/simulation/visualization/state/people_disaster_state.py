@@ -12,22 +12,22 @@ class PeopleDisasterState(State):
 
         # Initialize disaster attributes based on counts
         self._divorce = disaster_counts.get("divorce", 0)
-        logger.debug(f"Divorce disaster count: {self._divorce}")
+        logger.debug("Divorce disaster count: {}", self._divorce)
 
         self._sickness = disaster_counts.get("sickness", 0)
-        logger.debug(f"Sickness disaster count: {self._sickness}")
+        logger.debug("Sickness disaster count: {}", self._sickness)
 
         self._craving = disaster_counts.get("craving", 0)
-        logger.debug(f"Craving disaster count: {self._craving}")
+        logger.debug("Craving disaster count: {}", self._craving)
 
         self._death = disaster_counts.get("death", 0)
-        logger.debug(f"Death disaster count: {self._death}")
+        logger.debug("Death disaster count: {}", self._death)
 
         self._forget_tasks = disaster_counts.get("forget_tasks", 0)
-        logger.debug(f"Forget tasks disaster count: {self._forget_tasks}")
+        logger.debug("Forget tasks disaster count: {}", self._forget_tasks)
 
         self._sleepwalk = disaster_counts.get("sleepwalk", 0)
-        logger.debug(f"Sleepwalk disaster count: {self._sleepwalk}")
+        logger.debug("Sleepwalk disaster count: {}", self._sleepwalk)
 
         self._so_many_babies = disaster_counts.get("so_many_babies", 0)
-        logger.debug(f"So many babies disaster count: {self._so_many_babies}")
+        logger.debug("So many babies disaster count: {}", self._so_many_babies)
@@ -0,0 +1,113 @@
+from typing import Dict, Optional
+
+from src.config import Config
+from src.logger import logger
+from src.settings import settings
+from src.simulation.grid.grid import Grid
+from src.simulation.grid.structure.store.barn import Barn
+from src.simulation.grid.structure.store.home import Home
+from src.simulation.people.people import People
+from src.simulation.people.person.scheduler.task.task_type import TaskType
+
+
+class PopulationSnapshot:
+    """
+    Everything the yearly states report about people, their tasks and the stores,
+    gathered in one pass over the people and one over the barns and homes.
+    Task counts come from the counters each scheduler keeps for the year.
+    """
+
+    def __init__(self, grid: Grid, people: People) -> None:
+        config: Config = settings.get_config()
+        resources = (config.food, config.stone, config.wood)
+
+        self._people_count: int = len(people)
+        self._total_health: float = 0.0
+        self._total_hunger: float = 0.0
+        # task type -> this year's tasks of that type, None -> all of this year's tasks
+        self._complete_task_counts: Dict[Optional[TaskType], int] = {None: 0}
+        self._active_task_counts: Dict[Optional[TaskType], int] = {None: 0}
+
+        self._backpack_resources: Dict[str, int] = dict.fromkeys(resources, 0)
+        self._backpack_capacity: int = 0
+        self._remaining_backpack_capacity: int = 0
+        for person in people:
+            self._total_health += person.get_health()
+            self._total_hunger += person.get_hunger()
+
+            scheduler = person.get_scheduler()
+            for finished, counts in ((True, self._complete_task_counts), (False, self._active_task_counts)):
+                for task_type, count in scheduler.get_task_counts(finished).items():
+                    counts[task_type] = counts.get(task_type, 0) + count
+                    counts[None] += count
+
+            backpack = person.get_backpack()
+            for resource in resources:
+                self._backpack_resources[resource] += backpack.get_resource(resource)
+            self._backpack_capacity += backpack.get_capacity()
+            self._remaining_backpack_capacity += backpack.get_remaining_capacity()
+
+        self._barn_resources: Dict[str, int] = dict.fromkeys(resources, 0)
+        self._barn_capacity: int = 0
+        self._remaining_barn_capacity: int = 0
+        for barn in grid.get_structures(Barn):
+            for resource in resources:
+                self._barn_resources[resource] += barn.get_resource(resource)
+            self._barn_capacity += barn.get_capacity()
+            self._remaining_barn_capacity += barn.get_remaining_capacity()
+
+        self._home_food: int = 0
+        self._home_capacity: int = 0
+        self._remaining_home_capacity: int = 0
+        for home in grid.get_structures(Home):
+            self._home_food += home.get_resource(config.food)
+            self._home_capacity += home.get_capacity()
+            self._remaining_home_capacity += home.get_remaining_capacity()
+
+        logger.debug(
+            "Snapshot of {} people with {} complete and {} active tasks.",
+            self._people_count,
+            self._complete_task_counts[None],
+            self._active_task_counts[None],
+        )
+
+    def get_people_count(self) -> int:
+        return self._people_count
+
+    def get_average_health(self) -> float:
+        return self._total_health / self._people_count if self._people_count else 0.0
+
+    def get_average_hunger(self) -> float:
+        return self._total_hunger / self._people_count if self._people_count else 0.0
+
+    def get_average_task_count(self, task_type: Optional[TaskType], finished: bool) -> float:
+        """Average number of this year's tasks per person of task_type (any type when None) that are (not) finished."""
+        counts = self._complete_task_counts if finished else self._active_task_counts
+        return counts.get(task_type, 0) / self._people_count if self._people_count else 0.0
+
+    def get_backpack_resource(self, resource: str) -> int:
+        return self._backpack_resources[resource]
+
+    def get_backpack_capacity(self) -> int:
+        return self._backpack_capacity
+
+    def get_remaining_backpack_capacity(self) -> int:
+        return self._remaining_backpack_capacity
+
+    def get_barn_resource(self, resource: str) -> int:
+        return self._barn_resources[resource]
+
+    def get_barn_capacity(self) -> int:
+        return self._barn_capacity
+
+    def get_remaining_barn_capacity(self) -> int:
+        return self._remaining_barn_capacity
+
+    def get_home_food(self) -> int:
+        return self._home_food
+
+    def get_home_capacity(self) -> int:
+        return self._home_capacity
+
+    def get_remaining_home_capacity(self) -> int:
+        return self._remaining_home_capacity
@@ -1,29 +1,46 @@
-from src.simulation.grid.grid import Grid
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
 from src.logger import logger
-from src.simulation.people.people import People
-from src.simulation.visualization.plotter.grid_plotter import GridPlotter
-from src.simulation.visualization.plotter.state_plotter import StatePlotter
+from src.simulation.visualization.results import SimulationResults
+
+if TYPE_CHECKING:
+    from src.simulation.visualization.plotter.grid_plotter import GridPlotter
 
 
 class Visualizer:
-    def __init__(self) -> None:
+    """
+    Plots the results of a simulation. The plotting libraries are imported the first time something is plotted,
+    so runs that only save their results never load them.
+    """
+
+    def __init__(self, results: SimulationResults, directory: Optional[str] = None) -> None:
         logger.debug("Initializing Visualizer.")
-        self._grid_plotter: GridPlotter = GridPlotter()
-        logger.debug("GridPlotter initialized.")
-        self._state_plotter: StatePlotter = StatePlotter()
-        logger.debug("StatePlotter initialized.")
+        self._results: SimulationResults = results
+        self._directory: Optional[str] = directory  # where the town snapshots go, plot_dir when None
+        self._grid_plotter: Optional[GridPlotter] = None
+
+    def save_town_snapshots(self) -> None:
+        logger.debug("Writing town snapshots using GridPlotter.")
+        self._get_grid_plotter()
 
     def display_town_slide_show(self) -> None:
         logger.debug("Displaying town slide show using GridPlotter.")
-        self._grid_plotter.show_slide_show()
+        self._get_grid_plotter().show_slide_show()
 
     def display_simulation_stats(self):
+        from src.simulation.visualization.plotter.state_plotter import StatePlotter
+
         logger.debug("Displaying simulation statistics using StatePlotter.")
-        self._state_plotter.plot()
-
-    def add(self, year: int, grid: Grid, people: People):
-        logger.debug(f"Adding data for year {year} to GridPlotter and StatePlotter.")
-        logger.debug("Adding grid data to GridPlotter.")
-        self._grid_plotter.add(year, grid.get_grid())
-        logger.debug("Adding grid and people data to StatePlotter.")
-        self._state_plotter.add(year, grid, people)
+        StatePlotter(self._results.get_states()).plot()
+
+    def _get_grid_plotter(self) -> GridPlotter:
+        """The grid plotter, with a snapshot written for every year the first time it is asked for."""
+        if self._grid_plotter is None:
+            from src.simulation.visualization.plotter.grid_plotter import GridPlotter
+
+            self._grid_plotter = GridPlotter(self._results.get_chars(), self._directory)
+            for year, cells in self._results.get_grids().items():
+                self._grid_plotter.add(year, cells)
+        return self._grid_plotter
@@ -0,0 +1,11 @@
+import pytest
+
+from src.logger import logger
+
+
+@pytest.fixture(autouse=True, scope="session")
+def quiet_logger():
+    # the checks make thousands of grid writes, only problems are worth printing
+    logger.configure("WARNING")
+    yield
+    logger.configure("TRACE")
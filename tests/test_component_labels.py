@@ -0,0 +1,86 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.config import Config
+from src.simulation.grid.component_labels import ComponentLabels
+from src.simulation.grid.location import Location
+from src.simulation.simulation import Simulation
+
+
+def flood_fill(walkable: np.ndarray) -> np.ndarray:
+    """8-connected labels numbered in the order of their first cell, row by row, one cell at a time."""
+    height, width = walkable.shape
+    labels = np.zeros(walkable.shape, dtype=np.int32)
+    label = 0
+    for start_y in range(height):
+        for start_x in range(width):
+            if not walkable[start_y, start_x] or labels[start_y, start_x]:
+                continue
+            label += 1
+            labels[start_y, start_x] = label
+            stack = [(start_y, start_x)]
+            while stack:
+                y, x = stack.pop()
+                for ny in range(max(y - 1, 0), min(y + 2, height)):
+                    for nx in range(max(x - 1, 0), min(x + 2, width)):
+                        if walkable[ny, nx] and not labels[ny, nx]:
+                            labels[ny, nx] = label
+                            stack.append((ny, nx))
+    return labels
+
+
+def assert_same_components(labels: np.ndarray, expected: np.ndarray) -> None:
+    """The same cells are walkable and the labels pair up one to one, whatever the numbers are."""
+    assert np.array_equal(labels > 0, expected > 0)
+    walkable = expected > 0
+    pairs = set(zip(labels[walkable].tolist(), expected[walkable].tolist()))
+    assert len(pairs) == len(np.unique(labels[walkable])) == len(np.unique(expected[walkable]))
+
+
+@pytest.mark.parametrize("density", [0.3, 0.45, 0.55, 0.7])
+def test_labels_match_a_flood_fill(density):
+    walkable = np.random.default_rng(0).random((40, 50)) < density
+    assert np.array_equal(ComponentLabels(walkable)._labels, flood_fill(walkable))
+
+
+def test_labels_follow_a_winding_path():
+    walkable = np.zeros((21, 21), dtype=bool)
+    walkable[::2, :] = True
+    for row, y in enumerate(range(1, 21, 2)):
+        walkable[y, 20 if row % 2 == 0 else 0] = True
+    assert ComponentLabels(walkable)._labels.max() == 1
+
+
+@pytest.mark.parametrize("density", [0.4, 0.55, 0.7])
+def test_set_walkable_matches_a_fresh_labelling(density):
+    rng = np.random.default_rng(1)
+    walkable = rng.random((30, 35)) < density
+    labels = ComponentLabels(walkable)
+    for flip in range(3000):
+        y, x = int(rng.integers(30)), int(rng.integers(35))
+        walkable[y, x] = not walkable[y, x]
+        labels.set_walkable(x, y, bool(walkable[y, x]))
+        if flip % 100 == 0:
+            # fill the cells cache so the next flips have to drop stale entries
+            for label in np.unique(labels._labels[labels._labels > 0]).tolist():
+                labels.get_cells(label)
+        if flip % 50 == 0:
+            assert_same_components(labels._labels, flood_fill(walkable))
+            for label, cells in labels._cells.items():
+                assert np.array_equal(cells, np.flatnonzero(labels._labels == label))
+    assert_same_components(labels._labels, flood_fill(walkable))
+
+
+def test_grid_keeps_its_labels_up_to_date():
+    random.seed(5)
+    np.random.seed(5)
+    grid = Simulation(Config(grid_size=60)).get_grid()
+    grid.can_reach(Location(1, 1), Location(2, 2))
+
+    for _ in range(2000):
+        grid.set_char(Location(random.randrange(60), random.randrange(60)), random.choice(["*", " ", "h", "b"]))
+
+    walkable = grid._ratings[grid.get_cells()] > 0
+    assert_same_components(grid._component_labels._labels, flood_fill(walkable))
@@ -0,0 +1,57 @@
+import random
+
+import numpy as np
+
+from src.config import Config
+from src.simulation.grid.cell_codec import CellCodec
+from src.simulation.grid.location import Location
+from src.simulation.grid.summed_area_table import SummedAreaTable
+from src.simulation.simulation import Simulation
+
+
+def assert_same_table(table: SummedAreaTable, mask: np.ndarray) -> None:
+    fresh = SummedAreaTable(mask)
+    assert np.array_equal(table._mask, fresh._mask)
+    assert np.array_equal(table._table, fresh._table)
+
+
+def test_set_matches_a_fresh_table():
+    rng = np.random.default_rng(0)
+    mask = rng.random((37, 53)) < 0.4
+    table = SummedAreaTable(mask)
+    for _ in range(2000):
+        y, x = int(rng.integers(37)), int(rng.integers(53))
+        mask[y, x] = rng.random() < 0.5
+        table.set(x, y, bool(mask[y, x]))
+    assert_same_table(table, mask)
+
+
+def test_set_region_matches_a_fresh_table():
+    rng = np.random.default_rng(1)
+    mask = rng.random((30, 40)) < 0.4
+    table = SummedAreaTable(mask)
+    for _ in range(200):
+        height, width = int(rng.integers(1, 6)), int(rng.integers(1, 6))
+        y, x = int(rng.integers(30 - height + 1)), int(rng.integers(40 - width + 1))
+        values = rng.random((height, width)) < 0.5
+        mask[y : y + height, x : x + width] = values
+        table.set_region(x, y, values)
+    assert_same_table(table, mask)
+
+
+def test_grid_keeps_its_tables_up_to_date():
+    random.seed(3)
+    np.random.seed(3)
+    grid = Simulation(Config(grid_size=60)).get_grid()
+    grid.is_area_free(Location(1, 1), 3, 3)
+    grid.count_in_area(Location(0, 0), 4, 4, CellCodec.TREE)
+
+    for _ in range(2000):
+        grid.set_char(Location(random.randrange(60), random.randrange(60)), random.choice(["*", " ", "h", "b"]))
+        location = Location(random.randrange(60), random.randrange(60))
+        width, height = random.randint(1, 5), random.randint(1, 5)
+        trees = int((grid.get_region(location, width, height) == CellCodec.TREE).sum())
+        assert grid.count_in_area(location, width, height, CellCodec.TREE) == trees
+
+    for codes, table in grid._area_tables.items():
+        assert_same_table(table, grid.get_mask(*codes))